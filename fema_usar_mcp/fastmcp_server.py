@@ -1,7 +1,10 @@
 """FastMCP server implementation for FEMA USAR tools."""
 
+import json
 import logging
 import sys
+import time
+import uuid
 
 from fastmcp import FastMCP
 
@@ -10,6 +13,7 @@ from .core import (
     OperationalStatus,
     USARTaskForceConfig,
     calculate_deployment_readiness,
+    get_functional_group_positions,
     get_system_status,
 )
 from .performance import (
@@ -148,7 +152,6 @@ def get_system_performance() -> str:
     """
     try:
         stats = get_performance_stats()
-        import json
 
         return json.dumps(
             {
@@ -164,8 +167,6 @@ def get_system_performance() -> str:
             indent=2,
         )
     except Exception as e:
-        import json
-
         return json.dumps(
             {"tool": "System Performance Monitor", "status": "error", "error": str(e)},
             indent=2,
@@ -184,7 +185,6 @@ def clear_system_cache(pattern: str = "") -> str:
     """
     try:
         cleared_count = clear_cache(pattern if pattern else None)
-        import json
 
         return json.dumps(
             {
@@ -197,8 +197,6 @@ def clear_system_cache(pattern: str = "") -> str:
             indent=2,
         )
     except Exception as e:
-        import json
-
         return json.dumps(
             {"tool": "Cache Manager", "status": "error", "error": str(e)}, indent=2
         )
@@ -216,16 +214,11 @@ def submit_async_operation(operation: str, parameters: str = "{}") -> str:
         JSON string with async task submission details
     """
     try:
-        import json
-        import uuid
-
         task_id = f"async_{operation}_{uuid.uuid4().hex[:8]}"
         params = json.loads(parameters) if parameters != "{}" else {}
 
         # Placeholder for async operation execution
         def dummy_operation():
-            import time
-
             time.sleep(1)  # Simulate work
             return {"operation": operation, "parameters": params, "result": "completed"}
 
@@ -242,8 +235,6 @@ def submit_async_operation(operation: str, parameters: str = "{}") -> str:
             indent=2,
         )
     except Exception as e:
-        import json
-
         return json.dumps(
             {"tool": "Async Task Manager", "status": "error", "error": str(e)}, indent=2
         )
@@ -260,8 +251,6 @@ def get_async_task_info(task_id: str) -> str:
         JSON string with task status and result if available
     """
     try:
-        import json
-
         status = get_async_task_status(task_id)
         if status is None:
             return json.dumps(
@@ -289,8 +278,6 @@ def get_async_task_info(task_id: str) -> str:
 
         return json.dumps(result_data, indent=2)
     except Exception as e:
-        import json
-
         return json.dumps(
             {"tool": "Async Task Manager", "status": "error", "error": str(e)}, indent=2
         )
@@ -413,8 +400,6 @@ def list_functional_groups() -> str:
         Formatted list of functional groups and positions
     """
     try:
-        from .core import get_functional_group_positions
-
         groups = get_functional_group_positions()
 
         result = "# FEMA USAR Functional Groups and Positions\n\n"
@@ -17,7 +17,8 @@ import psutil
 import uvicorn
 from fastapi import BackgroundTasks, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST
 from pydantic import BaseModel
 
 from ..monitoring.metrics import MonitoringManager
@@ -266,6 +267,16 @@ class MobileServer:
             metrics = await self._collect_mobile_metrics()
             return metrics
 
+        @self.app.get("/mobile/metrics/prometheus")
+        async def get_prometheus_metrics():
+            """Get Prometheus metrics in text exposition format."""
+            if not self.monitoring:
+                raise HTTPException(status_code=503, detail="Monitoring not available")
+            # Cached exposition bytes are sent as-is, without a str round trip
+            return Response(
+                content=self.monitoring.get_metrics(), media_type=CONTENT_TYPE_LATEST
+            )
+
     async def initialize(self):
         """Initialize mobile server components."""
         try:
@@ -324,8 +335,7 @@ class MobileServer:
                 await self.offline_cache.shutdown()
 
             if self.monitoring:
-                # Note: monitoring manager doesn't have shutdown method in our implementation
-                pass
+                await self.monitoring.stop()
 
             logger.info("Mobile server shutdown complete")
 
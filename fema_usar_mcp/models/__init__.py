@@ -6,39 +6,58 @@ This package contains Pydantic models for FEMA USAR domain entities:
 - Operations models (missions, timelines, safety)
 """
 
+from .common import GPS, parse_dt, timestamp_batch
 from .equipment import (
     DeploymentStatus,
     EquipmentCategory,
     EquipmentModel,
     MaintenanceRecord,
+    MaintenanceStore,
+    maintenance_store,
 )
 from .operations import (
     MissionAssignment,
     OperationalTimeline,
     ResourceUtilization,
     SafetyIncident,
+    TimelineEvent,
 )
 from .personnel import (
+    EmergencyContact,
+    LocationStore,
     PersonnelLocation,
     PersonnelModel,
     PersonnelQualification,
     PositionAssignment,
+    serialize_roster,
+    validate_roster_json,
 )
 
 __all__ = [
+    # Shared types
+    "GPS",
+    "parse_dt",
+    "timestamp_batch",
     # Personnel models
     "PersonnelModel",
     "PersonnelQualification",
     "PersonnelLocation",
+    "LocationStore",
     "PositionAssignment",
+    "EmergencyContact",
+    "serialize_roster",
+    "validate_roster_json",
     # Equipment models
     "EquipmentModel",
     "EquipmentCategory",
     "MaintenanceRecord",
+    "MaintenanceStore",
+    "maintenance_store",
     "DeploymentStatus",
     # Operations models
     "MissionAssignment",
     "OperationalTimeline",
+    "TimelineEvent",
     "SafetyIncident",
     "ResourceUtilization",
 ]
@@ -0,0 +1,132 @@
+"""Shared field types and helpers for FEMA USAR models."""
+
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Annotated, Any, NamedTuple, TypeVar
+
+import orjson
+from pydantic import AfterValidator, BaseModel, TypeAdapter
+
+T = TypeVar("T")
+
+# String field whose value repeats across many records (task force, agency).
+# Interning lets every record share one string object.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+# Built once and reused for every datetime parsed during bulk ingest
+_DT_ADAPTER = TypeAdapter(datetime)
+
+
+class GPS(NamedTuple):
+    """GPS coordinate pair in decimal degrees."""
+
+    lat: float
+    lon: float
+
+
+# Timestamp shared by every record created inside a timestamp_batch()
+_BATCH_NOW_MS: ContextVar[int | None] = ContextVar("batch_now_ms", default=None)
+
+
+def now_ms() -> int:
+    """Current wall-clock time as integer Unix milliseconds.
+
+    Inside timestamp_batch() the batch's single clock read is returned.
+    """
+    batch_now = _BATCH_NOW_MS.get()
+    if batch_now is not None:
+        return batch_now
+    return int(time.time() * 1000)
+
+
+@contextmanager
+def timestamp_batch() -> Iterator[int]:
+    """Stamp all records created in this block with one shared timestamp.
+
+    Intended for bulk ingest, where millisecond precision per record is
+    not needed. Nested batches keep the outer timestamp.
+    """
+    batch_now = now_ms()
+    token = _BATCH_NOW_MS.set(batch_now)
+    try:
+        yield batch_now
+    finally:
+        _BATCH_NOW_MS.reset(token)
+
+
+def created_updated_pair() -> tuple[int, int]:
+    """(created, updated) Unix ms pair sharing a single clock read."""
+    now = now_ms()
+    return (now, now)
+
+
+def ms_to_datetime(timestamp_ms: int) -> datetime:
+    """Convert integer Unix milliseconds to a local datetime."""
+    return datetime.fromtimestamp(timestamp_ms / 1000)
+
+
+def parse_dt(value: str | int | float | datetime) -> datetime:
+    """Parse an ISO 8601 string or Unix timestamp using pydantic's datetime rules."""
+    return _DT_ADAPTER.validate_python(value)
+
+
+def _to_ms(value: str | int | float | datetime) -> int:
+    """Convert an ISO 8601 string, Unix timestamp or datetime to Unix ms."""
+    return int(parse_dt(value).timestamp() * 1000)
+
+
+def timestamps_from_legacy(data: Any) -> Any:
+    """Map legacy created_date/last_updated input onto a timestamps pair.
+
+    Rows stored before timestamps existed carry the two datetimes as
+    separate keys. A missing half takes the other half's value, and an
+    explicit timestamps pair wins over both.
+    """
+    if not isinstance(data, dict) or (
+        "created_date" not in data and "last_updated" not in data
+    ):
+        return data
+    data = dict(data)
+    created = data.pop("created_date", None)
+    updated = data.pop("last_updated", None)
+    if "timestamps" not in data and (created is not None or updated is not None):
+        created_ms = _to_ms(created if created is not None else updated)
+        updated_ms = _to_ms(updated) if updated is not None else created_ms
+        data["timestamps"] = (created_ms, updated_ms)
+    return data
+
+
+def construct_dataclass(cls: type[T], data: dict[str, Any]) -> T:
+    """Build a pydantic dataclass instance from trusted data without validation.
+
+    Dataclass counterpart of BaseModel.model_construct: defaults are filled
+    in for missing optional fields and no values are checked or coerced.
+    """
+    instance = object.__new__(cls)
+    for name, field_info in cls.__pydantic_fields__.items():  # type: ignore[attr-defined]
+        if name in data:
+            value = data[name]
+        elif field_info.is_required():
+            continue
+        else:
+            value = field_info.get_default(call_default_factory=True)
+        # object.__setattr__ also works on frozen dataclasses
+        object.__setattr__(instance, name, value)
+    return instance
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values orjson does not handle natively."""
+    if isinstance(value, tuple):
+        # NamedTuple fields such as GPS
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def model_to_json_bytes(model: BaseModel) -> bytes:
+    """Serialize a flat model's fields to JSON bytes with orjson."""
+    return orjson.dumps(model.__dict__, default=_json_default)
@@ -2,8 +2,26 @@
 
 from datetime import datetime
 from enum import Enum
+from typing import Any, Self
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ModelWrapValidatorHandler,
+    field_validator,
+    model_validator,
+)
+from pydantic.dataclasses import dataclass
+
+from .common import (
+    InternedStr,
+    created_updated_pair,
+    model_to_json_bytes,
+    ms_to_datetime,
+    now_ms,
+    timestamps_from_legacy,
+)
 
 
 class EquipmentStatus(str, Enum):
@@ -40,7 +58,8 @@ class DeploymentStatus(str, Enum):
     RETURNED = "returned"
 
 
-class MaintenanceRecord(BaseModel):
+@dataclass(slots=True, config=ConfigDict(defer_build=True))
+class MaintenanceRecord:
     """Equipment maintenance record."""
 
     maintenance_id: str = Field(..., description="Maintenance record identifier")
@@ -58,16 +77,59 @@ class MaintenanceRecord(BaseModel):
     parts_used: list[str] | None = Field(
         default_factory=list, description="Parts used in maintenance"
     )
-    cost: float | None = Field(None, description="Cost of maintenance")
+    cost: float | None = Field(default=None, description="Cost of maintenance")
     next_maintenance_due: datetime | None = Field(
-        None, description="Next scheduled maintenance"
+        default=None, description="Next scheduled maintenance"
     )
-    notes: str | None = Field(None, description="Additional notes")
+    notes: str | None = Field(default=None, description="Additional notes")
+
+
+class MaintenanceStore:
+    """Maintenance history indexed by equipment identifier.
+
+    Records live outside EquipmentModel so that loading or serializing
+    equipment rows does not scale with the length of their history.
+    """
+
+    def __init__(self) -> None:
+        # equipment_id -> {maintenance_id: record}, in insertion order
+        self._records: dict[str, dict[str, MaintenanceRecord]] = {}
+
+    def add(self, record: MaintenanceRecord) -> None:
+        """Append a maintenance record to its equipment's history.
+
+        A record whose maintenance_id is already stored for the item is
+        ignored, so loading the same row twice does not duplicate history.
+        """
+        self._records.setdefault(record.equipment_id, {}).setdefault(
+            record.maintenance_id, record
+        )
+
+    def get(self, equipment_id: str) -> tuple[MaintenanceRecord, ...]:
+        """Get maintenance history for an equipment item."""
+        return tuple(self._records.get(equipment_id, {}).values())
+
+    def remove(self, equipment_id: str) -> None:
+        """Drop all maintenance history for an equipment item."""
+        self._records.pop(equipment_id, None)
+
+    def clear(self) -> None:
+        """Drop all maintenance history."""
+        self._records.clear()
+
+
+# Global maintenance store
+maintenance_store = MaintenanceStore()
+
+# Canonical tag tuples shared across equipment records
+_TAG_CACHE: dict[tuple[str, ...], tuple[str, ...]] = {}
 
 
 class EquipmentModel(BaseModel):
     """Complete equipment model for USAR operations."""
 
+    model_config = ConfigDict(defer_build=True)
+
     equipment_id: str = Field(..., description="Unique equipment identifier")
     equipment_name: str = Field(..., description="Equipment name/description")
     category: EquipmentCategory = Field(..., description="Equipment category")
@@ -83,7 +145,7 @@ class EquipmentModel(BaseModel):
     # Status and condition
     status: EquipmentStatus = EquipmentStatus.OPERATIONAL
     deployment_status: DeploymentStatus = DeploymentStatus.AVAILABLE
-    condition: str = Field("excellent", description="Physical condition")
+    condition: InternedStr = Field("excellent", description="Physical condition")
     deployment_ready: bool = Field(True, description="Ready for deployment")
 
     # Location and assignment
@@ -91,8 +153,7 @@ class EquipmentModel(BaseModel):
     assigned_to: str | None = Field(None, description="Person/team assigned to")
     home_cache: str = Field(..., description="Home cache/storage location")
 
-    # Maintenance
-    maintenance_records: list[MaintenanceRecord] = Field(default_factory=list)
+    # Maintenance (history is held in maintenance_store, see below)
     last_inspection: datetime | None = Field(None, description="Last inspection date")
     next_maintenance: datetime | None = Field(
         None, description="Next scheduled maintenance"
@@ -128,7 +189,71 @@ class EquipmentModel(BaseModel):
     )
 
     # Additional metadata
-    created_date: datetime = Field(default_factory=datetime.now)
-    last_updated: datetime = Field(default_factory=datetime.now)
+    timestamps: tuple[int, int] = Field(
+        default_factory=created_updated_pair,
+        description="(created, last updated) time in Unix ms",
+    )
     notes: str | None = Field(None, description="Additional notes")
-    tags: list[str] = Field(default_factory=list, description="Equipment tags/keywords")
+    tags: tuple[str, ...] = Field(
+        default_factory=tuple, description="Equipment tags/keywords"
+    )
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _load_maintenance_records(
+        cls, data: Any, handler: ModelWrapValidatorHandler[Self]
+    ) -> Self:
+        """Move maintenance history passed in or stored on a row to the store.
+
+        The store is only written once the row and all of its records have
+        validated, so a rejected row leaves no history behind.
+        """
+        if not isinstance(data, dict) or "maintenance_records" not in data:
+            return handler(data)
+        data = dict(data)
+        raw_records = data.pop("maintenance_records") or ()
+        equipment = handler(data)
+        records = [
+            record
+            if isinstance(record, MaintenanceRecord)
+            else MaintenanceRecord(**{"equipment_id": equipment.equipment_id, **record})
+            for record in raw_records
+        ]
+        for record in records:
+            maintenance_store.add(record)
+        return equipment
+
+    @model_validator(mode="before")
+    @classmethod
+    def _legacy_timestamps(cls, data: Any) -> Any:
+        """Accept created_date/last_updated from rows stored before timestamps."""
+        return timestamps_from_legacy(data)
+
+    @field_validator("tags", mode="after")
+    @classmethod
+    def _share_tags(cls, tags: tuple[str, ...]) -> tuple[str, ...]:
+        """Share one tuple instance per distinct tag set."""
+        return _TAG_CACHE.setdefault(tags, tags)
+
+    @property
+    def maintenance_records(self) -> tuple[MaintenanceRecord, ...]:
+        """Maintenance history for this item from the maintenance store."""
+        return maintenance_store.get(self.equipment_id)
+
+    @property
+    def created_date(self) -> datetime:
+        """Creation time as a datetime."""
+        return ms_to_datetime(self.timestamps[0])
+
+    @property
+    def last_updated(self) -> datetime:
+        """Last update time as a datetime."""
+        return ms_to_datetime(self.timestamps[1])
+
+    def touch(self) -> None:
+        """Set the last updated time to now."""
+        self.timestamps = (self.timestamps[0], now_ms())
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes via orjson for dashboard/report payloads."""
+        return model_to_json_bytes(self)
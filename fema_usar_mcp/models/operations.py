@@ -4,7 +4,16 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
+
+from .common import (
+    GPS,
+    InternedStr,
+    model_to_json_bytes,
+    ms_to_datetime,
+    now_ms,
+)
 
 
 class MissionStatus(str, Enum):
@@ -43,6 +52,8 @@ class SafetyIncidentType(str, Enum):
 class MissionAssignment(BaseModel):
     """USAR mission assignment model."""
 
+    model_config = ConfigDict(defer_build=True)
+
     mission_id: str = Field(..., description="Unique mission identifier")
     mission_name: str = Field(..., description="Mission name/title")
     mission_type: str = Field(..., description="Type of mission")
@@ -51,14 +62,14 @@ class MissionAssignment(BaseModel):
     requesting_agency: str = Field(..., description="Agency requesting assistance")
     incident_number: str | None = Field(None, description="Incident number")
     location: str = Field(..., description="Mission location")
-    gps_coordinates: dict[str, float] | None = Field(
-        None, description="GPS coordinates"
-    )
+    gps_coordinates: GPS | None = Field(None, description="GPS coordinates")
 
     # Priority and timing
     priority: MissionPriority = MissionPriority.MEDIUM
     status: MissionStatus = MissionStatus.ASSIGNED
-    assigned_date: datetime = Field(default_factory=datetime.now)
+    assigned_date: int = Field(
+        default_factory=now_ms, description="Assignment time (Unix ms)"
+    )
     required_start_time: datetime | None = Field(
         None, description="Required start time"
     )
@@ -71,11 +82,11 @@ class MissionAssignment(BaseModel):
     )
 
     # Resources
-    assigned_personnel: list[str] = Field(
-        default_factory=list, description="Assigned personnel IDs"
+    assigned_personnel: tuple[str, ...] = Field(
+        default_factory=tuple, description="Assigned personnel IDs"
     )
-    assigned_equipment: list[str] = Field(
-        default_factory=list, description="Assigned equipment IDs"
+    assigned_equipment: tuple[str, ...] = Field(
+        default_factory=tuple, description="Assigned equipment IDs"
     )
     required_resources: dict[str, Any] = Field(
         default_factory=dict, description="Required resources"
@@ -116,29 +127,57 @@ class MissionAssignment(BaseModel):
         default_factory=list, description="After action items"
     )
 
+    @property
+    def assigned_date_dt(self) -> datetime:
+        """Assignment time as a datetime."""
+        return ms_to_datetime(self.assigned_date)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes via orjson for dashboard/report payloads."""
+        return model_to_json_bytes(self)
+
+
+@dataclass(slots=True, config=ConfigDict(defer_build=True))
+class TimelineEvent:
+    """Operational timeline event."""
+
+    kind: str = Field(..., description="Event kind (milestone, critical, etc.)")
+    actor: str = Field(..., description="Person or unit that recorded the event")
+    ts: int = Field(default_factory=now_ms, description="Event time (Unix ms)")
+    payload: dict[str, str] = Field(default_factory=dict, description="Event details")
+
+    @property
+    def ts_dt(self) -> datetime:
+        """Event time as a datetime."""
+        return ms_to_datetime(self.ts)
+
 
 class OperationalTimeline(BaseModel):
     """Operational timeline tracking model."""
 
+    model_config = ConfigDict(defer_build=True)
+
     timeline_id: str = Field(..., description="Timeline identifier")
     operation_name: str = Field(..., description="Operation name")
     start_time: datetime = Field(..., description="Operation start time")
     end_time: datetime | None = Field(None, description="Operation end time")
 
     # Timeline events
-    events: list[dict[str, Any]] = Field(
+    events: list[TimelineEvent] = Field(
         default_factory=list, description="Timeline events"
     )
-    milestones: list[dict[str, Any]] = Field(
+    milestones: list[TimelineEvent] = Field(
         default_factory=list, description="Key milestones"
     )
-    critical_events: list[dict[str, Any]] = Field(
+    critical_events: list[TimelineEvent] = Field(
         default_factory=list, description="Critical events"
     )
 
     # Status
-    current_phase: str = Field(..., description="Current operational phase")
-    overall_status: str = Field("active", description="Overall operation status")
+    current_phase: InternedStr = Field(..., description="Current operational phase")
+    overall_status: InternedStr = Field(
+        "active", description="Overall operation status"
+    )
     completion_percent: float = Field(
         0.0, ge=0, le=100, description="Overall completion percentage"
     )
@@ -147,6 +186,8 @@ class OperationalTimeline(BaseModel):
 class SafetyIncident(BaseModel):
     """Safety incident model."""
 
+    model_config = ConfigDict(defer_build=True)
+
     incident_id: str = Field(..., description="Incident identifier")
     incident_type: SafetyIncidentType = Field(..., description="Type of incident")
     severity: str = Field(
@@ -184,7 +225,9 @@ class SafetyIncident(BaseModel):
     investigation_required: bool = Field(
         False, description="Whether investigation is required"
     )
-    investigation_status: str | None = Field(None, description="Investigation status")
+    investigation_status: InternedStr | None = Field(
+        None, description="Investigation status"
+    )
 
     # Prevention and lessons learned
     contributing_factors: list[str] = Field(
@@ -206,6 +249,8 @@ class SafetyIncident(BaseModel):
 class ResourceUtilization(BaseModel):
     """Resource utilization tracking model."""
 
+    model_config = ConfigDict(defer_build=True)
+
     utilization_id: str = Field(..., description="Utilization record identifier")
     resource_id: str = Field(..., description="Resource identifier")
     resource_type: str = Field(
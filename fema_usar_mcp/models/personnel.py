@@ -1,22 +1,72 @@
 """Personnel models for FEMA USAR operations."""
 
+from collections.abc import Iterable
 from datetime import datetime
-from enum import Enum
+from typing import Annotated, Any, Final, Literal, Self, cast
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    computed_field,
+    model_validator,
+)
+from pydantic.dataclasses import dataclass
 
+from .common import (
+    GPS,
+    InternedStr,
+    construct_dataclass,
+    created_updated_pair,
+    ms_to_datetime,
+    now_ms,
+    timestamps_from_legacy,
+)
 
-class PersonnelStatus(str, Enum):
-    """Personnel operational status."""
+# NumPy is part of the "advanced" extra and only needed by LocationStore
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
 
-    OPERATIONAL = "operational"
-    REST_REHABILITATION = "rest_rehabilitation"
-    MEDICAL_EVALUATION = "medical_evaluation"
-    TRANSPORTATION = "transportation"
-    UNAVAILABLE = "unavailable"
+# Numba (performance extra) compiles the geofence kernel; without it the
+# same haversine runs as vectorized NumPy
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None  # type: ignore[assignment]
 
+EARTH_RADIUS_M = 6_371_000.0
 
-class PersonnelQualification(BaseModel):
+PersonnelStatusT = Literal[
+    "operational",
+    "rest_rehabilitation",
+    "medical_evaluation",
+    "transportation",
+    "unavailable",
+]
+
+FitnessLevelT = Literal["excellent", "good", "fair", "poor"]
+
+
+class PersonnelStatus:
+    """Personnel operational status values."""
+
+    OPERATIONAL: Final = "operational"
+    REST_REHABILITATION: Final = "rest_rehabilitation"
+    MEDICAL_EVALUATION: Final = "medical_evaluation"
+    TRANSPORTATION: Final = "transportation"
+    UNAVAILABLE: Final = "unavailable"
+
+
+# Shared config for the slotted personnel records. Unknown keys from roster
+# rows are dropped and attribute writes are never re-validated.
+_RECORD_CONFIG = ConfigDict(defer_build=True, extra="ignore", validate_assignment=False)
+
+
+@dataclass(slots=True, frozen=True, config=_RECORD_CONFIG)
+class PersonnelQualification:
     """Personnel qualification model."""
 
     qualification_id: str = Field(..., description="Qualification identifier")
@@ -24,74 +74,241 @@ class PersonnelQualification(BaseModel):
     certification_date: datetime = Field(
         ..., description="Date qualification was earned"
     )
-    expiration_date: datetime | None = Field(
-        None, description="Qualification expiration date"
-    )
     certifying_agency: str = Field(
         ..., description="Agency that provided certification"
     )
-    is_current: bool = Field(True, description="Whether qualification is current")
+    expiration_date: datetime | None = Field(
+        default=None, description="Qualification expiration date"
+    )
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def is_current(self) -> bool:
+        """Whether the qualification has not yet expired."""
+        expires = self.expiration_date
+        return expires is None or expires > datetime.now(expires.tzinfo)
 
-class PersonnelLocation(BaseModel):
+    @classmethod
+    def from_trusted_row(cls, **data: Any) -> Self:
+        """Build from a trusted row without validation."""
+        return construct_dataclass(cls, data)
+
+
+@dataclass(slots=True, frozen=True, config=_RECORD_CONFIG)
+class PersonnelLocation:
     """Personnel location tracking model."""
 
     person_id: str = Field(..., description="Personnel identifier")
     location_name: str = Field(..., description="Human-readable location")
-    gps_coordinates: dict[str, float] | None = Field(
-        None, description="GPS coordinates"
-    )
     location_type: str = Field(
         ..., description="Type of location (command_post, operations_area, etc.)"
     )
-    timestamp: datetime = Field(
-        default_factory=datetime.now, description="Location timestamp"
+    gps_coordinates: GPS | None = Field(default=None, description="GPS coordinates")
+    timestamp: int = Field(
+        default_factory=now_ms, description="Location timestamp (Unix ms)"
+    )
+    accuracy_meters: float | None = Field(
+        default=None, description="GPS accuracy in meters"
     )
-    accuracy_meters: float | None = Field(None, description="GPS accuracy in meters")
 
+    @property
+    def timestamp_dt(self) -> datetime:
+        """Location timestamp as a datetime."""
+        return ms_to_datetime(self.timestamp)
+
+    @classmethod
+    def from_trusted_row(cls, **data: Any) -> Self:
+        """Build from a trusted row without validation."""
+        return construct_dataclass(cls, data)
+
+
+def _within_numpy(
+    lat: "np.ndarray", lon: "np.ndarray", lat0: float, lon0: float, r_m: float
+) -> "np.ndarray":
+    """Mask of points within r_m metres of (lat0, lon0); inputs in degrees."""
+    phi = np.radians(lat)
+    phi0 = np.radians(lat0)
+    dphi = phi - phi0
+    dlam = np.radians(lon - lon0)
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi) * np.cos(phi0) * np.sin(dlam / 2) ** 2
+    # NumPy ufuncs on operator results are typed as Any
+    return cast("np.ndarray", 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a)) <= r_m)
+
+
+if njit is not None:
+
+    @njit(cache=True, parallel=True)
+    def _within(
+        lat: "np.ndarray", lon: "np.ndarray", lat0: float, lon0: float, r_m: float
+    ) -> "np.ndarray":
+        n = lat.shape[0]
+        out = np.empty(n, dtype=np.bool_)
+        phi0 = np.radians(lat0)
+        cos_phi0 = np.cos(phi0)
+        for i in prange(n):
+            phi = np.radians(lat[i])
+            dphi = phi - phi0
+            dlam = np.radians(lon[i] - lon0)
+            a = np.sin(dphi / 2) ** 2 + np.cos(phi) * cos_phi0 * np.sin(dlam / 2) ** 2
+            out[i] = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a)) <= r_m
+        return out
+
+else:
+    _within = _within_numpy
+
+
+class LocationStore:
+    """Latest GPS fix per person, held as a contiguous (N, 2) float64 array.
+
+    Column 0 is latitude and column 1 longitude; row i belongs to ids[i].
+    Analytics over many positions should read coords instead of walking
+    PersonnelLocation objects.
+    """
+
+    def __init__(self, capacity: int = 128) -> None:
+        if np is None:
+            raise ImportError(
+                "LocationStore requires numpy (install the advanced extra)"
+            )
+        # At least one row, so doubling on growth always makes room
+        self._coords = np.empty((max(capacity, 1), 2), dtype=np.float64)
+        self._ids: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def coords(self) -> "np.ndarray":
+        """View of the (N, 2) latitude/longitude array."""
+        return self._coords[: len(self._ids)]
+
+    @property
+    def ids(self) -> list[str]:
+        """Person identifiers, aligned with coords rows."""
+        return self._ids
+
+    def update(self, location: PersonnelLocation) -> None:
+        """Record a person's latest GPS fix; locations without GPS are skipped."""
+        if location.gps_coordinates is None:
+            return
+        row = self._index.get(location.person_id)
+        if row is None:
+            row = len(self._ids)
+            if row == len(self._coords):
+                self._coords = np.resize(self._coords, (2 * row, 2))
+            self._ids.append(location.person_id)
+            self._index[location.person_id] = row
+        self._coords[row] = location.gps_coordinates
+
+    def update_many(self, locations: Iterable[PersonnelLocation]) -> None:
+        """Record a batch of GPS fixes."""
+        for location in locations:
+            self.update(location)
 
-class PositionAssignment(BaseModel):
+    def get(self, person_id: str) -> GPS | None:
+        """Get a person's latest GPS fix."""
+        row = self._index.get(person_id)
+        if row is None:
+            return None
+        lat, lon = self._coords[row]
+        return GPS(float(lat), float(lon))
+
+    def within_mask(self, center: GPS, radius_m: float) -> "np.ndarray":
+        """Boolean mask over coords rows lying within radius_m of center."""
+        coords = self.coords
+        # Column slices are strided views; the kernel wants contiguous arrays
+        lat = np.ascontiguousarray(coords[:, 0])
+        lon = np.ascontiguousarray(coords[:, 1])
+        return _within(lat, lon, float(center[0]), float(center[1]), float(radius_m))
+
+    def within(self, center: GPS, radius_m: float) -> list[str]:
+        """Person IDs whose latest fix is within radius_m metres of center."""
+        mask = self.within_mask(center, radius_m)
+        return [self._ids[i] for i in np.flatnonzero(mask)]
+
+
+@dataclass(slots=True, frozen=True, config=_RECORD_CONFIG)
+class EmergencyContact:
+    """Personnel emergency contact model."""
+
+    name: str = Field(..., description="Contact name")
+    relation: str = Field(..., description="Relationship to the team member")
+    phone: str = Field(..., description="Contact phone number")
+
+    @classmethod
+    def from_trusted_row(cls, **data: Any) -> Self:
+        """Build from a trusted row without validation."""
+        return construct_dataclass(cls, data)
+
+
+@dataclass(slots=True, frozen=True, config=_RECORD_CONFIG)
+class PositionAssignment:
     """Personnel position assignment model."""
 
     assignment_id: str = Field(..., description="Assignment identifier")
     person_id: str = Field(..., description="Personnel identifier")
-    position_name: str = Field(..., description="ICS position name")
-    functional_group: str = Field(
+    position_name: InternedStr = Field(..., description="ICS position name")
+    functional_group: InternedStr = Field(
         ..., description="Functional group (Command, Search, etc.)"
     )
     assignment_start: datetime = Field(..., description="Assignment start time")
-    assignment_end: datetime | None = Field(None, description="Assignment end time")
-    is_primary: bool = Field(True, description="Whether this is primary assignment")
-    supervisor_id: str | None = Field(None, description="Supervisor personnel ID")
+    assignment_end: datetime | None = Field(
+        default=None, description="Assignment end time"
+    )
+    is_primary: bool = Field(
+        default=True, description="Whether this is primary assignment"
+    )
+    supervisor_id: str | None = Field(
+        default=None, description="Supervisor personnel ID"
+    )
+
+    @classmethod
+    def from_trusted_row(cls, **data: Any) -> Self:
+        """Build from a trusted row without validation."""
+        return construct_dataclass(cls, data)
 
 
 class PersonnelModel(BaseModel):
-    """Complete personnel model."""
+    """Complete personnel model.
+
+    Use from_trusted_row() only for rows this system wrote itself (e.g.
+    roster loads from the database); untrusted input must go through
+    normal validation with the constructor or model_validate().
+    """
+
+    model_config = ConfigDict(
+        defer_build=True, extra="ignore", validate_assignment=False
+    )
 
     person_id: str = Field(..., description="Unique personnel identifier")
     name: str = Field(..., description="Personnel name")
-    task_force: str = Field(..., description="Task force assignment")
-    home_agency: str = Field(..., description="Home agency/department")
+    task_force: InternedStr = Field(..., description="Task force assignment")
+    home_agency: InternedStr = Field(..., description="Home agency/department")
 
     # Status and location
-    current_status: PersonnelStatus = PersonnelStatus.OPERATIONAL
+    current_status: PersonnelStatusT = PersonnelStatus.OPERATIONAL
     current_location: PersonnelLocation | None = None
     current_assignment: PositionAssignment | None = None
 
     # Qualifications
     qualifications: list[PersonnelQualification] = Field(default_factory=list)
-    primary_specialty: str = Field(..., description="Primary operational specialty")
+    primary_specialty: InternedStr = Field(
+        ..., description="Primary operational specialty"
+    )
 
     # Contact information
     radio_call_sign: str | None = Field(None, description="Radio call sign")
     cell_phone: str | None = Field(None, description="Cell phone number")
-    emergency_contact: dict[str, str] | None = Field(
+    emergency_contact: EmergencyContact | None = Field(
         None, description="Emergency contact info"
     )
 
     # Health and fitness
     medical_cleared: bool = Field(True, description="Medically cleared for operations")
-    fitness_level: str = Field("excellent", description="Physical fitness level")
+    fitness_level: FitnessLevelT = Field(
+        "excellent", description="Physical fitness level"
+    )
     last_medical_eval: datetime | None = Field(
         None, description="Last medical evaluation"
     )
@@ -99,9 +316,78 @@ class PersonnelModel(BaseModel):
     # Deployment tracking
     deployment_ready: bool = Field(True, description="Ready for deployment")
     last_deployment: datetime | None = Field(None, description="Last deployment date")
-    total_deployments: int = Field(0, description="Total number of deployments")
+    total_deployments: Annotated[int, Field(ge=0)] = Field(
+        0, description="Total number of deployments"
+    )
 
     # Additional metadata
-    created_date: datetime = Field(default_factory=datetime.now)
-    last_updated: datetime = Field(default_factory=datetime.now)
+    timestamps: tuple[int, int] = Field(
+        default_factory=created_updated_pair,
+        description="(created, last updated) time in Unix ms",
+    )
     notes: str | None = Field(None, description="Additional notes")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _legacy_timestamps(cls, data: Any) -> Any:
+        """Accept created_date/last_updated from rows stored before timestamps."""
+        return timestamps_from_legacy(data)
+
+    @property
+    def created_date(self) -> datetime:
+        """Creation time as a datetime."""
+        return ms_to_datetime(self.timestamps[0])
+
+    @property
+    def last_updated(self) -> datetime:
+        """Last update time as a datetime."""
+        return ms_to_datetime(self.timestamps[1])
+
+    @classmethod
+    def from_trusted_row(cls, **data: Any) -> Self:
+        """Build from a trusted row without validation, including nested records."""
+        data = timestamps_from_legacy(data)
+        location = data.get("current_location")
+        if isinstance(location, dict):
+            data["current_location"] = PersonnelLocation.from_trusted_row(**location)
+        assignment = data.get("current_assignment")
+        if isinstance(assignment, dict):
+            data["current_assignment"] = PositionAssignment.from_trusted_row(
+                **assignment
+            )
+        contact = data.get("emergency_contact")
+        if isinstance(contact, dict):
+            data["emergency_contact"] = EmergencyContact.from_trusted_row(**contact)
+        if "qualifications" in data:
+            data["qualifications"] = [
+                PersonnelQualification.from_trusted_row(**q)
+                if isinstance(q, dict)
+                else q
+                for q in data["qualifications"]
+            ]
+        return cls.model_construct(**data)
+
+    def touch(self) -> None:
+        """Set the last updated time to now."""
+        self.timestamps = (self.timestamps[0], now_ms())
+
+
+# Validates a whole roster in one pydantic-core pass; built on first use
+ROSTER_ADAPTER = TypeAdapter(list[PersonnelModel], config=ConfigDict(defer_build=True))
+
+
+def validate_roster_json(raw: bytes | str) -> list[PersonnelModel]:
+    """Validate a JSON array of personnel records.
+
+    Prefer this over json.loads() followed by PersonnelModel(**row) per row.
+    """
+    return ROSTER_ADAPTER.validate_json(raw)
+
+
+def serialize_roster(roster: list[PersonnelModel]) -> bytes:
+    """Serialize personnel records to a JSON array in a single pass.
+
+    Prefer this over json.dumps([p.model_dump() for p in roster]), which
+    builds an intermediate dict per record.
+    """
+    return ROSTER_ADAPTER.dump_json(roster)
@@ -0,0 +1,69 @@
+"""Plain slotted dataclass mirror of PersonnelModel for in-process logic.
+
+Scheduling and planning code that never crosses the MCP boundary can work
+on PersonnelModelDC, which skips validation entirely. Convert with
+from_pydantic()/as_pydantic() at the API boundary. Nested qualification,
+location, assignment and emergency contact records are the frozen records
+from ``personnel.py`` and are shared, not copied.
+"""
+
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from typing import Self
+
+from .common import created_updated_pair, now_ms
+from .personnel import (
+    EmergencyContact,
+    FitnessLevelT,
+    PersonnelLocation,
+    PersonnelModel,
+    PersonnelQualification,
+    PersonnelStatus,
+    PersonnelStatusT,
+    PositionAssignment,
+)
+
+
+@dataclass(slots=True)
+class PersonnelModelDC:
+    """Complete personnel record without validation."""
+
+    person_id: str
+    name: str
+    task_force: str
+    home_agency: str
+    primary_specialty: str
+    current_status: PersonnelStatusT = PersonnelStatus.OPERATIONAL
+    current_location: PersonnelLocation | None = None
+    current_assignment: PositionAssignment | None = None
+    qualifications: list[PersonnelQualification] = field(default_factory=list)
+    radio_call_sign: str | None = None
+    cell_phone: str | None = None
+    emergency_contact: EmergencyContact | None = None
+    medical_cleared: bool = True
+    fitness_level: FitnessLevelT = "excellent"
+    last_medical_eval: datetime | None = None
+    deployment_ready: bool = True
+    last_deployment: datetime | None = None
+    total_deployments: int = 0
+    timestamps: tuple[int, int] = field(default_factory=created_updated_pair)
+    notes: str | None = None
+
+    @classmethod
+    def from_pydantic(cls, model: PersonnelModel) -> Self:
+        """Copy field values from a pydantic personnel model."""
+        values = model.__dict__
+        return cls(**{name: values[name] for name in _FIELD_NAMES})
+
+    def as_pydantic(self) -> PersonnelModel:
+        """Build the pydantic personnel model without re-validating."""
+        return PersonnelModel.model_construct(
+            **{name: getattr(self, name) for name in _FIELD_NAMES}
+        )
+
+    def touch(self) -> None:
+        """Set the last updated time to now."""
+        self.timestamps = (self.timestamps[0], now_ms())
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(PersonnelModelDC))
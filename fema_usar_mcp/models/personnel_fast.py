@@ -0,0 +1,121 @@
+"""msgspec mirrors of the personnel models for the MCP wire path.
+
+These Structs carry the same fields as the pydantic models in
+``personnel.py`` but encode and decode JSON in C. Convert at the boundary
+with from_pydantic()/to_pydantic() where pydantic models are required.
+
+Requires msgspec (install the performance extra).
+"""
+
+from datetime import datetime
+from typing import Annotated, Any
+
+import msgspec
+
+from .common import GPS, created_updated_pair, now_ms
+from .personnel import (
+    FitnessLevelT,
+    PersonnelModel,
+    PersonnelStatus,
+    PersonnelStatusT,
+)
+
+
+class PersonnelQualificationMsg(msgspec.Struct, frozen=True, gc=False):
+    """Personnel qualification."""
+
+    qualification_id: str
+    qualification_name: str
+    certification_date: datetime
+    certifying_agency: str
+    expiration_date: datetime | None = None
+
+
+class PersonnelLocationMsg(msgspec.Struct, frozen=True, gc=False):
+    """Personnel location fix."""
+
+    person_id: str
+    location_name: str
+    location_type: str
+    gps_coordinates: GPS | None = None
+    timestamp: int = msgspec.field(default_factory=now_ms)
+    accuracy_meters: float | None = None
+
+
+class EmergencyContactMsg(msgspec.Struct, frozen=True, gc=False):
+    """Personnel emergency contact."""
+
+    name: str
+    relation: str
+    phone: str
+
+
+class PositionAssignmentMsg(msgspec.Struct, frozen=True, gc=False):
+    """Personnel position assignment."""
+
+    assignment_id: str
+    person_id: str
+    position_name: str
+    functional_group: str
+    assignment_start: datetime
+    assignment_end: datetime | None = None
+    is_primary: bool = True
+    supervisor_id: str | None = None
+
+
+class PersonnelModelMsg(msgspec.Struct):
+    """Complete personnel record."""
+
+    person_id: str
+    name: str
+    task_force: str
+    home_agency: str
+    primary_specialty: str
+    current_status: PersonnelStatusT = PersonnelStatus.OPERATIONAL
+    current_location: PersonnelLocationMsg | None = None
+    current_assignment: PositionAssignmentMsg | None = None
+    qualifications: list[PersonnelQualificationMsg] = msgspec.field(
+        default_factory=list
+    )
+    radio_call_sign: str | None = None
+    cell_phone: str | None = None
+    emergency_contact: EmergencyContactMsg | None = None
+    medical_cleared: bool = True
+    fitness_level: FitnessLevelT = "excellent"
+    last_medical_eval: datetime | None = None
+    deployment_ready: bool = True
+    last_deployment: datetime | None = None
+    total_deployments: Annotated[int, msgspec.Meta(ge=0)] = 0
+    timestamps: tuple[int, int] = msgspec.field(default_factory=created_updated_pair)
+    notes: str | None = None
+
+    @classmethod
+    def from_pydantic(cls, model: PersonnelModel) -> "PersonnelModelMsg":
+        """Convert a pydantic personnel model."""
+        return msgspec.convert(model, cls, from_attributes=True)
+
+    def to_pydantic(self) -> PersonnelModel:
+        """Convert to the pydantic personnel model."""
+        return PersonnelModel.model_validate(
+            msgspec.to_builtins(self, builtin_types=(datetime,))
+        )
+
+
+_encoder = msgspec.json.Encoder()
+_personnel_decoder = msgspec.json.Decoder(PersonnelModelMsg)
+_roster_decoder = msgspec.json.Decoder(list[PersonnelModelMsg])
+
+
+def encode(obj: Any) -> bytes:
+    """Encode personnel Structs (or lists of them) to JSON bytes."""
+    return _encoder.encode(obj)
+
+
+def decode_personnel(raw: bytes | str) -> PersonnelModelMsg:
+    """Decode and validate a single personnel record from JSON."""
+    return _personnel_decoder.decode(raw)
+
+
+def decode_roster(raw: bytes | str) -> list[PersonnelModelMsg]:
+    """Decode and validate a JSON array of personnel records."""
+    return _roster_decoder.decode(raw)
@@ -4,22 +4,30 @@ Provides comprehensive monitoring, metrics collection, alerting, and observabili
 for USAR operations and system health.
 """
 
-from .metrics import (
-    Alert,
-    AlertManager,
-    AlertSeverity,
-    HealthCheck,
-    HealthMonitor,
-    MetricsCollector,
-    MetricType,
-    MonitoringManager,
-    USARMetrics,
-    create_system_alert_rules,
-    create_usar_alert_rules,
-    database_health_check,
-    external_api_health_check,
-    redis_health_check,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .metrics import (
+        Alert,
+        AlertManager,
+        AlertSeverity,
+        HealthCheck,
+        HealthMonitor,
+        MetricsCollector,
+        MetricType,
+        MonitoringManager,
+        ThresholdLevel,
+        ThresholdRule,
+        ThresholdRuleTable,
+        USARMetrics,
+        create_system_alert_rules,
+        create_usar_alert_rules,
+        database_health_check,
+        external_api_health_check,
+        redis_health_check,
+        single_alert_channel,
+    )
 
 __all__ = [
     "AlertSeverity",
@@ -31,9 +39,32 @@ __all__ = [
     "HealthMonitor",
     "MetricsCollector",
     "MonitoringManager",
+    "ThresholdLevel",
+    "ThresholdRule",
+    "ThresholdRuleTable",
     "create_system_alert_rules",
     "create_usar_alert_rules",
     "database_health_check",
     "redis_health_check",
     "external_api_health_check",
+    "single_alert_channel",
 ]
+
+# Resolved on first attribute access (PEP 562) so importing the package does
+# not pull in prometheus_client and the alerting machinery up front
+_LAZY = dict.fromkeys(__all__, ".metrics")
+
+
+def __getattr__(name: str) -> Any:
+    """Import a monitoring name from its submodule on first access."""
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List lazily exported names alongside module globals."""
+    return sorted(set(globals()) | set(__all__))
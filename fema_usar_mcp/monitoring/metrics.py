@@ -2,16 +2,38 @@
 
 Provides comprehensive monitoring, alerting, and observability
 for USAR operations and system health.
+
+Label cardinality budget: every label on a Prometheus metric must come from
+a small, bounded set, because each label combination is a separate time
+series that lives in memory and is rendered on every scrape.
+
+- task_force_id: one of the 28 national task forces (FEMA_TASK_FORCE_IDS);
+  anything else is reported as "other".
+- result: success, partial or failure (see OPERATION_RESULTS).
+- operation_type, functional_group, category, search/rescue type: small
+  fixed vocabularies.
+- Never use per-deployment, per-incident or per-person identifiers as
+  labels; log them instead.
 """
 
 import asyncio
+import collections
+import contextlib
+import functools
+import inspect
 import logging
+import math
+import os
+import threading
 import time
-from collections.abc import Callable
-from dataclasses import asdict, dataclass
+from collections import OrderedDict, deque
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
+from wsgiref.simple_server import WSGIServer
 
 import psutil
 from prometheus_client import (
@@ -20,11 +42,73 @@ from prometheus_client import (
     Gauge,
     Histogram,
     generate_latest,
+    multiprocess,
     start_http_server,
 )
+from prometheus_client.registry import Collector
+
+# NumPy (advanced extra) vectorizes threshold rules; without it the same
+# table is evaluated with a plain Python loop
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 logger = logging.getLogger(__name__)
 
+# os.statvfs is POSIX-only; elsewhere disk usage goes through psutil
+_statvfs = getattr(os, "statvfs", None)
+
+# Filesystems that are read-only images and always report 100% used
+_IMAGE_FSTYPES = frozenset({"squashfs", "iso9660", "udf"})
+
+# National US&R Response System task forces, the only task_force_id values
+# allowed as metric labels
+FEMA_TASK_FORCE_IDS = frozenset(
+    {
+        "AZ-TF1",
+        "CA-TF1",
+        "CA-TF2",
+        "CA-TF3",
+        "CA-TF4",
+        "CA-TF5",
+        "CA-TF6",
+        "CA-TF7",
+        "CA-TF8",
+        "CO-TF1",
+        "FL-TF1",
+        "FL-TF2",
+        "IN-TF1",
+        "MA-TF1",
+        "MD-TF1",
+        "MO-TF1",
+        "NE-TF1",
+        "NM-TF1",
+        "NV-TF1",
+        "NY-TF1",
+        "OH-TF1",
+        "PA-TF1",
+        "TN-TF1",
+        "TX-TF1",
+        "UT-TF1",
+        "VA-TF1",
+        "VA-TF2",
+        "WA-TF1",
+    }
+)
+
+OPERATION_RESULTS = ("success", "partial", "failure")
+
+
+def task_force_label(task_force_id: str) -> str:
+    """Map a task force ID to a bounded metric label value."""
+    return task_force_id if task_force_id in FEMA_TASK_FORCE_IDS else "other"
+
+
+def result_label(result: str) -> str:
+    """Bucket an operation result into success, partial or failure."""
+    return result if result in OPERATION_RESULTS else "failure"
+
 
 class AlertSeverity(Enum):
     """Alert severity levels."""
@@ -44,7 +128,7 @@ class MetricType(Enum):
     SUMMARY = "summary"
 
 
-@dataclass
+@dataclass(slots=True)
 class Alert:
     """Alert model."""
 
@@ -54,17 +138,28 @@ class Alert:
     message: str
     source: str
     timestamp: datetime
-    labels: dict[str, str]
+    labels: Mapping[str, str]
     resolved: bool = False
     resolved_at: datetime | None = None
     acknowledgment: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to a JSON-ready dictionary."""
+        return {
+            "alert_id": self.alert_id,
+            "name": self.name,
+            "severity": self.severity.value,
+            "message": self.message,
+            "source": self.source,
+            "timestamp": self.timestamp.isoformat(),
+            "labels": dict(self.labels),
+            "resolved": self.resolved,
+            "resolved_at": self.resolved_at.isoformat() if self.resolved_at else None,
+            "acknowledgment": self.acknowledgment,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheck:
     """Health check model."""
 
@@ -76,6 +171,121 @@ class HealthCheck:
     check_function: Callable | None = None
 
 
+@dataclass(slots=True, frozen=True)
+class ThresholdLevel:
+    """Alert raised when a metric exceeds a threshold.
+
+    message is a format template receiving ``value`` and ``threshold``.
+    """
+
+    threshold: float
+    alert_id: str
+    name: str
+    message: str
+    severity: AlertSeverity
+
+
+@dataclass(slots=True, frozen=True)
+class ThresholdRule:
+    """Metric checked against optional warning and critical levels.
+
+    Only the highest level exceeded fires, like an if/elif rule function.
+    """
+
+    metric: str
+    source: str
+    labels: Mapping[str, str]
+    warn: ThresholdLevel | None = None
+    crit: ThresholdLevel | None = None
+
+
+@dataclass(slots=True)
+class ThresholdRuleTable:
+    """Threshold rules held as parallel arrays for one vectorized check.
+
+    Row i of metric_keys, warn_thresholds and crit_thresholds belongs to
+    rules[i]; a missing level is stored as an infinite threshold. Alert
+    objects and messages are only built for rows that fire.
+    """
+
+    rules: list[ThresholdRule] = field(default_factory=list)
+    metric_keys: list[str] = field(default_factory=list)
+    warn_thresholds: Any = field(default_factory=list)
+    crit_thresholds: Any = field(default_factory=list)
+
+    def add(self, rule: ThresholdRule) -> None:
+        """Add a rule and rebuild the threshold arrays."""
+        self.rules.append(rule)
+        self.metric_keys.append(rule.metric)
+        warn = [r.warn.threshold if r.warn else math.inf for r in self.rules]
+        crit = [r.crit.threshold if r.crit else math.inf for r in self.rules]
+        if np is not None:
+            self.warn_thresholds = np.array(warn, dtype=np.float64)
+            self.crit_thresholds = np.array(crit, dtype=np.float64)
+        else:
+            self.warn_thresholds = warn
+            self.crit_thresholds = crit
+
+    def evaluate(
+        self, metrics_data: Mapping[str, Any], now: datetime | None = None
+    ) -> list[Alert]:
+        """Return the alerts fired by the current metrics.
+
+        Args:
+            metrics_data: Current metrics data; missing metrics read as 0
+            now: Timestamp for the fired alerts; defaults to the current time
+
+        Returns:
+            One alert per rule whose warning or critical level is exceeded
+        """
+        if not self.rules:
+            return []
+
+        if np is not None:
+            values = np.fromiter(
+                (metrics_data.get(key, 0.0) for key in self.metric_keys),
+                dtype=np.float64,
+                count=len(self.metric_keys),
+            )
+            crit_mask = values > self.crit_thresholds
+            warn_mask = (values > self.warn_thresholds) & ~crit_mask
+            # (row, critical) for each rule that fired
+            hits = [(i, True) for i in np.flatnonzero(crit_mask).tolist()]
+            hits += [(i, False) for i in np.flatnonzero(warn_mask).tolist()]
+            readings = values.tolist()
+        else:
+            readings = [float(metrics_data.get(key, 0.0)) for key in self.metric_keys]
+            hits = []
+            for i, value in enumerate(readings):
+                if value > self.crit_thresholds[i]:
+                    hits.append((i, True))
+                elif value > self.warn_thresholds[i]:
+                    hits.append((i, False))
+
+        if now is None:
+            now = datetime.now(UTC)
+        alerts = []
+        for i, critical in hits:
+            rule = self.rules[i]
+            level = rule.crit if critical else rule.warn
+            # A missing level has an infinite threshold, so it never fires
+            assert level is not None
+            alerts.append(
+                Alert(
+                    alert_id=level.alert_id,
+                    name=level.name,
+                    severity=level.severity,
+                    message=level.message.format(
+                        value=readings[i], threshold=level.threshold
+                    ),
+                    source=rule.source,
+                    timestamp=now,
+                    labels=rule.labels,
+                )
+            )
+        return alerts
+
+
 class USARMetrics:
     """FEMA USAR specific metrics collector."""
 
@@ -88,19 +298,32 @@ class USARMetrics:
         self.registry = registry or CollectorRegistry()
         self._init_metrics()
 
+        # Per-request label children, memoized by label values so hot paths
+        # skip prometheus_client's label lookup
+        self._api_request_children = functools.lru_cache(maxsize=1024)(
+            self._bind_api_request_children
+        )
+
     def _init_metrics(self):
-        """Initialize Prometheus metrics."""
+        """Initialize Prometheus metrics.
+
+        Gauge multiprocess modes only apply when PROMETHEUS_MULTIPROC_DIR is
+        set: per-worker counts are summed across live workers, while values
+        every worker samples from shared state report the maximum.
+        """
         # System metrics
         self.system_cpu_usage = Gauge(
             "usar_system_cpu_usage_percent",
             "System CPU usage percentage",
             registry=self.registry,
+            multiprocess_mode="livemax",
         )
 
         self.system_memory_usage = Gauge(
             "usar_system_memory_usage_bytes",
             "System memory usage in bytes",
             registry=self.registry,
+            multiprocess_mode="livemax",
         )
 
         self.system_disk_usage = Gauge(
@@ -108,6 +331,7 @@ class USARMetrics:
             "System disk usage percentage",
             ["mount_point"],
             registry=self.registry,
+            multiprocess_mode="livemax",
         )
 
         # Application metrics
@@ -129,6 +353,7 @@ class USARMetrics:
             "usar_active_sessions",
             "Number of active user sessions",
             registry=self.registry,
+            multiprocess_mode="livesum",
         )
 
         self.database_connections = Gauge(
@@ -136,21 +361,39 @@ class USARMetrics:
             "Database connection pool usage",
             ["pool_name"],
             registry=self.registry,
+            multiprocess_mode="livesum",
         )
 
         # USAR operational metrics
         self.active_deployments = Gauge(
             "usar_active_deployments",
             "Number of active deployments",
+            registry=self.registry,
+            multiprocess_mode="livemax",
+        )
+
+        self.deployments_by_task_force = Gauge(
+            "usar_deployments_by_task_force",
+            "Number of active deployments per national task force",
             ["task_force_id"],
             registry=self.registry,
+            multiprocess_mode="livemax",
         )
 
         self.personnel_deployed = Gauge(
             "usar_personnel_deployed",
             "Number of personnel deployed",
-            ["task_force_id", "functional_group"],
+            ["task_force_id"],
+            registry=self.registry,
+            multiprocess_mode="livemax",
+        )
+
+        self.personnel_by_functional_group = Gauge(
+            "usar_personnel_by_functional_group",
+            "Number of personnel deployed per functional group",
+            ["functional_group"],
             registry=self.registry,
+            multiprocess_mode="livemax",
         )
 
         self.equipment_operational = Gauge(
@@ -158,13 +401,15 @@ class USARMetrics:
             "Number of operational equipment items",
             ["task_force_id", "category"],
             registry=self.registry,
+            multiprocess_mode="livemax",
         )
 
         self.operations_active = Gauge(
             "usar_operations_active",
             "Number of active operations",
-            ["deployment_id", "operation_type"],
+            ["operation_type"],
             registry=self.registry,
+            multiprocess_mode="livesum",
         )
 
         self.search_operations_total = Counter(
@@ -201,12 +446,14 @@ class USARMetrics:
             "Cache hit rate percentage",
             ["cache_name"],
             registry=self.registry,
+            multiprocess_mode="liveall",
         )
 
         self.async_tasks_pending = Gauge(
             "usar_async_tasks_pending",
             "Number of pending async tasks",
             registry=self.registry,
+            multiprocess_mode="livesum",
         )
 
         self.backup_last_success = Gauge(
@@ -214,6 +461,7 @@ class USARMetrics:
             "Timestamp of last successful backup",
             ["backup_type"],
             registry=self.registry,
+            multiprocess_mode="max",
         )
 
         # Integration metrics
@@ -231,36 +479,171 @@ class USARMetrics:
             registry=self.registry,
         )
 
+    def _bind_api_request_children(
+        self, method: str, endpoint: str, status: str
+    ) -> tuple[Counter, Histogram]:
+        """Resolve the labelled request counter and duration histogram."""
+        return (
+            self.api_requests_total.labels(
+                method=method, endpoint=endpoint, status=status
+            ),
+            self.api_request_duration.labels(method=method, endpoint=endpoint),
+        )
+
+    def record_api_request(
+        self, method: str, endpoint: str, status: int | str, duration_seconds: float
+    ) -> None:
+        """Count an API request and observe its duration."""
+        requests, duration = self._api_request_children(method, endpoint, str(status))
+        requests.inc()
+        duration.observe(duration_seconds)
+
+    def record_search_operation(
+        self, task_force_id: str, search_type: str, result: str
+    ) -> None:
+        """Count a completed search operation with bounded labels."""
+        self.search_operations_total.labels(
+            task_force_id=task_force_label(task_force_id),
+            search_type=search_type,
+            result=result_label(result),
+        ).inc()
+
+    def record_rescue_operation(
+        self, task_force_id: str, rescue_type: str, result: str
+    ) -> None:
+        """Count a completed rescue operation with bounded labels."""
+        self.rescue_operations_total.labels(
+            task_force_id=task_force_label(task_force_id),
+            rescue_type=rescue_type,
+            result=result_label(result),
+        ).inc()
+
+
+def single_alert_channel(channel: Callable) -> Callable:
+    """Adapt a channel that takes one Alert to the batched channel signature.
+
+    Args:
+        channel: Sync or async function accepting a single alert
+
+    Returns:
+        Channel accepting a list of alerts
+    """
+    if inspect.iscoroutinefunction(channel):
+
+        async def async_batched(alerts: list[Alert]) -> None:
+            for alert in alerts:
+                await channel(alert)
+
+        return async_batched
+
+    def batched(alerts: list[Alert]) -> None:
+        for alert in alerts:
+            channel(alert)
+
+    return batched
+
 
 class AlertManager:
-    """Alert management system."""
+    """Alert management system.
+
+    New alerts are queued for notification. Channels are only called while
+    run_dispatch_loop() is running (MonitoringManager.start() runs it) or
+    when flush_notifications() is awaited. The queue is bounded, and alerts
+    fired while it is full are still recorded but not notified.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_notifications: int = 10,
+        batch_size: int = 32,
+        batch_window: float = 0.5,
+        max_history: int = 10_000,
+        max_queued_notifications: int = 1_000,
+    ):
+        """Initialize alert manager.
 
-    def __init__(self):
-        """Initialize alert manager."""
-        self.active_alerts: dict[str, Alert] = {}
-        self.alert_history: list[Alert] = []
+        Args:
+            max_concurrent_notifications: Upper bound on in-flight notifications
+            batch_size: Maximum alerts dispatched in one notification batch
+            batch_window: Seconds to wait for more alerts before dispatching
+            max_history: Number of fired alerts kept in alert_history
+            max_queued_notifications: Alerts held for dispatch before new
+                ones are dropped from notification
+        """
+        # Kept in firing order (oldest first) so listings need no sort; the
+        # per-severity views let filtered listings skip other severities
+        self.active_alerts: OrderedDict[str, Alert] = OrderedDict()
+        self._active_by_severity: dict[AlertSeverity, OrderedDict[str, Alert]] = {
+            severity: OrderedDict() for severity in AlertSeverity
+        }
+        self.alert_history: deque[Alert] = deque(maxlen=max_history)
+        # Per-name firing totals survive eviction from alert_history
+        self._firing_counts: collections.Counter[str] = collections.Counter()
         self.alert_rules: list[Callable] = []
+        # Rules accepting a ``now`` keyword, found once at registration
+        self._rules_taking_now: set[Callable] = set()
+        self.threshold_rules = ThresholdRuleTable()
         self.notification_channels: list[Callable] = []
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self._alert_queue: asyncio.Queue[Alert] = asyncio.Queue(
+            maxsize=max_queued_notifications
+        )
+        self._notification_semaphore = asyncio.Semaphore(max_concurrent_notifications)
 
     def add_alert_rule(self, rule_function: Callable):
         """Add alert rule.
 
         Args:
-            rule_function: Function that returns Alert or None
+            rule_function: Function or coroutine function taking the metrics
+                mapping and returning an Alert or None. Rules with a ``now``
+                parameter receive the evaluation time to stamp alerts with.
         """
         self.alert_rules.append(rule_function)
+        try:
+            parameters = inspect.signature(rule_function).parameters
+        except (TypeError, ValueError):
+            return
+        if "now" in parameters:
+            self._rules_taking_now.add(rule_function)
+
+    def add_threshold_rule(self, rule: ThresholdRule) -> None:
+        """Add a plain threshold rule.
+
+        Threshold rules are checked together in one vectorized pass; use
+        add_alert_rule() for rules that need custom logic.
+
+        Args:
+            rule: Metric thresholds and the alerts they raise
+        """
+        self.threshold_rules.add(rule)
 
     def add_notification_channel(self, channel_function: Callable):
         """Add notification channel.
 
+        Channels receive a list of alerts sharing one name and severity.
+        Wrap channels that take a single alert with single_alert_channel().
+
         Args:
-            channel_function: Function to send notifications
+            channel_function: Function to send notifications; coroutine
+                functions are awaited, plain functions run in a worker thread
         """
         self.notification_channels.append(channel_function)
 
-    def fire_alert(self, alert: Alert):
+    async def _notify(self, channel: Callable, alerts: list[Alert]):
+        """Send one notification, bounded by the notification semaphore."""
+        async with self._notification_semaphore:
+            if inspect.iscoroutinefunction(channel):
+                await channel(alerts)
+            else:
+                await asyncio.to_thread(channel, alerts)
+
+    async def fire_alert(self, alert: Alert):
         """Fire new alert.
 
+        New alerts are queued for the notification dispatcher rather than
+        sent immediately; if the queue is full the alert is only recorded.
+
         Args:
             alert: Alert to fire
         """
@@ -270,49 +653,174 @@ class AlertManager:
             existing.timestamp = alert.timestamp
             existing.message = alert.message
             existing.labels = alert.labels
+            self.active_alerts.move_to_end(alert.alert_id)
+            self._active_by_severity[existing.severity].move_to_end(alert.alert_id)
+            logger.debug("Alert updated: %s - %s", alert.name, alert.message)
         else:
             # New alert
             self.active_alerts[alert.alert_id] = alert
+            self._active_by_severity[alert.severity][alert.alert_id] = alert
             self.alert_history.append(alert)
+            self._firing_counts[alert.name] += 1
+            try:
+                self._alert_queue.put_nowait(alert)
+            except asyncio.QueueFull:
+                logger.warning(
+                    "Notification queue full, not notifying alert: %s - %s",
+                    alert.name,
+                    alert.message,
+                )
 
-            # Send notifications
-            for channel in self.notification_channels:
-                try:
-                    channel(alert)
-                except Exception as e:
-                    logger.error(f"Notification failed: {str(e)}")
+    async def dispatch_alerts(self, alerts: list[Alert]):
+        """Notify every channel once per (name, severity) group of alerts.
 
-        logger.warning(f"Alert fired: {alert.name} - {alert.message}")
+        Args:
+            alerts: Alerts to dispatch
+        """
+        groups: dict[tuple[str, AlertSeverity], list[Alert]] = {}
+        for alert in alerts:
+            groups.setdefault((alert.name, alert.severity), []).append(alert)
+
+        for (name, severity), group in groups.items():
+            logger.warning(
+                "Alert fired: %s (%s) x%d - %s",
+                name,
+                severity.value,
+                len(group),
+                group[-1].message,
+            )
+
+        results = await asyncio.gather(
+            *(
+                self._notify(channel, group)
+                for group in groups.values()
+                for channel in self.notification_channels
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Notification failed: %s", result)
+
+    def _drain_queue(self, batch: list[Alert]):
+        """Move queued alerts into batch without waiting, up to batch_size."""
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._alert_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                return
+
+    async def flush_notifications(self):
+        """Dispatch every queued alert immediately."""
+        while not self._alert_queue.empty():
+            batch: list[Alert] = []
+            self._drain_queue(batch)
+            await self.dispatch_alerts(batch)
+
+    async def run_dispatch_loop(self):
+        """Batch queued alerts and dispatch them until cancelled.
+
+        A batch closes when batch_size alerts are collected or batch_window
+        seconds have passed since its first alert.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._alert_queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.batch_size:
+                self._drain_queue(batch)
+                remaining = deadline - loop.time()
+                if len(batch) >= self.batch_size or remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._alert_queue.get(), remaining)
+                    )
+                except TimeoutError:
+                    break
+            try:
+                await self.dispatch_alerts(batch)
+            except Exception as e:
+                logger.error("Alert dispatch error: %s", e)
 
-    def resolve_alert(self, alert_id: str, resolved_by: str = "system"):
+    def resolve_alert(
+        self, alert_id: str, resolved_by: str = "system", now: datetime | None = None
+    ):
         """Resolve alert.
 
         Args:
             alert_id: Alert identifier
             resolved_by: Who resolved the alert
+            now: Resolution time; defaults to the current time
         """
-        if alert_id in self.active_alerts:
-            alert = self.active_alerts[alert_id]
-            alert.resolved = True
-            alert.resolved_at = datetime.now(UTC)
-            alert.acknowledgment = f"Resolved by {resolved_by}"
+        alert = self.active_alerts.pop(alert_id, None)
+        if alert is None:
+            return
+        self._active_by_severity[alert.severity].pop(alert_id, None)
+
+        alert.resolved = True
+        alert.resolved_at = now if now is not None else datetime.now(UTC)
+        alert.acknowledgment = f"Resolved by {resolved_by}"
+        logger.info("Alert resolved: %s", alert.name)
 
-            del self.active_alerts[alert_id]
-            logger.info(f"Alert resolved: {alert.name}")
+    def get_history_summary(self) -> dict[str, int]:
+        """Get how many times each alert has fired since startup.
 
-    def check_alert_rules(self, metrics_data: dict[str, Any]):
+        Unlike alert_history, these totals are not bounded by max_history.
+
+        Returns:
+            Firing count per alert name
+        """
+        return dict(self._firing_counts)
+
+    async def check_alert_rules(
+        self, metrics_data: dict[str, Any], now: datetime | None = None
+    ):
         """Check all alert rules against metrics.
 
+        Threshold rules are checked in one vectorized pass, synchronous
+        rules run inline and async rules are evaluated concurrently. Alerts
+        are fired once every rule has been evaluated.
+
         Args:
             metrics_data: Current metrics data
+            now: Evaluation time shared by every alert from this check;
+                defaults to the current time
         """
+        if now is None:
+            now = datetime.now(UTC)
+        # Read-only view shared by every rule instead of per-rule copies
+        view = MappingProxyType(metrics_data)
+        outcomes: list[Any] = []
+        pending = []
+
+        try:
+            outcomes.extend(self.threshold_rules.evaluate(view, now))
+        except Exception as e:
+            outcomes.append(e)
+
         for rule in self.alert_rules:
             try:
-                alert = rule(metrics_data)
-                if alert:
-                    self.fire_alert(alert)
+                if rule in self._rules_taking_now:
+                    result = rule(view, now=now)
+                else:
+                    result = rule(view)
             except Exception as e:
-                logger.error(f"Alert rule check failed: {str(e)}")
+                outcomes.append(e)
+                continue
+            if inspect.isawaitable(result):
+                pending.append(result)
+            else:
+                outcomes.append(result)
+
+        if pending:
+            outcomes.extend(await asyncio.gather(*pending, return_exceptions=True))
+
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.error("Alert rule check failed: %s", outcome)
+            elif outcome:
+                await self.fire_alert(outcome)
 
     def get_active_alerts(self, severity: AlertSeverity | None = None) -> list[Alert]:
         """Get active alerts.
@@ -321,21 +829,38 @@ class AlertManager:
             severity: Filter by severity
 
         Returns:
-            List of active alerts
+            List of active alerts, most recently fired or updated first
         """
-        alerts = list(self.active_alerts.values())
         if severity:
-            alerts = [a for a in alerts if a.severity == severity]
-        return sorted(alerts, key=lambda x: x.timestamp, reverse=True)
+            return list(reversed(self._active_by_severity[severity].values()))
+        return list(reversed(self.active_alerts.values()))
+
+    def count_active_alerts(self) -> dict[str, int]:
+        """Count active alerts per severity without walking the alerts.
+
+        Returns:
+            Number of active alerts keyed by severity value
+        """
+        return {
+            severity.value: len(alerts)
+            for severity, alerts in self._active_by_severity.items()
+        }
 
 
 class HealthMonitor:
     """System health monitoring."""
 
-    def __init__(self):
-        """Initialize health monitor."""
+    def __init__(self, check_timeout: float = 10.0):
+        """Initialize health monitor.
+
+        Args:
+            check_timeout: Seconds before a single health check is failed
+        """
         self.health_checks: dict[str, HealthCheck] = {}
         self.health_status = "healthy"
+        # Checks per status from the last run, so summaries need no rescan
+        self.status_counts: collections.Counter[str] = collections.Counter()
+        self.check_timeout = check_timeout
 
     def add_health_check(self, check: HealthCheck):
         """Add health check.
@@ -345,61 +870,82 @@ class HealthMonitor:
         """
         self.health_checks[check.name] = check
 
+    async def _run_one(self, check: HealthCheck) -> tuple[str, dict[str, Any], float]:
+        """Run a single health check under the check timeout.
+
+        Returns:
+            Status, details and response time in milliseconds
+        """
+        start_time = time.perf_counter()
+        if check.check_function:
+            status, details = await asyncio.wait_for(
+                check.check_function(), timeout=self.check_timeout
+            )
+        else:
+            status, details = "healthy", {}
+        return status, details, (time.perf_counter() - start_time) * 1000
+
     async def run_health_checks(self) -> dict[str, Any]:
-        """Run all health checks.
+        """Run all health checks concurrently.
 
         Returns:
             Health check results
         """
-        results = {}
+        results: dict[str, dict[str, Any]] = {}
         overall_status = "healthy"
+        status_counts: collections.Counter[str] = collections.Counter()
 
-        for name, check in self.health_checks.items():
-            try:
-                start_time = time.time()
-
-                if check.check_function:
-                    status, details = await check.check_function()
-                else:
-                    status, details = "healthy", {}
-
-                response_time = (time.time() - start_time) * 1000
-
-                check.status = status
-                check.last_check = datetime.now(UTC)
-                check.response_time_ms = response_time
-                check.details = details
-
-                results[name] = {
-                    "status": status,
-                    "response_time_ms": response_time,
-                    "last_check": check.last_check.isoformat(),
-                    "details": details,
-                }
+        checks = list(self.health_checks.values())
+        outcomes = await asyncio.gather(
+            *(self._run_one(check) for check in checks), return_exceptions=True
+        )
 
-                # Update overall status
-                if status == "unhealthy":
-                    overall_status = "unhealthy"
-                elif status == "degraded" and overall_status == "healthy":
-                    overall_status = "degraded"
+        for check, outcome in zip(checks, outcomes, strict=True):
+            check.last_check = datetime.now(UTC)
 
-            except Exception as e:
+            if isinstance(outcome, BaseException):
+                if isinstance(outcome, TimeoutError):
+                    error = f"Health check timed out after {self.check_timeout}s"
+                else:
+                    error = str(outcome)
                 check.status = "unhealthy"
-                check.last_check = datetime.now(UTC)
-                check.details = {"error": str(e)}
+                check.details = {"error": error}
 
-                results[name] = {
+                results[check.name] = {
                     "status": "unhealthy",
-                    "error": str(e),
+                    "error": error,
                     "last_check": check.last_check.isoformat(),
                 }
 
                 overall_status = "unhealthy"
+                status_counts["unhealthy"] += 1
+                continue
+
+            status, details, response_time = outcome
+            check.status = status
+            check.response_time_ms = response_time
+            check.details = details
+
+            results[check.name] = {
+                "status": status,
+                "response_time_ms": response_time,
+                "last_check": check.last_check.isoformat(),
+                "details": details,
+            }
+
+            # Update overall status
+            status_counts[status] += 1
+            if status == "unhealthy":
+                overall_status = "unhealthy"
+            elif status == "degraded" and overall_status == "healthy":
+                overall_status = "degraded"
 
         self.health_status = overall_status
+        self.status_counts = status_counts
 
         return {
             "overall_status": overall_status,
+            "status_counts": dict(status_counts),
             "checks": results,
             "timestamp": datetime.now(UTC).isoformat(),
         }
@@ -415,22 +961,80 @@ class MetricsCollector:
             metrics: USAR metrics instance
         """
         self.metrics = metrics
-        self.collection_interval = 15  # seconds
+        self.collection_interval = 300  # seconds
         self._running = False
 
+        # Scrape-driven sampling: concurrent scrapers within this window
+        # reuse the last sample
+        self.min_sample_interval = 5.0  # seconds
+        self._sample_lock = threading.Lock()
+        self._sampled_at = float("-inf")
+
+        # Non-blocking cpu_percent() measures since the previous call; prime
+        # it so the first collection cycle gets a meaningful reading
+        psutil.cpu_percent(interval=None)
+        self.last_cpu_percent = 0.0
+        self.last_memory = psutil.virtual_memory()
+
+        # Mounted partitions rarely change; re-enumerate them only periodically
+        # and keep each mount point's gauge child bound between refreshes
+        self.partition_refresh_interval = 600  # seconds
+        self._disk_gauges = self._bind_disk_gauges(psutil.disk_partitions())
+        self._partitions_loaded_at = time.monotonic()
+
+        # Fixed-label application gauges, bound once
+        self._primary_pool_gauge = metrics.database_connections.labels(
+            pool_name="primary"
+        )
+        self._operational_cache_gauge = metrics.cache_hit_rate.labels(
+            cache_name="operational_data"
+        )
+
+    def _bind_disk_gauges(self, partitions: list) -> list[tuple[str, Gauge]]:
+        """Pair each partition's mount point with its disk usage gauge child.
+
+        Read-only image mounts (snap packages, ISOs) are always full and are
+        skipped, as are repeated mount points.
+        """
+        mount_points = dict.fromkeys(
+            partition.mountpoint
+            for partition in partitions
+            if partition.fstype not in _IMAGE_FSTYPES
+        )
+        return [
+            (
+                mount_point,
+                self.metrics.system_disk_usage.labels(mount_point=mount_point),
+            )
+            for mount_point in mount_points
+        ]
+
+    def _get_disk_gauges(self) -> list[tuple[str, Gauge]]:
+        """Get the bound disk gauges, re-enumerating partitions when stale."""
+        now = time.monotonic()
+        if now - self._partitions_loaded_at >= self.partition_refresh_interval:
+            self._disk_gauges = self._bind_disk_gauges(psutil.disk_partitions())
+            self._partitions_loaded_at = now
+        return self._disk_gauges
+
     async def start_collection(self):
-        """Start metrics collection."""
+        """Start the background collection loop.
+
+        System metrics are sampled on scrape (see refresh_system_metrics), so
+        this loop only runs every collection_interval to keep readings warm
+        for alerting during quiet periods and to update application gauges.
+        """
         self._running = True
         logger.info("Starting metrics collection")
 
         while self._running:
             try:
-                await self._collect_system_metrics()
+                self.refresh_system_metrics()
                 await self._collect_application_metrics()
                 await asyncio.sleep(self.collection_interval)
 
             except Exception as e:
-                logger.error(f"Metrics collection error: {str(e)}")
+                logger.error("Metrics collection error: %s", e)
                 await asyncio.sleep(self.collection_interval)
 
     def stop_collection(self):
@@ -438,27 +1042,46 @@ class MetricsCollector:
         self._running = False
         logger.info("Stopped metrics collection")
 
-    async def _collect_system_metrics(self):
+    def refresh_system_metrics(self) -> bool:
+        """Sample system metrics unless the last sample is still fresh.
+
+        Called on every scrape and alert check; scrapers and checks landing
+        within min_sample_interval of each other share one sample.
+
+        Returns:
+            True if a new sample was taken
+        """
+        with self._sample_lock:
+            now = time.monotonic()
+            if now - self._sampled_at < self.min_sample_interval:
+                return False
+            self._sampled_at = now
+            self._collect_system_metrics()
+            return True
+
+    def _collect_system_metrics(self):
         """Collect system metrics."""
-        # CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # CPU usage since the previous sample; never blocks
+        cpu_percent = psutil.cpu_percent(interval=None)
+        self.last_cpu_percent = cpu_percent
         self.metrics.system_cpu_usage.set(cpu_percent)
 
         # Memory usage
         memory = psutil.virtual_memory()
+        self.last_memory = memory
         self.metrics.system_memory_usage.set(memory.used)
 
-        # Disk usage
-        disk_partitions = psutil.disk_partitions()
-        for partition in disk_partitions:
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                usage_percent = (usage.used / usage.total) * 100
-                self.metrics.system_disk_usage.labels(
-                    mount_point=partition.mountpoint
-                ).set(usage_percent)
-            except PermissionError:
-                continue
+        # Disk usage, straight from statvfs where available (same used/total
+        # ratio psutil.disk_usage reports, without building its namedtuple)
+        for mount_point, gauge in self._get_disk_gauges():
+            with contextlib.suppress(PermissionError, FileNotFoundError):
+                if _statvfs is None:
+                    usage = psutil.disk_usage(mount_point)
+                    gauge.set((usage.used / usage.total) * 100)
+                    continue
+                st = _statvfs(mount_point)
+                if st.f_blocks:
+                    gauge.set((st.f_blocks - st.f_bfree) / st.f_blocks * 100)
 
     async def _collect_application_metrics(self):
         """Collect application-specific metrics."""
@@ -466,112 +1089,120 @@ class MetricsCollector:
         # For now, we'll set some example values
 
         # Database connections (example)
-        self.metrics.database_connections.labels(pool_name="primary").set(5)
+        self._primary_pool_gauge.set(5)
 
         # Cache hit rates (example)
-        self.metrics.cache_hit_rate.labels(cache_name="operational_data").set(85.5)
+        self._operational_cache_gauge.set(85.5)
 
         # Active sessions (example)
         self.metrics.active_sessions.set(12)
 
 
-# Pre-built alert rules
+# Pre-built alert rules. Thresholds, label sets and message templates are
+# built once here rather than on every rule evaluation.
+_CPU_WARN_PERCENT = 80.0
+_CPU_CRIT_PERCENT = 90.0
+_MEMORY_WARN_PERCENT = 85.0
+_MEMORY_CRIT_PERCENT = 95.0
+_DISK_WARN_PERCENT = 85.0
+_DISK_CRIT_PERCENT = 95.0
+
+_CPU_LABELS = MappingProxyType({"component": "system", "metric": "cpu"})
+_MEMORY_LABELS = MappingProxyType({"component": "system", "metric": "memory"})
+_DISK_LABELS = MappingProxyType({"component": "system", "metric": "disk"})
+
+_CPU_MESSAGE = "CPU usage is {value:.1f}% (threshold: {threshold:g}%)"
+_MEMORY_MESSAGE = "Memory usage is {:.1f}% (threshold: {:g}%)"
+_DISK_MESSAGE = "Disk usage on {} is {:.1f}% (threshold: {:g}%)"
+
+
 def create_system_alert_rules(alert_manager: AlertManager):
     """Create system-level alert rules.
 
     Args:
         alert_manager: Alert manager instance
     """
-
-    def high_cpu_usage(metrics: dict[str, Any]) -> Alert | None:
-        """Alert for high CPU usage."""
-        cpu_usage = metrics.get("system_cpu_usage", 0)
-        if cpu_usage > 90:
-            return Alert(
-                alert_id="high_cpu_usage",
-                name="High CPU Usage",
-                severity=AlertSeverity.CRITICAL,
-                message=f"CPU usage is {cpu_usage:.1f}% (threshold: 90%)",
-                source="system",
-                timestamp=datetime.now(UTC),
-                labels={"component": "system", "metric": "cpu"},
-            )
-        elif cpu_usage > 80:
-            return Alert(
+    alert_manager.add_threshold_rule(
+        ThresholdRule(
+            metric="system_cpu_usage",
+            source="system",
+            labels=_CPU_LABELS,
+            warn=ThresholdLevel(
+                threshold=_CPU_WARN_PERCENT,
                 alert_id="elevated_cpu_usage",
                 name="Elevated CPU Usage",
+                message=_CPU_MESSAGE,
                 severity=AlertSeverity.WARNING,
-                message=f"CPU usage is {cpu_usage:.1f}% (threshold: 80%)",
-                source="system",
-                timestamp=datetime.now(UTC),
-                labels={"component": "system", "metric": "cpu"},
-            )
-        return None
+            ),
+            crit=ThresholdLevel(
+                threshold=_CPU_CRIT_PERCENT,
+                alert_id="high_cpu_usage",
+                name="High CPU Usage",
+                message=_CPU_MESSAGE,
+                severity=AlertSeverity.CRITICAL,
+            ),
+        )
+    )
 
-    def high_memory_usage(metrics: dict[str, Any]) -> Alert | None:
+    def high_memory_usage(metrics: dict[str, Any], now: datetime) -> Alert | None:
         """Alert for high memory usage."""
         memory_usage = metrics.get("system_memory_usage", 0)
         memory_total = metrics.get("system_memory_total", 1)
         usage_percent = (memory_usage / memory_total) * 100
 
-        if usage_percent > 95:
+        if usage_percent > _MEMORY_CRIT_PERCENT:
             return Alert(
                 alert_id="high_memory_usage",
                 name="High Memory Usage",
                 severity=AlertSeverity.CRITICAL,
-                message=f"Memory usage is {usage_percent:.1f}% (threshold: 95%)",
+                message=_MEMORY_MESSAGE.format(usage_percent, _MEMORY_CRIT_PERCENT),
                 source="system",
-                timestamp=datetime.now(UTC),
-                labels={"component": "system", "metric": "memory"},
+                timestamp=now,
+                labels=_MEMORY_LABELS,
             )
-        elif usage_percent > 85:
+        elif usage_percent > _MEMORY_WARN_PERCENT:
             return Alert(
                 alert_id="elevated_memory_usage",
                 name="Elevated Memory Usage",
                 severity=AlertSeverity.WARNING,
-                message=f"Memory usage is {usage_percent:.1f}% (threshold: 85%)",
+                message=_MEMORY_MESSAGE.format(usage_percent, _MEMORY_WARN_PERCENT),
                 source="system",
-                timestamp=datetime.now(UTC),
-                labels={"component": "system", "metric": "memory"},
+                timestamp=now,
+                labels=_MEMORY_LABELS,
             )
         return None
 
-    def disk_space_low(metrics: dict[str, Any]) -> Alert | None:
+    def disk_space_low(metrics: dict[str, Any], now: datetime) -> Alert | None:
         """Alert for low disk space."""
         disk_usage = metrics.get("system_disk_usage", {})
         for mount_point, usage_percent in disk_usage.items():
-            if usage_percent > 95:
+            if usage_percent > _DISK_CRIT_PERCENT:
                 return Alert(
                     alert_id=f"disk_full_{mount_point.replace('/', '_')}",
                     name="Disk Space Critical",
                     severity=AlertSeverity.CRITICAL,
-                    message=f"Disk usage on {mount_point} is {usage_percent:.1f}% (threshold: 95%)",
+                    message=_DISK_MESSAGE.format(
+                        mount_point, usage_percent, _DISK_CRIT_PERCENT
+                    ),
                     source="system",
-                    timestamp=datetime.now(UTC),
-                    labels={
-                        "component": "system",
-                        "metric": "disk",
-                        "mount_point": mount_point,
-                    },
+                    timestamp=now,
+                    labels={**_DISK_LABELS, "mount_point": mount_point},
                 )
-            elif usage_percent > 85:
+            elif usage_percent > _DISK_WARN_PERCENT:
                 return Alert(
                     alert_id=f"disk_low_{mount_point.replace('/', '_')}",
                     name="Disk Space Warning",
                     severity=AlertSeverity.WARNING,
-                    message=f"Disk usage on {mount_point} is {usage_percent:.1f}% (threshold: 85%)",
+                    message=_DISK_MESSAGE.format(
+                        mount_point, usage_percent, _DISK_WARN_PERCENT
+                    ),
                     source="system",
-                    timestamp=datetime.now(UTC),
-                    labels={
-                        "component": "system",
-                        "metric": "disk",
-                        "mount_point": mount_point,
-                    },
+                    timestamp=now,
+                    labels={**_DISK_LABELS, "mount_point": mount_point},
                 )
         return None
 
     # Add rules to alert manager
-    alert_manager.add_alert_rule(high_cpu_usage)
     alert_manager.add_alert_rule(high_memory_usage)
     alert_manager.add_alert_rule(disk_space_low)
 
@@ -582,56 +1213,49 @@ def create_usar_alert_rules(alert_manager: AlertManager):
     Args:
         alert_manager: Alert manager instance
     """
-
-    def deployment_health_check(metrics: dict[str, Any]) -> Alert | None:
-        """Alert for deployment health issues."""
-        active_deployments = metrics.get("active_deployments", 0)
-        if active_deployments > 10:
-            return Alert(
+    alert_manager.add_threshold_rule(
+        ThresholdRule(
+            metric="active_deployments",
+            source="usar_operations",
+            labels={"component": "operations", "metric": "deployments"},
+            warn=ThresholdLevel(
+                threshold=10,
                 alert_id="high_deployment_load",
                 name="High Deployment Load",
+                message="Managing {value:g} active deployments",
                 severity=AlertSeverity.WARNING,
-                message=f"Managing {active_deployments} active deployments",
-                source="usar_operations",
-                timestamp=datetime.now(UTC),
-                labels={"component": "operations", "metric": "deployments"},
-            )
-        return None
-
-    def safety_incident_spike(metrics: dict[str, Any]) -> Alert | None:
-        """Alert for safety incident spikes."""
-        recent_incidents = metrics.get("safety_incidents_last_hour", 0)
-        if recent_incidents >= 3:
-            return Alert(
+            ),
+        )
+    )
+    # Incident counts are whole numbers, so "more than 2" means 3 or more
+    alert_manager.add_threshold_rule(
+        ThresholdRule(
+            metric="safety_incidents_last_hour",
+            source="usar_safety",
+            labels={"component": "safety", "metric": "incidents"},
+            crit=ThresholdLevel(
+                threshold=2,
                 alert_id="safety_incident_spike",
                 name="Safety Incident Spike",
+                message="{value:g} safety incidents in the last hour",
                 severity=AlertSeverity.CRITICAL,
-                message=f"{recent_incidents} safety incidents in the last hour",
-                source="usar_safety",
-                timestamp=datetime.now(UTC),
-                labels={"component": "safety", "metric": "incidents"},
-            )
-        return None
-
-    def equipment_failure_rate(metrics: dict[str, Any]) -> Alert | None:
-        """Alert for high equipment failure rate."""
-        failure_rate = metrics.get("equipment_failure_rate_percent", 0)
-        if failure_rate > 10:
-            return Alert(
+            ),
+        )
+    )
+    alert_manager.add_threshold_rule(
+        ThresholdRule(
+            metric="equipment_failure_rate_percent",
+            source="usar_equipment",
+            labels={"component": "equipment", "metric": "failure_rate"},
+            crit=ThresholdLevel(
+                threshold=10,
                 alert_id="high_equipment_failure_rate",
                 name="High Equipment Failure Rate",
+                message="Equipment failure rate is {value:.1f}%",
                 severity=AlertSeverity.ERROR,
-                message=f"Equipment failure rate is {failure_rate:.1f}%",
-                source="usar_equipment",
-                timestamp=datetime.now(UTC),
-                labels={"component": "equipment", "metric": "failure_rate"},
-            )
-        return None
-
-    # Add USAR-specific rules
-    alert_manager.add_alert_rule(deployment_health_check)
-    alert_manager.add_alert_rule(safety_incident_spike)
-    alert_manager.add_alert_rule(equipment_failure_rate)
+            ),
+        )
+    )
 
 
 # Health check functions
@@ -676,22 +1300,79 @@ async def external_api_health_check() -> tuple[str, dict[str, Any]]:
         return "degraded", {"error": str(e)}
 
 
+class _ScrapeHook(Collector):
+    """Collector that runs a callback at the start of each scrape.
+
+    It yields no metrics; register it before the collectors whose values the
+    callback refreshes.
+    """
+
+    def __init__(self, callback: Callable[[], Any]):
+        """Initialize scrape hook.
+
+        Args:
+            callback: Called with no arguments on every collect()
+        """
+        self.callback = callback
+
+    def collect(self):
+        try:
+            self.callback()
+        except Exception as e:
+            logger.error("Scrape refresh failed: %s", e)
+        return iter(())
+
+
 class MonitoringManager:
     """Main monitoring management class."""
 
-    def __init__(self, port: int = 9090):
+    def __init__(
+        self,
+        port: int = 9090,
+        metrics_cache_ttl: float = 10.0,
+        alert_history_size: int = 10_000,
+    ):
         """Initialize monitoring manager.
 
         Args:
             port: Prometheus metrics port
+            metrics_cache_ttl: Seconds a rendered metrics payload is reused
+            alert_history_size: Number of fired alerts kept in history
         """
         self.port = port
         self.registry = CollectorRegistry()
+        # Under multiple uvicorn workers prometheus_client writes samples to
+        # mmap files in PROMETHEUS_MULTIPROC_DIR (it must be set before
+        # prometheus_client is imported); scrapes then aggregate every
+        # worker's files instead of reading this process's registry
+        self.multiprocess = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+        self.exposition_registry = (
+            CollectorRegistry() if self.multiprocess else self.registry
+        )
+        # System metrics are sampled when scraped rather than on a timer; the
+        # hook is registered first so the samples land before rendering
+        self.exposition_registry.register(
+            _ScrapeHook(lambda: self.metrics_collector.refresh_system_metrics())
+        )
+        if self.multiprocess:
+            multiprocess.MultiProcessCollector(self.exposition_registry)
+
+        # Rendered exposition payload shared by scrapes within the TTL
+        self._metrics_cache_ttl = metrics_cache_ttl
+        self._cached_payload: bytes | None = None
+        self._cached_at = 0.0
+        self._metrics_lock = threading.Lock()
+
         self.metrics = USARMetrics(self.registry)
-        self.alert_manager = AlertManager()
+        self.alert_manager = AlertManager(max_history=alert_history_size)
         self.health_monitor = HealthMonitor()
         self.metrics_collector = MetricsCollector(self.metrics)
 
+        # Background loops started by start() and torn down by stop()
+        self._tasks: list[asyncio.Task] = []
+        self._shutdown = asyncio.Event()
+        self._http_server: WSGIServer | None = None
+
         # Initialize health checks
         self._setup_health_checks()
 
@@ -735,65 +1416,126 @@ class MonitoringManager:
     async def start(self):
         """Start monitoring services."""
         logger.info("Starting FEMA USAR monitoring system")
+        self._shutdown.clear()
 
         # Start Prometheus metrics server
-        start_http_server(self.port, registry=self.registry)
-        logger.info(f"Prometheus metrics server started on port {self.port}")
-
-        # Start metrics collection
-        asyncio.create_task(self.metrics_collector.start_collection())
-
-        # Start health check loop
-        asyncio.create_task(self._health_check_loop())
-
-        # Start alert check loop
-        asyncio.create_task(self._alert_check_loop())
+        server = start_http_server(self.port, registry=self.exposition_registry)
+        # prometheus_client returns (server, thread) from 0.17 onwards
+        self._http_server = server[0] if isinstance(server, tuple) else None
+        logger.info("Prometheus metrics server started on port %d", self.port)
+
+        # Background loops: metrics collection, health checks, alert checks
+        # and batched alert notification dispatch
+        for name, coro in (
+            ("metrics_collection", self.metrics_collector.start_collection()),
+            ("health_checks", self._health_check_loop()),
+            ("alert_checks", self._alert_check_loop()),
+            ("alert_dispatch", self.alert_manager.run_dispatch_loop()),
+        ):
+            task = asyncio.create_task(coro, name=f"monitoring.{name}")
+            task.add_done_callback(self._on_task_done)
+            self._tasks.append(task)
+
+    async def stop(self):
+        """Stop background loops and the metrics server, flushing queued alerts."""
+        logger.info("Stopping FEMA USAR monitoring system")
+        self._shutdown.set()
+        self.metrics_collector.stop_collection()
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+        await self.alert_manager.flush_notifications()
+
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server = None
+
+        if self.multiprocess:
+            # Drop this worker's live gauge files from future scrapes
+            multiprocess.mark_process_dead(os.getpid())
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        """Log background loops that exit with an error."""
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.error("Monitoring task %s failed: %s", task.get_name(), exc)
 
     async def _health_check_loop(self):
         """Health check monitoring loop."""
-        while True:
+        while not self._shutdown.is_set():
             try:
                 await self.health_monitor.run_health_checks()
                 await asyncio.sleep(30)  # Check every 30 seconds
             except Exception as e:
-                logger.error(f"Health check error: {str(e)}")
+                logger.error("Health check error: %s", e)
                 await asyncio.sleep(30)
 
     async def _alert_check_loop(self):
         """Alert checking loop."""
-        while True:
+        while not self._shutdown.is_set():
             try:
                 # Collect current metrics data
                 metrics_data = await self._collect_current_metrics()
 
                 # Check alert rules
-                self.alert_manager.check_alert_rules(metrics_data)
+                await self.alert_manager.check_alert_rules(metrics_data)
 
                 await asyncio.sleep(60)  # Check every minute
 
             except Exception as e:
-                logger.error(f"Alert check error: {str(e)}")
+                logger.error("Alert check error: %s", e)
                 await asyncio.sleep(60)
 
     async def _collect_current_metrics(self) -> dict[str, Any]:
         """Collect current metrics data for alert checking."""
-        # In a real implementation, this would collect actual metrics
+        # In a real implementation, this would collect actual metrics.
+        # System readings go through the collector's debounced refresh rather
+        # than calling psutil directly; a second cpu_percent() caller would
+        # also reset psutil's sampling window under the collector.
+        collector = self.metrics_collector
+        collector.refresh_system_metrics()
+        memory = collector.last_memory
         return {
-            "system_cpu_usage": psutil.cpu_percent(),
-            "system_memory_usage": psutil.virtual_memory().used,
-            "system_memory_total": psutil.virtual_memory().total,
+            "system_cpu_usage": collector.last_cpu_percent,
+            "system_memory_usage": memory.used,
+            "system_memory_total": memory.total,
             "active_deployments": 3,
             "safety_incidents_last_hour": 0,
             "equipment_failure_rate_percent": 2.1,
         }
 
-    def get_metrics(self) -> str:
+    def get_metrics(self) -> bytes:
         """Get Prometheus metrics.
 
+        The rendered payload is cached for metrics_cache_ttl seconds so
+        frequent polling does not re-walk the whole registry.
+
         Returns:
-            Prometheus metrics in text format
+            Prometheus metrics in UTF-8 text exposition format
         """
-        return generate_latest(self.registry).decode("utf-8")
+        payload = self._cached_payload
+        if (
+            payload is not None
+            and time.monotonic() - self._cached_at < self._metrics_cache_ttl
+        ):
+            return payload
+        with self._metrics_lock:
+            # Another caller may have refreshed the cache while we waited
+            if (
+                self._cached_payload is not None
+                and time.monotonic() - self._cached_at < self._metrics_cache_ttl
+            ):
+                return self._cached_payload
+            payload = generate_latest(self.exposition_registry)
+            self._cached_payload = payload
+            self._cached_at = time.monotonic()
+            return payload
 
     async def get_health_status(self) -> dict[str, Any]:
         """Get system health status.
@@ -13,10 +13,12 @@ from .auth import (
     SecurityAuditLogger,
     SecurityClearance,
     SecurityConfig,
+    Session,
     TwoFactorAuth,
     USARAuthenticationManager,
     USARRole,
     USARUser,
+    get_security_config,
 )
 
 __all__ = [
@@ -25,6 +27,7 @@ __all__ = [
     "AuthenticationMethod",
     "USARUser",
     "AuthToken",
+    "Session",
     "SecurityConfig",
     "PasswordManager",
     "JWTManager",
@@ -32,4 +35,5 @@ __all__ = [
     "SecurityAuditLogger",
     "RoleBasedAccessControl",
     "USARAuthenticationManager",
+    "get_security_config",
 ]
@@ -4,17 +4,36 @@ Provides secure authentication, role-based access control, and session managemen
 for FEMA USAR personnel with integration to federal identity systems.
 """
 
-import json
+import array
+import asyncio
+import base64
+import functools
+import hashlib
+import heapq
+import hmac
 import logging
+import os
 import secrets
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any
 
+import bcrypt
 import jwt
+import orjson
 from cryptography.fernet import Fernet
-from passlib.context import CryptContext
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
+
+# NumPy (advanced extra) scans the lockout table in one pass; without it
+# the same sweep is a plain Python loop
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 logger = logging.getLogger(__name__)
 
@@ -79,9 +98,7 @@ class USARUser(BaseModel):
     emergency_contact: dict[str, str] | None = Field(
         None, description="Emergency contact"
     )
-    certifications: list[str] = Field(
-        default_factory=list, description="Certifications held"
-    )
+    certifications: tuple[str, ...] = Field((), description="Certifications held")
     last_training: datetime | None = Field(None, description="Last training date")
     active: bool = Field(True, description="Account active status")
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
@@ -89,25 +106,42 @@ class USARUser(BaseModel):
     failed_attempts: int = Field(0, description="Failed login attempts")
     locked_until: datetime | None = Field(None, description="Account locked until")
 
-    @validator("email")
-    def validate_email(cls, v):
-        if "@" not in v:
+    @field_validator("email", mode="after")
+    @classmethod
+    def validate_email(cls, v: str) -> str:
+        # Needs a non-empty local part and domain around the last "@"
+        at = v.rfind("@")
+        if at < 1 or at == len(v) - 1:
             raise ValueError("Invalid email address")
         return v.lower()
 
 
-class AuthToken(BaseModel):
-    """Authentication token model."""
+@dataclass(slots=True)
+class AuthToken:
+    """Authentication token record.
 
-    token_id: str = Field(..., description="Unique token identifier")
-    user_id: str = Field(..., description="Associated user ID")
-    token_type: str = Field(..., description="Token type (access/refresh)")
-    expires_at: datetime = Field(..., description="Token expiration")
-    permissions: list[str] = Field(
-        default_factory=list, description="Token permissions"
-    )
-    issued_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    revoked: bool = Field(False, description="Token revoked status")
+    Tokens are issued by the server and never parsed from client input, so
+    this is a plain slotted dataclass rather than a validating model.
+    """
+
+    token_id: str
+    user_id: str
+    token_type: str  # access or refresh
+    expires_at: datetime
+    permissions: list[str] = field(default_factory=list)
+    issued_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    revoked: bool = False
+
+
+@dataclass(slots=True)
+class Session:
+    """Server-side session record; times are epoch seconds."""
+
+    user_id: str
+    created_at: float
+    last_activity: float
+    expire_ts: float
+    permissions: tuple[str, ...] = ()
 
 
 class SecurityConfig:
@@ -129,8 +163,6 @@ class SecurityConfig:
 
     def _get_secret_key(self) -> str:
         """Get or generate JWT secret key."""
-        import os
-
         secret = os.getenv("JWT_SECRET")
         if not secret:
             secret = secrets.token_urlsafe(32)
@@ -141,8 +173,6 @@ class SecurityConfig:
 
     def _get_encryption_key(self) -> bytes:
         """Get or generate encryption key."""
-        import os
-
         key = os.getenv("ENCRYPTION_KEY")
         if key:
             return key.encode()
@@ -154,11 +184,44 @@ class SecurityConfig:
             return key
 
 
+# bcrypt only reads the first 72 bytes of a password
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+_PASSWORD_SPECIALS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+_COMMON_PASSWORD_PATTERNS = ("password", "123456", "qwerty", "admin", "usar", "fema")
+
+
+@functools.lru_cache(maxsize=1)
+def get_security_config() -> SecurityConfig:
+    """Get the process-wide security configuration.
+
+    Environment variables are read, and any missing secrets generated, once
+    per process, so every manager signs and encrypts with the same keys.
+    """
+    return SecurityConfig()
+
+
+@functools.lru_cache(maxsize=4)
+def _fernet(key: bytes) -> Fernet:
+    """Build (once per key) the Fernet instance for an encryption key."""
+    return Fernet(key)
+
+
 class PasswordManager:
-    """Secure password management."""
+    """Secure password management.
 
-    def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    Hashes with bcrypt directly. The cost factor defaults to the
+    BCRYPT_ROUNDS environment variable (12 if unset) so it can be tuned to
+    the hardware. Existing passlib bcrypt hashes verify unchanged.
+    """
+
+    def __init__(self, rounds: int | None = None):
+        self.rounds = rounds or int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+    @staticmethod
+    def _encode(password: str) -> bytes:
+        """Encode a password the way passlib's bcrypt handler did."""
+        return password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES]
 
     def hash_password(self, password: str) -> str:
         """Hash a password securely.
@@ -169,7 +232,9 @@ class PasswordManager:
         Returns:
             Hashed password
         """
-        return self.pwd_context.hash(password)
+        return bcrypt.hashpw(
+            self._encode(password), bcrypt.gensalt(self.rounds)
+        ).decode("ascii")
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify password against hash.
@@ -181,7 +246,9 @@ class PasswordManager:
         Returns:
             True if password matches
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return bcrypt.checkpw(
+            self._encode(plain_password), hashed_password.encode("ascii")
+        )
 
     def validate_password_strength(self, password: str) -> dict[str, Any]:
         """Validate password strength requirements.
@@ -201,11 +268,18 @@ class PasswordManager:
         else:
             validation["score"] += 1
 
-        # Character diversity requirements
-        has_upper = any(c.isupper() for c in password)
-        has_lower = any(c.islower() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password)
+        # Character diversity requirements, classified in one pass over the
+        # distinct characters; the classes are mutually exclusive
+        has_upper = has_lower = has_digit = has_special = False
+        for c in set(password):
+            if c.isupper():
+                has_upper = True
+            elif c.islower():
+                has_lower = True
+            elif c.isdigit():
+                has_digit = True
+            elif c in _PASSWORD_SPECIALS:
+                has_special = True
 
         if not has_upper:
             validation["valid"] = False
@@ -232,8 +306,8 @@ class PasswordManager:
             validation["score"] += 1
 
         # Common password checks
-        common_patterns = ["password", "123456", "qwerty", "admin", "usar", "fema"]
-        if any(pattern in password.lower() for pattern in common_patterns):
+        lowered = password.lower()
+        if any(pattern in lowered for pattern in _COMMON_PASSWORD_PATTERNS):
             validation["valid"] = False
             validation["issues"].append("Password contains common patterns")
             validation["score"] -= 2
@@ -241,24 +315,70 @@ class PasswordManager:
         return validation
 
 
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as JWS segments require."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
 class JWTManager:
-    """JWT token management."""
+    """JWT token management.
+
+    HS256 tokens are signed directly: the header segment is fixed, so only
+    the claims are serialized (with orjson) and signed per token. Other
+    algorithms, and all verification, go through PyJWT.
+    """
 
     def __init__(self, config: SecurityConfig):
         self.config = config
-        self.encryption = Fernet(config.ENCRYPTION_KEY)
+        self.encryption = _fernet(config.ENCRYPTION_KEY)
+        # Keyed HMAC state, copied per token so the key is padded only once
+        self._hmac_proto = hmac.new(
+            config.JWT_SECRET_KEY.encode("utf-8"), digestmod=hashlib.sha256
+        )
+        self._header_segment = _b64url(
+            orjson.dumps(
+                {"alg": config.JWT_ALGORITHM, "typ": "JWT"},
+                option=orjson.OPT_SORT_KEYS,
+            )
+        )
+
+    def _encode(self, claims: dict[str, Any]) -> str:
+        """Sign claims into a compact JWS.
+
+        Args:
+            claims: Token claims; iat and exp as integer epoch seconds
+
+        Returns:
+            Encoded token
+        """
+        if self.config.JWT_ALGORITHM != "HS256":
+            return jwt.encode(
+                claims, self.config.JWT_SECRET_KEY, algorithm=self.config.JWT_ALGORITHM
+            )
+
+        signing_input = self._header_segment + b"." + _b64url(orjson.dumps(claims))
+        mac = self._hmac_proto.copy()
+        mac.update(signing_input)
+        signature = mac.digest()
+        return (signing_input + b"." + _b64url(signature)).decode("ascii")
 
-    def create_access_token(self, user: USARUser, permissions: list[str] = None) -> str:
+    def create_access_token(
+        self,
+        user: USARUser,
+        permissions: Sequence[str] | None = None,
+        now: datetime | None = None,
+    ) -> str:
         """Create JWT access token.
 
         Args:
             user: User object
             permissions: Additional permissions
+            now: Issue time, defaults to the current time
 
         Returns:
             JWT access token
         """
-        now = datetime.now(UTC)
+        now = now or datetime.now(UTC)
         expire = now + timedelta(minutes=self.config.ACCESS_TOKEN_EXPIRE_MINUTES)
 
         payload = {
@@ -267,35 +387,35 @@ class JWTManager:
             "role": user.usar_role.value,
             "clearance": user.security_clearance.value,
             "task_force": user.task_force_id,
-            "permissions": permissions or [],
-            "iat": now,
-            "exp": expire,
+            "permissions": permissions or (),
+            "iat": int(now.timestamp()),
+            "exp": int(expire.timestamp()),
             "type": "access",
         }
 
-        token = jwt.encode(
-            payload, self.config.JWT_SECRET_KEY, algorithm=self.config.JWT_ALGORITHM
-        )
-        return token
+        return self._encode(payload)
 
-    def create_refresh_token(self, user: USARUser) -> str:
+    def create_refresh_token(self, user: USARUser, now: datetime | None = None) -> str:
         """Create JWT refresh token.
 
         Args:
             user: User object
+            now: Issue time, defaults to the current time
 
         Returns:
             JWT refresh token
         """
-        now = datetime.now(UTC)
+        now = now or datetime.now(UTC)
         expire = now + timedelta(days=self.config.REFRESH_TOKEN_EXPIRE_DAYS)
 
-        payload = {"sub": user.user_id, "iat": now, "exp": expire, "type": "refresh"}
+        payload = {
+            "sub": user.user_id,
+            "iat": int(now.timestamp()),
+            "exp": int(expire.timestamp()),
+            "type": "refresh",
+        }
 
-        token = jwt.encode(
-            payload, self.config.JWT_SECRET_KEY, algorithm=self.config.JWT_ALGORITHM
-        )
-        return token
+        return self._encode(payload)
 
     def verify_token(self, token: str) -> dict[str, Any]:
         """Verify and decode JWT token.
@@ -321,6 +441,58 @@ class JWTManager:
         except jwt.InvalidTokenError as e:
             raise jwt.InvalidTokenError("Invalid token") from e
 
+    def verify_token_fast(self, token: str) -> dict[str, Any] | None:
+        """Check a token's signature and expiry without full claim validation.
+
+        For hot paths that only need to know whether one of our own HS256
+        tokens is valid and who it belongs to. The signature is checked in
+        constant time before the claims are parsed, and exp is compared as
+        an integer. Tokens with a different header, or a manager configured
+        for another algorithm, go through verify_token.
+
+        Args:
+            token: JWT token to verify
+
+        Returns:
+            Decoded token payload, or None if the token is invalid or expired
+        """
+        try:
+            raw = token.encode("ascii")
+        except UnicodeEncodeError:
+            # Compact JWS is ASCII only; never drop characters before the MAC
+            return None
+        if (
+            self.config.JWT_ALGORITHM != "HS256"
+            or raw.partition(b".")[0] != self._header_segment
+        ):
+            try:
+                return self.verify_token(token)
+            except jwt.InvalidTokenError:
+                return None
+
+        signing_input, _, signature = raw.rpartition(b".")
+        mac = self._hmac_proto.copy()
+        mac.update(signing_input)
+        if not hmac.compare_digest(_b64url(mac.digest()), signature):
+            return None
+
+        payload_segment = signing_input.partition(b".")[2]
+        try:
+            payload = orjson.loads(
+                base64.urlsafe_b64decode(
+                    payload_segment + b"=" * (-len(payload_segment) % 4)
+                )
+            )
+        except ValueError:
+            return None
+        if not isinstance(payload, dict):
+            return None
+
+        exp = payload.get("exp")
+        if exp is not None and (not isinstance(exp, int | float) or exp <= time.time()):
+            return None
+        return payload
+
     def refresh_access_token(self, refresh_token: str, user: USARUser) -> str:
         """Refresh access token using refresh token.
 
@@ -399,6 +571,15 @@ class SecurityAuditLogger:
     def __init__(self):
         self.logger = logging.getLogger("security.audit")
 
+    def _emit(self, level: int, label: str, event: dict[str, Any]) -> None:
+        """Log an event as JSON, serializing only if the level is enabled.
+
+        Timestamps are aware UTC datetimes, rendered with a Z suffix.
+        """
+        if self.logger.isEnabledFor(level):
+            payload = orjson.dumps(event, option=orjson.OPT_UTC_Z).decode()
+            self.logger.log(level, "%s: %s", label, payload)
+
     def log_login_attempt(
         self,
         username: str,
@@ -406,6 +587,7 @@ class SecurityAuditLogger:
         ip_address: str,
         user_agent: str,
         method: AuthenticationMethod,
+        timestamp: datetime | None = None,
     ):
         """Log login attempt.
 
@@ -415,6 +597,7 @@ class SecurityAuditLogger:
             ip_address: Client IP address
             user_agent: Client user agent
             method: Authentication method used
+            timestamp: Time of the attempt, defaults to the current time
         """
         event = {
             "event_type": "login_attempt",
@@ -423,11 +606,11 @@ class SecurityAuditLogger:
             "ip_address": ip_address,
             "user_agent": user_agent,
             "auth_method": method.value,
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": timestamp or datetime.now(UTC),
         }
 
         level = logging.INFO if success else logging.WARNING
-        self.logger.log(level, f"Login attempt: {json.dumps(event)}")
+        self._emit(level, "Login attempt", event)
 
     def log_permission_denied(
         self, user_id: str, resource: str, action: str, ip_address: str
@@ -446,10 +629,10 @@ class SecurityAuditLogger:
             "resource": resource,
             "action": action,
             "ip_address": ip_address,
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": datetime.now(UTC),
         }
 
-        self.logger.warning(f"Access denied: {json.dumps(event)}")
+        self._emit(logging.WARNING, "Access denied", event)
 
     def log_privilege_escalation(
         self, user_id: str, from_role: str, to_role: str, authorized_by: str
@@ -468,10 +651,10 @@ class SecurityAuditLogger:
             "from_role": from_role,
             "to_role": to_role,
             "authorized_by": authorized_by,
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": datetime.now(UTC),
         }
 
-        self.logger.warning(f"Privilege escalation: {json.dumps(event)}")
+        self._emit(logging.WARNING, "Privilege escalation", event)
 
 
 class RoleBasedAccessControl:
@@ -479,6 +662,20 @@ class RoleBasedAccessControl:
 
     def __init__(self):
         self.permissions = self._initialize_permissions()
+        # Per-role lookup table for check_permission: exact grants and the
+        # prefixes of wildcard grants ("search:*" -> "search:"), fetched
+        # together with one dict lookup
+        self._rules: dict[USARRole, tuple[frozenset[str], tuple[str, ...]]] = {}
+        self._perm_tuples: dict[USARRole, tuple[str, ...]] = {}
+        for role, perms in self.permissions.items():
+            self._perm_tuples[role] = tuple(perms)
+            self._rules[role] = (
+                frozenset(perms),
+                tuple(p[:-1] for p in perms if p.endswith("*")),
+            )
+        # Memoized decisions; roles and permission strings are few and
+        # repeat across the middleware and handler checks of one request
+        self._decisions = functools.lru_cache(maxsize=4096)(self._decide)
 
     def _initialize_permissions(self) -> dict[USARRole, list[str]]:
         """Initialize role-based permissions matrix.
@@ -610,45 +807,141 @@ class RoleBasedAccessControl:
         Returns:
             True if permission granted
         """
-        user_permissions = self.permissions.get(role, [])
+        return self._decisions(role, permission)
+
+    def _decide(self, role: USARRole, permission: str) -> bool:
+        """Evaluate a permission check against the lookup table."""
+        rules = self._rules.get(role)
+        if rules is None:
+            return False
+        exact, prefixes = rules
+        # Exact match, else every wildcard prefix in one C-level startswith
+        return permission in exact or permission.startswith(prefixes)
+
+    def get_user_permissions(self, role: USARRole) -> tuple[str, ...]:
+        """Get all permissions for role.
 
-        # Check exact permission match
-        if permission in user_permissions:
-            return True
+        Args:
+            role: User role
 
-        # Check wildcard permissions
-        for perm in user_permissions:
-            if perm.endswith("*"):
-                prefix = perm[:-1]
-                if permission.startswith(prefix):
-                    return True
+        Returns:
+            Tuple of permissions, shared between calls
+        """
+        return self._perm_tuples.get(role, ())
 
-        return False
 
-    def get_user_permissions(self, role: USARRole) -> list[str]:
-        """Get all permissions for role.
+class _LockoutTable:
+    """Failed-attempt counts and lockout deadlines as parallel arrays.
 
-        Args:
-            role: User role
+    Row i belongs to usernames[i]. Deadlines are epoch seconds, 0.0 when
+    the account is not locked. The login path updates these compact
+    arrays instead of the pydantic user model on every failure.
+    """
+
+    __slots__ = ("index", "usernames", "failed", "locked_until")
+
+    def __init__(self):
+        self.index: dict[str, int] = {}
+        self.usernames: list[str] = []
+        self.failed = array.array("i")
+        self.locked_until = array.array("d")
+
+    def add(self, username: str) -> None:
+        """Add a user with a clean record, or clear an existing one."""
+        row = self.index.get(username)
+        if row is None:
+            self.index[username] = len(self.usernames)
+            self.usernames.append(username)
+            self.failed.append(0)
+            self.locked_until.append(0.0)
+        else:
+            self.failed[row] = 0
+            self.locked_until[row] = 0.0
+
+    def is_locked(self, username: str, now_ts: float) -> bool:
+        """Check whether a user's lockout is still in force."""
+        row = self.index.get(username)
+        return row is not None and self.locked_until[row] > now_ts
+
+    def record_failure(
+        self, username: str, now_ts: float, max_attempts: int, lockout_seconds: float
+    ) -> int:
+        """Count a failed attempt, locking the user at max_attempts.
 
         Returns:
-            List of permissions
+            The user's failed attempt count
         """
-        return self.permissions.get(role, [])
+        row = self.index[username]
+        failed = self.failed[row] + 1
+        self.failed[row] = failed
+        if failed >= max_attempts:
+            self.locked_until[row] = now_ts + lockout_seconds
+        return failed
+
+    def reset(self, username: str) -> bool:
+        """Clear a user's failures and lockout.
+
+        Returns:
+            True if there was anything to clear
+        """
+        row = self.index[username]
+        if not self.failed[row] and not self.locked_until[row]:
+            return False
+        self.failed[row] = 0
+        self.locked_until[row] = 0.0
+        return True
+
+    def locked(self, now_ts: float) -> list[str]:
+        """Usernames whose lockout is still in force."""
+        if not self.usernames:
+            return []
+        if np is not None:
+            rows = np.flatnonzero(np.frombuffer(self.locked_until) > now_ts)
+        else:
+            rows = [i for i, until in enumerate(self.locked_until) if until > now_ts]
+        return [self.usernames[i] for i in rows]
+
+    def failing(self, min_failed: int) -> list[str]:
+        """Usernames with at least min_failed failed attempts."""
+        if not self.usernames:
+            return []
+        if np is not None:
+            rows = np.flatnonzero(np.frombuffer(self.failed, np.intc) >= min_failed)
+        else:
+            rows = [i for i, failed in enumerate(self.failed) if failed >= min_failed]
+        return [self.usernames[i] for i in rows]
+
+
+@functools.lru_cache(maxsize=4)
+def _dummy_hash(rounds: int) -> str:
+    """Hash a random password once per bcrypt cost factor."""
+    return PasswordManager(rounds).hash_password(secrets.token_urlsafe(32))
 
 
 class USARAuthenticationManager:
     """Main authentication manager for Federal USAR MCP."""
 
     def __init__(self):
-        self.config = SecurityConfig()
+        self.config = get_security_config()
         self.password_mgr = PasswordManager()
         self.jwt_mgr = JWTManager(self.config)
         self.two_factor = TwoFactorAuth()
         self.audit_logger = SecurityAuditLogger()
         self.rbac = RoleBasedAccessControl()
         self._user_store: dict[str, USARUser] = {}
-        self._sessions: dict[str, dict[str, Any]] = {}
+        self._users_by_id: dict[str, USARUser] = {}
+        self._password_hashes: dict[str, str] = {}
+        self._lockout = _LockoutTable()
+        self._sessions: dict[str, Session] = {}
+        self._sessions_by_user: dict[str, set[str]] = {}
+        # (expire_ts, session_id) min-heap; ended sessions are skipped lazily
+        self._session_heap: list[tuple[float, str]] = []
+        # bcrypt releases the GIL while hashing, so threads verify in parallel
+        self._hash_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count(), thread_name_prefix="bcrypt"
+        )
+        # Hash of a random password, checked for unknown users
+        self._dummy_hash = _dummy_hash(self.password_mgr.rounds)
 
     def register_user(
         self,
@@ -684,7 +977,7 @@ class USARAuthenticationManager:
             )
 
         # Hash password
-        self.password_mgr.hash_password(password)
+        password_hash = self.password_mgr.hash_password(password)
 
         # Create user
         user = USARUser(
@@ -699,7 +992,13 @@ class USARAuthenticationManager:
         )
 
         # Store user (in production, this would be a database)
+        previous = self._user_store.get(username)
+        if previous is not None:
+            self._users_by_id.pop(previous.user_id, None)
         self._user_store[username] = user
+        self._users_by_id[user.user_id] = user
+        self._password_hashes[username] = password_hash
+        self._lockout.add(username)
 
         logger.info(f"Registered new USAR user: {username} ({usar_role.value})")
         return user
@@ -722,53 +1021,192 @@ class USARAuthenticationManager:
         Returns:
             User object if authentication successful, None otherwise
         """
+        now = datetime.now(UTC)
+        user, password_hash = self._begin_login(username, ip_address, user_agent, now)
+        if password_hash is None:
+            return None
+
+        verified = self.password_mgr.verify_password(password, password_hash)
+        if user is None:
+            return None
+        return self._finish_login(user, verified, ip_address, user_agent, now)
+
+    async def authenticate_user_async(
+        self,
+        username: str,
+        password: str,
+        ip_address: str = "unknown",
+        user_agent: str = "unknown",
+    ) -> USARUser | None:
+        """Authenticate user credentials without blocking the event loop.
+
+        The bcrypt check runs on the hashing thread pool, so concurrent
+        logins verify in parallel.
+
+        Args:
+            username: Username
+            password: Password
+            ip_address: Client IP address
+            user_agent: Client user agent
+
+        Returns:
+            User object if authentication successful, None otherwise
+        """
+        now = datetime.now(UTC)
+        user, password_hash = self._begin_login(username, ip_address, user_agent, now)
+        if password_hash is None:
+            return None
+
+        verified = await asyncio.get_running_loop().run_in_executor(
+            self._hash_pool, self.password_mgr.verify_password, password, password_hash
+        )
+        if user is None:
+            return None
+        return self._finish_login(user, verified, ip_address, user_agent, now)
+
+    def _begin_login(
+        self, username: str, ip_address: str, user_agent: str, now: datetime
+    ) -> tuple[USARUser | None, str | None]:
+        """Look up a user who may log in, logging the failure otherwise.
+
+        Returns:
+            The user and the hash to check the password against. Unknown
+            and inactive users get no user but the dummy hash, so they
+            cost the same bcrypt check as a real login and response timing
+            does not reveal which usernames exist. Locked accounts get
+            neither.
+        """
         user = self._user_store.get(username)
 
         if not user or not user.active:
             self.audit_logger.log_login_attempt(
-                username, False, ip_address, user_agent, AuthenticationMethod.PASSWORD
+                username,
+                False,
+                ip_address,
+                user_agent,
+                AuthenticationMethod.PASSWORD,
+                now,
             )
-            return None
+            return None, self._dummy_hash
 
         # Check account lockout
-        if user.locked_until and datetime.now(UTC) < user.locked_until:
+        if self._lockout.is_locked(username, now.timestamp()):
             self.audit_logger.log_login_attempt(
-                username, False, ip_address, user_agent, AuthenticationMethod.PASSWORD
+                username,
+                False,
+                ip_address,
+                user_agent,
+                AuthenticationMethod.PASSWORD,
+                now,
+            )
+            return None, None
+
+        return user, self._password_hashes.get(username, self._dummy_hash)
+
+    def _finish_login(
+        self,
+        user: USARUser,
+        verified: bool,
+        ip_address: str,
+        user_agent: str,
+        now: datetime,
+    ) -> USARUser | None:
+        """Record the outcome of a password check for a user.
+
+        now is the time the login started; it stamps the lockout, the last
+        login and the audit event. Failures are counted in the lockout
+        table; the user model's failed_attempts and locked_until are only
+        written when the account locks or a successful login clears it.
+        The lockout is checked again here because concurrent async logins
+        can lock the account while this password check runs; a correct
+        password then fails without clearing that lock.
+        """
+        if verified and self._lockout.is_locked(user.username, now.timestamp()):
+            self.audit_logger.log_login_attempt(
+                user.username,
+                False,
+                ip_address,
+                user_agent,
+                AuthenticationMethod.PASSWORD,
+                now,
             )
             return None
 
-        # Verify password (simplified - would check against stored hash)
-        if not self._verify_stored_password(username, password):
-            user.failed_attempts += 1
-            if user.failed_attempts >= self.config.MAX_LOGIN_ATTEMPTS:
-                user.locked_until = datetime.now(UTC) + timedelta(
-                    minutes=self.config.ACCOUNT_LOCKOUT_MINUTES
-                )
+        if not verified:
+            lockout = timedelta(minutes=self.config.ACCOUNT_LOCKOUT_MINUTES)
+            failed = self._lockout.record_failure(
+                user.username,
+                now.timestamp(),
+                self.config.MAX_LOGIN_ATTEMPTS,
+                lockout.total_seconds(),
+            )
+            if failed >= self.config.MAX_LOGIN_ATTEMPTS:
+                user.failed_attempts = failed
+                user.locked_until = now + lockout
 
             self.audit_logger.log_login_attempt(
-                username, False, ip_address, user_agent, AuthenticationMethod.PASSWORD
+                user.username,
+                False,
+                ip_address,
+                user_agent,
+                AuthenticationMethod.PASSWORD,
+                now,
             )
             return None
 
         # Reset failed attempts on successful login
-        user.failed_attempts = 0
-        user.locked_until = None
-        user.last_login = datetime.now(UTC)
+        if self._lockout.reset(user.username):
+            user.failed_attempts = 0
+            user.locked_until = None
+        user.last_login = now
 
         self.audit_logger.log_login_attempt(
-            username, True, ip_address, user_agent, AuthenticationMethod.PASSWORD
+            user.username,
+            True,
+            ip_address,
+            user_agent,
+            AuthenticationMethod.PASSWORD,
+            now,
         )
 
         return user
 
+    def list_locked_users(self, now_ts: float | None = None) -> list[str]:
+        """List usernames that are currently locked out.
+
+        Args:
+            now_ts: Current epoch seconds (defaults to time.time())
+
+        Returns:
+            Locked usernames in registration order
+        """
+        return self._lockout.locked(time.time() if now_ts is None else now_ts)
+
+    def list_users_with_failures(self, min_attempts: int = 1) -> list[str]:
+        """List usernames with at least min_attempts failed logins.
+
+        Args:
+            min_attempts: Minimum failed attempt count
+
+        Returns:
+            Matching usernames in registration order
+        """
+        return self._lockout.failing(min_attempts)
+
+    def get_user_by_id(self, user_id: str) -> USARUser | None:
+        """Look up a user by user ID, such as a token's sub claim.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            User object, or None if no user has that ID
+        """
+        return self._users_by_id.get(user_id)
+
     def _generate_user_id(self) -> str:
         """Generate unique user ID."""
-        return f"usr_{secrets.token_urlsafe(8)}"
-
-    def _verify_stored_password(self, username: str, password: str) -> bool:
-        """Verify password against stored hash (simplified implementation)."""
-        # In production, this would verify against stored password hash
-        return True  # Simplified for demo
+        return f"usr_{secrets.token_hex(8)}"
 
     def create_session(self, user: USARUser) -> dict[str, str]:
         """Create user session with tokens.
@@ -779,17 +1217,21 @@ class USARAuthenticationManager:
         Returns:
             Session tokens
         """
+        now = datetime.now(UTC)
         permissions = self.rbac.get_user_permissions(user.usar_role)
-        access_token = self.jwt_mgr.create_access_token(user, permissions)
-        refresh_token = self.jwt_mgr.create_refresh_token(user)
-
-        session_id = secrets.token_urlsafe(32)
-        self._sessions[session_id] = {
-            "user_id": user.user_id,
-            "created_at": datetime.now(UTC),
-            "last_activity": datetime.now(UTC),
-            "permissions": permissions,
-        }
+        access_token = self.jwt_mgr.create_access_token(user, permissions, now)
+        refresh_token = self.jwt_mgr.create_refresh_token(user, now)
+
+        now_ts = now.timestamp()
+        self.expire_sessions(now_ts)
+
+        session_id = secrets.token_hex(32)
+        expire_ts = now_ts + self.config.SESSION_TIMEOUT_MINUTES * 60
+        self._sessions[session_id] = Session(
+            user.user_id, now_ts, now_ts, expire_ts, permissions
+        )
+        self._sessions_by_user.setdefault(user.user_id, set()).add(session_id)
+        heapq.heappush(self._session_heap, (expire_ts, session_id))
 
         return {
             "access_token": access_token,
@@ -798,3 +1240,60 @@ class USARAuthenticationManager:
             "token_type": "bearer",
             "expires_in": self.config.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
         }
+
+    def end_session(self, session_id: str) -> bool:
+        """End a single session.
+
+        Args:
+            session_id: Session to end
+
+        Returns:
+            True if the session existed
+        """
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return False
+        user_sessions = self._sessions_by_user.get(session.user_id)
+        if user_sessions is not None:
+            user_sessions.discard(session_id)
+            if not user_sessions:
+                del self._sessions_by_user[session.user_id]
+        return True
+
+    def expire_sessions(self, now_ts: float | None = None) -> int:
+        """End sessions whose timeout has passed.
+
+        Only expired entries at the head of the expiry heap are visited.
+
+        Args:
+            now_ts: Current epoch seconds (defaults to time.time())
+
+        Returns:
+            Number of sessions ended
+        """
+        if now_ts is None:
+            now_ts = time.time()
+        heap = self._session_heap
+        expired = 0
+        while heap and heap[0][0] <= now_ts:
+            expire_ts, session_id = heapq.heappop(heap)
+            session = self._sessions.get(session_id)
+            # Sessions already ended leave a stale heap entry behind
+            if session is not None and session.expire_ts == expire_ts:
+                self.end_session(session_id)
+                expired += 1
+        return expired
+
+    def revoke_user_sessions(self, user_id: str) -> int:
+        """End every session belonging to a user.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Number of sessions ended
+        """
+        session_ids = self._sessions_by_user.pop(user_id, set())
+        for session_id in session_ids:
+            self._sessions.pop(session_id, None)
+        return len(session_ids)
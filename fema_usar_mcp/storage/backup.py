@@ -5,6 +5,7 @@ for critical USAR operational data.
 """
 
 import asyncio
+import base64
 import gzip
 import hashlib
 import json
@@ -12,17 +13,31 @@ import logging
 import os
 import secrets
 import shutil
+import tarfile
 import tempfile
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError, NoCredentialsError
+from cryptography.exceptions import InvalidSignature
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import hmac as crypto_hmac
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from sqlalchemy import create_engine, text
 
+# zstandard is optional (performance extra); without it backups are
+# compressed with gzip instead
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -80,6 +95,7 @@ class BackupMetadata:
         error_message: str | None = None,
         file_path: str | None = None,
         s3_key: str | None = None,
+        file_size: int = 0,
     ):
         self.backup_id = backup_id
         self.backup_type = backup_type
@@ -93,6 +109,8 @@ class BackupMetadata:
         self.error_message = error_message
         self.file_path = file_path
         self.s3_key = s3_key
+        # Size of the stored artifact, after compression and encryption
+        self.file_size = file_size
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -111,9 +129,46 @@ class BackupMetadata:
             "error_message": self.error_message,
             "file_path": self.file_path,
             "s3_key": self.s3_key,
+            "file_size": self.file_size,
         }
 
 
+# Encrypted backup layout: MAGIC + 16-byte CTR nonce, the AES-256-CTR
+# ciphertext, then an HMAC-SHA256 tag over everything before it
+_ENC_MAGIC = b"USARENC\x01"
+_ENC_NONCE_SIZE = 16
+_ENC_TAG_SIZE = 32
+_ENC_CHUNK_SIZE = 1024 * 1024
+# Extension for newly compressed backups; restore accepts either
+_COMPRESSED_SUFFIX = ".zst" if zstandard is not None else ".gz"
+_ZSTD_LEVEL = 3
+_COPY_SIZE = 1024 * 1024
+# Multipart settings for backup transfers; 64 MiB parts keep per-request
+# overhead low on multi-GB files
+_S3_PART_SIZE = 64 * 1024 * 1024
+_S3_MAX_CONCURRENCY = 16
+# Size of one Fernet token for a full 64 KiB chunk in the pre-AES-CTR format
+_LEGACY_TOKEN_SIZE = 87480
+
+
+def _extract_archive(tar: tarfile.TarFile, path: str) -> None:
+    """Extract a backup archive, refusing members that would escape ``path``."""
+    if hasattr(tarfile, "data_filter"):
+        tar.extractall(path, filter="data")
+        return
+
+    # Extraction filters arrived in Python 3.11.4; pg_dump archives only hold
+    # regular files and directories, so anything else is rejected
+    root = os.path.realpath(path)
+    for member in tar.getmembers():
+        target = os.path.realpath(os.path.join(root, member.name))
+        if os.path.commonpath([root, target]) != root or not (
+            member.isfile() or member.isdir()
+        ):
+            raise tarfile.TarError(f"Unsafe member in backup archive: {member.name}")
+    tar.extractall(path)
+
+
 class EncryptionManager:
     """Encryption manager for backup data."""
 
@@ -124,24 +179,47 @@ class EncryptionManager:
             encryption_key: Fernet encryption key
         """
         self.fernet = Fernet(encryption_key)
-
-    def encrypt_file(self, input_path: str, output_path: str) -> None:
+        # Independent AES and HMAC keys derived from the configured key
+        derived = HKDF(
+            algorithm=hashes.SHA256(),
+            length=64,
+            salt=None,
+            info=b"fema-usar-backup-encryption",
+        ).derive(base64.urlsafe_b64decode(encryption_key))
+        self._aes_key = derived[:32]
+        self._mac_key = derived[32:]
+
+    def encrypt_file(self, input_path: str, output_path: str) -> str:
         """Encrypt file.
 
         Args:
             input_path: Path to input file
             output_path: Path to encrypted output file
+
+        Returns:
+            SHA-256 checksum of the encrypted output, computed while writing
         """
-        with open(input_path, "rb") as infile:
-            with open(output_path, "wb") as outfile:
-                # Process file in chunks for large files
-                chunk_size = 64 * 1024  # 64KB chunks
-                while True:
-                    chunk = infile.read(chunk_size)
-                    if not chunk:
-                        break
-                    encrypted_chunk = self.fernet.encrypt(chunk)
-                    outfile.write(encrypted_chunk)
+        nonce = os.urandom(_ENC_NONCE_SIZE)
+        encryptor = Cipher(algorithms.AES(self._aes_key), modes.CTR(nonce)).encryptor()
+        mac = crypto_hmac.HMAC(self._mac_key, hashes.SHA256())
+        header = _ENC_MAGIC + nonce
+        mac.update(header)
+        checksum = hashlib.sha256(header)
+
+        buf = bytearray(_ENC_CHUNK_SIZE)
+        out = memoryview(bytearray(_ENC_CHUNK_SIZE))
+        view = memoryview(buf)
+        with open(input_path, "rb") as infile, open(output_path, "wb") as outfile:
+            outfile.write(header)
+            while n := infile.readinto(buf):
+                encryptor.update_into(view[:n], out)
+                mac.update(out[:n])
+                checksum.update(out[:n])
+                outfile.write(out[:n])
+            tag = mac.finalize()
+            checksum.update(tag)
+            outfile.write(tag)
+        return checksum.hexdigest()
 
     def decrypt_file(self, input_path: str, output_path: str) -> None:
         """Decrypt file.
@@ -149,17 +227,51 @@ class EncryptionManager:
         Args:
             input_path: Path to encrypted input file
             output_path: Path to decrypted output file
+
+        Raises:
+            cryptography.exceptions.InvalidSignature: If the file was modified
+                or truncated
         """
         with open(input_path, "rb") as infile:
+            header = infile.read(len(_ENC_MAGIC) + _ENC_NONCE_SIZE)
+            if not header.startswith(_ENC_MAGIC):
+                infile.seek(0)
+                self._decrypt_legacy(infile, output_path)
+                return
+
+            remaining = os.fstat(infile.fileno()).st_size - len(header) - _ENC_TAG_SIZE
+            if remaining < 0:
+                raise InvalidSignature("Encrypted backup is truncated")
+            nonce = header[len(_ENC_MAGIC) :]
+            decryptor = Cipher(
+                algorithms.AES(self._aes_key), modes.CTR(nonce)
+            ).decryptor()
+            mac = crypto_hmac.HMAC(self._mac_key, hashes.SHA256())
+            mac.update(header)
+
+            buf = bytearray(_ENC_CHUNK_SIZE)
+            out = memoryview(bytearray(_ENC_CHUNK_SIZE))
+            view = memoryview(buf)
             with open(output_path, "wb") as outfile:
-                # Process file in chunks
-                chunk_size = 64 * 1024
-                while True:
-                    encrypted_chunk = infile.read(chunk_size)
-                    if not encrypted_chunk:
+                while remaining > 0:
+                    n = infile.readinto(view[: min(remaining, _ENC_CHUNK_SIZE)])
+                    if not n:
                         break
-                    chunk = self.fernet.decrypt(encrypted_chunk)
-                    outfile.write(chunk)
+                    remaining -= n
+                    mac.update(view[:n])
+                    decryptor.update_into(view[:n], out)
+                    outfile.write(out[:n])
+            try:
+                mac.verify(infile.read(_ENC_TAG_SIZE))
+            except InvalidSignature:
+                os.remove(output_path)
+                raise
+
+    def _decrypt_legacy(self, infile: BinaryIO, output_path: str) -> None:
+        """Decrypt a backup written as concatenated per-chunk Fernet tokens."""
+        with open(output_path, "wb") as outfile:
+            while token := infile.read(_LEGACY_TOKEN_SIZE):
+                outfile.write(self.fernet.decrypt(token))
 
     def calculate_checksum(self, file_path: str) -> str:
         """Calculate SHA-256 checksum of file.
@@ -170,11 +282,9 @@ class EncryptionManager:
         Returns:
             SHA-256 checksum
         """
-        hash_sha256 = hashlib.sha256()
+        # file_digest hashes in C with the GIL released
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
-        return hash_sha256.hexdigest()
+            return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 class S3BackupStorage:
@@ -190,6 +300,12 @@ class S3BackupStorage:
         self.bucket_name = bucket_name
         self.region = region
         self.s3_client = boto3.client("s3", region_name=region)
+        self.transfer_config = TransferConfig(
+            multipart_threshold=_S3_PART_SIZE,
+            multipart_chunksize=_S3_PART_SIZE,
+            max_concurrency=_S3_MAX_CONCURRENCY,
+            use_threads=True,
+        )
 
     def upload_backup(self, local_path: str, s3_key: str) -> bool:
         """Upload backup to S3.
@@ -215,6 +331,7 @@ class S3BackupStorage:
                         "upload_time": datetime.now(UTC).isoformat(),
                     },
                 },
+                Config=self.transfer_config,
             )
 
             logger.info(f"Uploaded backup to S3: {s3_key}")
@@ -235,7 +352,9 @@ class S3BackupStorage:
             True if download successful
         """
         try:
-            self.s3_client.download_file(self.bucket_name, s3_key, local_path)
+            self.s3_client.download_file(
+                self.bucket_name, s3_key, local_path, Config=self.transfer_config
+            )
             logger.info(f"Downloaded backup from S3: {s3_key}")
             return True
 
@@ -336,31 +455,25 @@ class DatabaseBackupEngine:
             backup_dir = Path(self.config.backup_directory) / backup_id
             backup_dir.mkdir(parents=True, exist_ok=True)
 
-            # Create database dump
-            dump_file = backup_dir / "database.sql"
+            # Create database dump; pg_dump compresses each table itself, so
+            # the archive is not compressed a second time
+            dump_file = backup_dir / "database.tar"
             self._create_pg_dump(str(dump_file))
 
-            # Get original size
             metadata.backup_size = dump_file.stat().st_size
-
-            # Compress if enabled
-            if self.config.compression_enabled:
-                compressed_file = backup_dir / "database.sql.gz"
-                self._compress_file(str(dump_file), str(compressed_file))
-                dump_file.unlink()  # Remove uncompressed file
-                dump_file = compressed_file
-
-            metadata.compressed_size = dump_file.stat().st_size
+            metadata.compressed_size = metadata.backup_size
 
             # Encrypt if enabled
+            checksum = None
             if self.config.encryption_enabled:
-                encrypted_file = backup_dir / "database.sql.gz.enc"
-                self.encryption_mgr.encrypt_file(str(dump_file), str(encrypted_file))
+                encrypted_file = backup_dir / f"{dump_file.name}.enc"
+                checksum = self.encryption_mgr.encrypt_file(
+                    str(dump_file), str(encrypted_file)
+                )
                 dump_file.unlink()  # Remove unencrypted file
                 dump_file = encrypted_file
 
-            metadata.file_path = str(dump_file)
-            metadata.checksum = self.encryption_mgr.calculate_checksum(str(dump_file))
+            self._record_backup_file(dump_file, metadata, checksum)
 
             # Upload to S3 if configured
             if self.s3_storage:
@@ -489,13 +602,15 @@ class DatabaseBackupEngine:
             return False
 
     def _create_pg_dump(self, output_file: str) -> None:
-        """Create PostgreSQL dump."""
+        """Create PostgreSQL dump as a tar of a directory-format archive."""
         import subprocess
 
         # Parse database URL for pg_dump
         from urllib.parse import urlparse
 
         parsed = urlparse(self.config.database_url)
+        dump_dir = f"{output_file}.d"
+        compress = 3 if self.config.compression_enabled else 0
 
         cmd = [
             "pg_dump",
@@ -503,32 +618,55 @@ class DatabaseBackupEngine:
             f"--port={parsed.port or 5432}",
             f"--username={parsed.username}",
             f"--dbname={parsed.path[1:]}",  # Remove leading slash
-            "--format=custom",
-            "--compress=9",
+            "--format=directory",
+            f"--jobs={os.cpu_count() or 1}",
+            f"--compress={compress}",
             "--no-owner",
             "--no-privileges",
-            f"--file={output_file}",
+            f"--file={dump_dir}",
         ]
 
         env = os.environ.copy()
         env["PGPASSWORD"] = parsed.password
 
-        result = subprocess.run(cmd, env=env, capture_output=True, text=True)
+        try:
+            result = subprocess.run(cmd, env=env, capture_output=True, text=True)
 
-        if result.returncode != 0:
-            raise Exception(f"pg_dump failed: {result.stderr}")
+            if result.returncode != 0:
+                raise Exception(f"pg_dump failed: {result.stderr}")
+
+            # Store-only tar: the table files are already compressed
+            with tarfile.open(output_file, "w") as tar:
+                tar.add(dump_dir, arcname="database")
+        finally:
+            shutil.rmtree(dump_dir, ignore_errors=True)
 
     def _compress_file(self, input_file: str, output_file: str) -> None:
-        """Compress file using gzip."""
-        with open(input_file, "rb") as f_in:
-            with gzip.open(output_file, "wb") as f_out:
-                shutil.copyfileobj(f_in, f_out)
+        """Compress file with zstd or gzip, chosen by the output extension."""
+        if not output_file.endswith(".zst"):
+            with open(input_file, "rb") as f_in:
+                with gzip.open(output_file, "wb") as f_out:
+                    shutil.copyfileobj(f_in, f_out)
+            return
+
+        # threads=-1 runs one libzstd worker per core
+        cctx = zstandard.ZstdCompressor(level=_ZSTD_LEVEL, threads=-1)
+        with open(input_file, "rb") as f_in, open(output_file, "wb") as f_out:
+            cctx.copy_stream(f_in, f_out, read_size=_COPY_SIZE, write_size=_COPY_SIZE)
 
     def _decompress_file(self, input_file: str, output_file: str) -> None:
-        """Decompress gzip file."""
-        with gzip.open(input_file, "rb") as f_in:
-            with open(output_file, "wb") as f_out:
-                shutil.copyfileobj(f_in, f_out)
+        """Decompress a zstd or gzip file, chosen by the input extension."""
+        if not input_file.endswith(".zst"):
+            with gzip.open(input_file, "rb") as f_in:
+                with open(output_file, "wb") as f_out:
+                    shutil.copyfileobj(f_in, f_out)
+            return
+
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to restore .zst backups")
+        dctx = zstandard.ZstdDecompressor()
+        with open(input_file, "rb") as f_in, open(output_file, "wb") as f_out:
+            dctx.copy_stream(f_in, f_out, read_size=_COPY_SIZE, write_size=_COPY_SIZE)
 
     def _backup_configuration(self, backup_dir: Path) -> None:
         """Backup configuration files."""
@@ -621,7 +759,7 @@ class DatabaseBackupEngine:
 
         # Compress if enabled
         if self.config.compression_enabled:
-            compressed_file = backup_dir / f"{current_file.stem}.gz"
+            compressed_file = backup_dir / f"{current_file.stem}{_COMPRESSED_SUFFIX}"
             self._compress_file(str(current_file), str(compressed_file))
             current_file.unlink()
             current_file = compressed_file
@@ -629,14 +767,16 @@ class DatabaseBackupEngine:
         metadata.compressed_size = current_file.stat().st_size
 
         # Encrypt if enabled
+        checksum = None
         if self.config.encryption_enabled:
             encrypted_file = backup_dir / f"{current_file.name}.enc"
-            self.encryption_mgr.encrypt_file(str(current_file), str(encrypted_file))
+            checksum = self.encryption_mgr.encrypt_file(
+                str(current_file), str(encrypted_file)
+            )
             current_file.unlink()
             current_file = encrypted_file
 
-        metadata.file_path = str(current_file)
-        metadata.checksum = self.encryption_mgr.calculate_checksum(str(current_file))
+        self._record_backup_file(current_file, metadata, checksum)
 
         # Upload to S3 if configured
         if self.s3_storage:
@@ -649,6 +789,20 @@ class DatabaseBackupEngine:
 
         return metadata
 
+    def _record_backup_file(
+        self, file_path: Path, metadata: BackupMetadata, checksum: str | None
+    ) -> None:
+        """Record the final backup artifact in its metadata.
+
+        ``checksum`` is the digest computed while the file was written, if
+        any; otherwise the file is hashed here.
+        """
+        metadata.file_path = str(file_path)
+        metadata.file_size = file_path.stat().st_size
+        metadata.checksum = checksum or self.encryption_mgr.calculate_checksum(
+            str(file_path)
+        )
+
     def _prepare_restore_file(self, backup_file: str, metadata: BackupMetadata) -> str:
         """Prepare backup file for restore."""
         current_file = backup_file
@@ -660,8 +814,8 @@ class DatabaseBackupEngine:
             current_file = decrypted_file
 
         # Decompress if needed
-        if self.config.compression_enabled and current_file.endswith(".gz"):
-            decompressed_file = current_file[:-3]  # Remove .gz extension
+        if self.config.compression_enabled and current_file.endswith((".zst", ".gz")):
+            decompressed_file = current_file.rpartition(".")[0]
             self._decompress_file(current_file, decompressed_file)
             current_file = decompressed_file
 
@@ -683,13 +837,25 @@ class DatabaseBackupEngine:
             "--clean",
             "--no-owner",
             "--no-privileges",
-            backup_file,
         ]
 
         env = os.environ.copy()
         env["PGPASSWORD"] = parsed.password
 
-        result = subprocess.run(cmd, env=env, capture_output=True, text=True)
+        # Unpack beside the backup: the system temp dir is often tmpfs or a
+        # small root partition that cannot hold a large database dump
+        with tempfile.TemporaryDirectory(
+            dir=os.path.dirname(os.path.abspath(backup_file))
+        ) as extract_dir:
+            if backup_file.endswith(".tar"):
+                # Directory-format archive; older backups are a custom-format file
+                with tarfile.open(backup_file) as tar:
+                    _extract_archive(tar, extract_dir)
+                backup_file = os.path.join(extract_dir, "database")
+                cmd.append(f"--jobs={os.cpu_count() or 1}")
+            cmd.append(backup_file)
+
+            result = subprocess.run(cmd, env=env, capture_output=True, text=True)
 
         if result.returncode != 0:
             raise Exception(f"pg_restore failed: {result.stderr}")
@@ -712,18 +878,15 @@ class DatabaseBackupEngine:
             if not os.path.exists(metadata.file_path):
                 return False
 
-            current_checksum = self.encryption_mgr.calculate_checksum(
-                metadata.file_path
-            )
-            if current_checksum != metadata.checksum:
-                return False
-
-            # Check file size is reasonable
+            # Check file size is reasonable before reading the whole file
             file_size = os.path.getsize(metadata.file_path)
-            if file_size != metadata.compressed_size:
+            if file_size != metadata.file_size:
                 return False
 
-            return True
+            current_checksum = self.encryption_mgr.calculate_checksum(
+                metadata.file_path
+            )
+            return current_checksum == metadata.checksum
 
         except Exception as e:
             logger.error(f"Backup verification failed: {str(e)}")
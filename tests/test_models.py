@@ -0,0 +1,783 @@
+"""Tests for FEMA USAR domain models."""
+
+import dataclasses
+import json
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from fema_usar_mcp.models import (
+    GPS,
+    EmergencyContact,
+    EquipmentCategory,
+    EquipmentModel,
+    LocationStore,
+    MaintenanceRecord,
+    MissionAssignment,
+    OperationalTimeline,
+    PersonnelLocation,
+    PersonnelModel,
+    PersonnelQualification,
+    TimelineEvent,
+    maintenance_store,
+    parse_dt,
+    serialize_roster,
+    timestamp_batch,
+    validate_roster_json,
+)
+from fema_usar_mcp.models.personnel import PersonnelStatus
+
+
+@pytest.fixture
+def personnel_data():
+    """Minimal valid personnel record."""
+    return {
+        "person_id": "P-001",
+        "name": "Jane Rescuer",
+        "task_force": "CA-TF1",
+        "home_agency": "LA County Fire",
+        "primary_specialty": "Rescue Specialist",
+    }
+
+
+class TestModelTimestamps:
+    """Tests for integer millisecond timestamp fields."""
+
+    @pytest.mark.unit
+    def test_personnel_timestamps_are_unix_ms(self, personnel_data):
+        """Test that personnel creation timestamps are stored as Unix ms."""
+        person = PersonnelModel(**personnel_data)
+        created, updated = person.timestamps
+        assert isinstance(created, int)
+        assert created == updated
+        assert isinstance(person.created_date, datetime)
+        assert abs(person.created_date - datetime.now()).total_seconds() < 5
+
+    @pytest.mark.unit
+    def test_legacy_timestamp_keys_are_kept(self, personnel_data):
+        """Test that created_date/last_updated input maps onto timestamps."""
+        created = datetime(2020, 3, 1, 8, 30)
+        person = PersonnelModel(
+            **personnel_data,
+            created_date=created.isoformat(),
+            last_updated=datetime(2021, 1, 1),
+        )
+        assert person.created_date == created
+        assert person.last_updated == datetime(2021, 1, 1)
+
+        trusted = PersonnelModel.from_trusted_row(
+            **personnel_data, created_date=created
+        )
+        assert trusted.timestamps == (person.timestamps[0],) * 2
+
+        equipment = EquipmentModel(
+            equipment_id="EQ-LEGACY-1",
+            equipment_name="Search Camera",
+            category=EquipmentCategory.SEARCH,
+            home_cache="Cache A",
+            last_updated=created,
+        )
+        assert equipment.created_date == equipment.last_updated == created
+
+    @pytest.mark.unit
+    def test_touch_updates_only_last_updated(self, personnel_data):
+        """Test that touch() advances last_updated and keeps created_date."""
+        person = PersonnelModel(**personnel_data, timestamps=(1_000, 1_000))
+        person.touch()
+        assert person.timestamps[0] == 1_000
+        assert person.last_updated > person.created_date
+
+    @pytest.mark.unit
+    def test_timestamp_batch_shares_one_clock_read(self, personnel_data):
+        """Test that records created in a batch share the batch timestamp."""
+        with timestamp_batch() as batch_now:
+            people = [PersonnelModel(**personnel_data) for _ in range(3)]
+            location = PersonnelLocation(
+                person_id="P-001", location_name="Base", location_type="command_post"
+            )
+        assert {p.timestamps for p in people} == {(batch_now, batch_now)}
+        assert location.timestamp == batch_now
+        assert PersonnelModel(**personnel_data).timestamps[0] >= batch_now
+
+    @pytest.mark.unit
+    def test_equipment_and_mission_timestamps(self):
+        """Test that equipment and mission timestamps expose datetime views."""
+        equipment = EquipmentModel(
+            equipment_id="EQ-001",
+            equipment_name="Delsar",
+            category=EquipmentCategory.SEARCH,
+            home_cache="Cache A",
+        )
+        mission = MissionAssignment(
+            mission_id="M-001",
+            mission_name="Sector 4 search",
+            mission_type="search",
+            requesting_agency="FEMA",
+            location="Sector 4",
+            mission_description="Primary search of sector 4",
+        )
+        assert isinstance(equipment.last_updated, datetime)
+        assert isinstance(mission.assigned_date, int)
+        assert mission.assigned_date_dt.year == datetime.now().year
+
+    @pytest.mark.unit
+    def test_location_timestamp_round_trip(self):
+        """Test that an explicit location timestamp converts back to datetime."""
+        location = PersonnelLocation(
+            person_id="P-001",
+            location_name="Base of Operations",
+            location_type="command_post",
+            timestamp=1_700_000_000_000,
+        )
+        assert location.timestamp_dt == datetime.fromtimestamp(1_700_000_000)
+
+
+class TestGPSCoordinates:
+    """Tests for the GPS coordinate pair type."""
+
+    @pytest.mark.unit
+    def test_gps_accepts_tuple_and_legacy_dict(self):
+        """Test that GPS fields validate from tuples and lat/lon dicts."""
+        from_tuple = PersonnelLocation(
+            person_id="P-001",
+            location_name="Sector 4",
+            location_type="operations_area",
+            gps_coordinates=(34.05, -118.24),
+        )
+        from_dict = PersonnelLocation(
+            person_id="P-001",
+            location_name="Sector 4",
+            location_type="operations_area",
+            gps_coordinates={"lat": 34.05, "lon": -118.24},
+        )
+        assert from_tuple.gps_coordinates == GPS(34.05, -118.24)
+        assert from_dict.gps_coordinates.lat == 34.05
+        assert from_dict.gps_coordinates.lon == -118.24
+
+
+class TestMaintenanceStore:
+    """Tests for the external maintenance history store."""
+
+    @pytest.mark.unit
+    def test_equipment_reads_history_from_store(self):
+        """Test that equipment maintenance history is looked up by ID."""
+        equipment = EquipmentModel(
+            equipment_id="EQ-STORE-1",
+            equipment_name="Hydraulic Spreader",
+            category=EquipmentCategory.RESCUE,
+            home_cache="Cache B",
+        )
+        assert equipment.maintenance_records == ()
+        assert "maintenance_records" not in equipment.model_dump()
+
+        record = MaintenanceRecord(
+            maintenance_id="MR-1",
+            equipment_id="EQ-STORE-1",
+            maintenance_type="preventive",
+            maintenance_date=datetime(2024, 8, 1),
+            performed_by="Logistics",
+            description="Hydraulic fluid replaced",
+        )
+        maintenance_store.add(record)
+        try:
+            history = equipment.maintenance_records
+            assert history == (record,)
+            assert maintenance_store.get("EQ-STORE-1") is not history
+        finally:
+            maintenance_store.remove("EQ-STORE-1")
+
+    @pytest.mark.unit
+    def test_equipment_history_passed_in_goes_to_store(self):
+        """Test that maintenance_records given on input are kept in the store."""
+        row = {
+            "equipment_id": "EQ-STORE-2",
+            "equipment_name": "Air Bag Kit",
+            "category": EquipmentCategory.RESCUE,
+            "home_cache": "Cache B",
+            "maintenance_records": [
+                {
+                    "maintenance_id": "MR-2",
+                    "maintenance_type": "inspection",
+                    "maintenance_date": "2024-08-01T00:00:00",
+                    "performed_by": "Logistics",
+                    "description": "Bags pressure tested",
+                }
+            ],
+        }
+        try:
+            equipment = EquipmentModel(**row)
+            (record,) = equipment.maintenance_records
+            assert record.maintenance_id == "MR-2"
+            assert record.equipment_id == "EQ-STORE-2"
+            assert "maintenance_records" in row
+        finally:
+            maintenance_store.remove("EQ-STORE-2")
+
+    @staticmethod
+    def _row_with_history(equipment_id, **overrides):
+        return {
+            "equipment_id": equipment_id,
+            "equipment_name": "Air Bag Kit",
+            "category": "rescue",
+            "home_cache": "Cache B",
+            "maintenance_records": [
+                {
+                    "maintenance_id": "MR-3",
+                    "maintenance_type": "inspection",
+                    "maintenance_date": "2024-08-01T00:00:00",
+                    "performed_by": "Logistics",
+                    "description": "Bags pressure tested",
+                }
+            ],
+            **overrides,
+        }
+
+    @pytest.mark.unit
+    def test_validating_row_twice_keeps_one_copy(self):
+        """Test that reloading a row does not duplicate its history."""
+        row = self._row_with_history("EQ-STORE-3")
+        try:
+            EquipmentModel.model_validate(row)
+            equipment = EquipmentModel.model_validate(row)
+            assert [r.maintenance_id for r in equipment.maintenance_records] == ["MR-3"]
+        finally:
+            maintenance_store.remove("EQ-STORE-3")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"category": "not-a-category"},
+            {"maintenance_records": [{"maintenance_id": "MR-4"}]},
+        ],
+        ids=["invalid_row", "invalid_record"],
+    )
+    def test_rejected_row_stores_no_history(self, overrides):
+        """Test that a row failing validation leaves the store untouched."""
+        row = self._row_with_history("EQ-STORE-4", **overrides)
+        try:
+            with pytest.raises(ValidationError):
+                EquipmentModel.model_validate(row)
+            assert maintenance_store.get("EQ-STORE-4") == ()
+        finally:
+            maintenance_store.remove("EQ-STORE-4")
+
+
+class TestSlottedModels:
+    """Tests for the slotted pydantic dataclass models."""
+
+    @pytest.mark.unit
+    def test_small_models_have_no_instance_dict(self):
+        """Test that high-volume record types are slotted."""
+        location = PersonnelLocation(
+            person_id="P-001",
+            location_name="Sector 4",
+            location_type="operations_area",
+        )
+        assert not hasattr(location, "__dict__")
+
+    @pytest.mark.unit
+    def test_slotted_models_still_validate(self, personnel_data):
+        """Test that slotted models validate when nested in a BaseModel."""
+        person = PersonnelModel(
+            **personnel_data,
+            current_location={
+                "person_id": "P-001",
+                "location_name": "Sector 4",
+                "location_type": "operations_area",
+                "gps_coordinates": [34.05, -118.24],
+            },
+        )
+        assert isinstance(person.current_location, PersonnelLocation)
+        assert person.model_dump()["current_location"]["location_name"] == "Sector 4"
+
+
+class TestJSONSerialization:
+    """Tests for the orjson fast serialization path."""
+
+    @pytest.mark.unit
+    def test_mission_to_json_bytes_matches_pydantic(self):
+        """Test that orjson output matches pydantic's JSON serialization."""
+        mission = MissionAssignment(
+            mission_id="M-002",
+            mission_name="Collapse rescue",
+            mission_type="rescue",
+            requesting_agency="FEMA",
+            location="Block 12",
+            gps_coordinates=(34.05, -118.24),
+            required_start_time=datetime(2024, 8, 1, 6, 0),
+            assigned_personnel=["P-001", "P-002"],
+            mission_description="Extract trapped victims",
+        )
+        assert json.loads(mission.to_json_bytes()) == json.loads(
+            mission.model_dump_json()
+        )
+
+    @pytest.mark.unit
+    def test_equipment_to_json_bytes(self):
+        """Test that equipment serializes enum fields by value."""
+        equipment = EquipmentModel(
+            equipment_id="EQ-002",
+            equipment_name="Search Camera",
+            category=EquipmentCategory.SEARCH,
+            home_cache="Cache A",
+        )
+        payload = json.loads(equipment.to_json_bytes())
+        assert payload["category"] == "search"
+        assert payload == json.loads(equipment.model_dump_json())
+
+
+class TestFrozenPersonnelRecords:
+    """Tests for the frozen, hashable personnel record types."""
+
+    @pytest.mark.unit
+    def test_locations_are_hashable_and_deduplicate(self):
+        """Test that identical locations collapse in a set."""
+        fields = {
+            "person_id": "P-001",
+            "location_name": "Sector 4",
+            "location_type": "operations_area",
+            "gps_coordinates": (34.05, -118.24),
+            "timestamp": 1_700_000_000_000,
+        }
+        assert len({PersonnelLocation(**fields), PersonnelLocation(**fields)}) == 1
+
+    @pytest.mark.unit
+    def test_frozen_records_reject_mutation(self):
+        """Test that frozen records cannot be modified in place."""
+        location = PersonnelLocation(
+            person_id="P-001",
+            location_name="Sector 4",
+            location_type="operations_area",
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            location.location_name = "Sector 5"
+
+
+class TestOperationalTimeline:
+    """Tests for typed operational timeline events."""
+
+    @pytest.mark.unit
+    def test_timeline_validates_events_from_dicts(self):
+        """Test that raw event dicts validate into TimelineEvent records."""
+        timeline = OperationalTimeline(
+            timeline_id="TL-001",
+            operation_name="Sector 4 operations",
+            start_time=datetime(2024, 8, 1, 6, 0),
+            current_phase="search",
+            events=[
+                {
+                    "kind": "milestone",
+                    "actor": "PSC",
+                    "ts": 1_700_000_000_000,
+                    "payload": {"note": "Primary search complete"},
+                }
+            ],
+        )
+        event = timeline.events[0]
+        assert isinstance(event, TimelineEvent)
+        assert event.payload["note"] == "Primary search complete"
+        assert event.ts_dt == datetime.fromtimestamp(1_700_000_000)
+
+    @pytest.mark.unit
+    def test_timeline_rejects_untyped_payload(self):
+        """Test that event payload values must be strings."""
+        with pytest.raises(ValidationError):
+            OperationalTimeline(
+                timeline_id="TL-002",
+                operation_name="Sector 5 operations",
+                start_time=datetime(2024, 8, 1, 6, 0),
+                current_phase="search",
+                events=[{"kind": "note", "actor": "SO", "payload": {"n": [1]}}],
+            )
+
+
+class TestImmutableCollections:
+    """Tests for tuple-typed read-mostly collections."""
+
+    @pytest.mark.unit
+    def test_equipment_tag_sets_are_shared(self):
+        """Test that equal tag sets resolve to one shared tuple."""
+        first, second = (
+            EquipmentModel(
+                equipment_id=f"EQ-TAG-{i}",
+                equipment_name="Shoring Kit",
+                category=EquipmentCategory.STRUCTURAL,
+                home_cache="Cache C",
+                tags=["shoring", "timber"],
+            )
+            for i in range(2)
+        )
+        assert first.tags == ("shoring", "timber")
+        assert first.tags is second.tags
+
+    @pytest.mark.unit
+    def test_mission_assignments_are_tuples(self):
+        """Test that mission resource assignments are stored as tuples."""
+        mission = MissionAssignment(
+            mission_id="M-003",
+            mission_name="Hazmat recon",
+            mission_type="hazmat",
+            requesting_agency="FEMA",
+            location="Block 3",
+            assigned_personnel=["P-001"],
+            mission_description="Recon of block 3",
+        )
+        assert mission.assigned_personnel == ("P-001",)
+        assert mission.assigned_equipment == ()
+        assert json.loads(mission.to_json_bytes())["assigned_personnel"] == ["P-001"]
+
+
+class TestPersonnelStatus:
+    """Tests for the literal personnel status field."""
+
+    @pytest.mark.unit
+    def test_status_accepts_known_values(self, personnel_data):
+        """Test that status constants validate and stay plain strings."""
+        person = PersonnelModel(
+            **personnel_data, current_status=PersonnelStatus.REST_REHABILITATION
+        )
+        assert person.current_status == "rest_rehabilitation"
+        assert type(person.current_status) is str
+
+    @pytest.mark.unit
+    def test_status_rejects_unknown_values(self, personnel_data):
+        """Test that unknown status strings fail validation."""
+        with pytest.raises(ValidationError):
+            PersonnelModel(**personnel_data, current_status="on_break")
+
+    @pytest.mark.unit
+    def test_fitness_level_is_restricted(self, personnel_data):
+        """Test that fitness level only accepts the known grades."""
+        person = PersonnelModel(**personnel_data, fitness_level="fair")
+        assert person.fitness_level == "fair"
+        with pytest.raises(ValidationError):
+            PersonnelModel(**personnel_data, fitness_level="average")
+
+    @pytest.mark.unit
+    def test_total_deployments_not_negative(self, personnel_data):
+        """Test that a negative deployment count fails validation."""
+        with pytest.raises(ValidationError):
+            PersonnelModel(**personnel_data, total_deployments=-1)
+
+
+class TestTrustedRowConstruction:
+    """Tests for the unvalidated trusted-row fast path."""
+
+    @pytest.mark.unit
+    def test_from_trusted_row_builds_nested_records(self, personnel_data):
+        """Test that nested dicts become record instances without validation."""
+        person = PersonnelModel.from_trusted_row(
+            **personnel_data,
+            current_location={
+                "person_id": "P-001",
+                "location_name": "Sector 4",
+                "location_type": "operations_area",
+            },
+            qualifications=[
+                {
+                    "qualification_id": "Q-1",
+                    "qualification_name": "Rescue Specialist",
+                    "certification_date": datetime(2022, 1, 1),
+                    "certifying_agency": "FEMA",
+                }
+            ],
+        )
+        assert isinstance(person.current_location, PersonnelLocation)
+        assert person.current_location.gps_coordinates is None
+        assert isinstance(person.current_location.timestamp, int)
+        assert person.qualifications[0].qualification_name == "Rescue Specialist"
+        assert person.current_status == PersonnelStatus.OPERATIONAL
+
+    @pytest.mark.unit
+    def test_from_trusted_row_skips_validation(self, personnel_data):
+        """Test that trusted rows are not coerced or checked."""
+        person = PersonnelModel.from_trusted_row(
+            **{**personnel_data, "total_deployments": "3"}
+        )
+        assert person.total_deployments == "3"
+
+
+class TestPersonnelModelConfig:
+    """Tests for personnel model configuration."""
+
+    @pytest.mark.unit
+    def test_unknown_row_keys_are_ignored(self, personnel_data):
+        """Test that extra keys from roster rows are dropped."""
+        person = PersonnelModel(**personnel_data, legacy_column="x")
+        assert not hasattr(person, "legacy_column")
+        location = PersonnelLocation(
+            person_id="P-001",
+            location_name="Sector 4",
+            location_type="operations_area",
+            legacy_column="x",
+        )
+        assert not hasattr(location, "legacy_column")
+
+
+class TestLocationStore:
+    """Tests for the NumPy-backed personnel location store."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("capacity", [0, 1])
+    def test_store_keeps_latest_fix_per_person(self, capacity):
+        """Test that updates overwrite each person's row and grow the array."""
+        pytest.importorskip("numpy")
+        store = LocationStore(capacity=capacity)
+        store.update_many(
+            PersonnelLocation(
+                person_id=person_id,
+                location_name="Sector 4",
+                location_type="operations_area",
+                gps_coordinates=coords,
+            )
+            for person_id, coords in [
+                ("P-001", (34.0, -118.0)),
+                ("P-002", (34.1, -118.1)),
+                ("P-001", (34.2, -118.2)),
+            ]
+        )
+        store.update(
+            PersonnelLocation(
+                person_id="P-003", location_name="Base", location_type="command_post"
+            )
+        )
+        assert len(store) == 2
+        assert store.ids == ["P-001", "P-002"]
+        assert store.coords.shape == (2, 2)
+        assert store.get("P-001") == GPS(34.2, -118.2)
+        assert store.get("P-003") is None
+
+    @pytest.mark.unit
+    def test_within_radius(self):
+        """Test that the geofence query returns only people inside the radius."""
+        pytest.importorskip("numpy")
+        store = LocationStore()
+        for person_id, coords in [
+            ("P-001", (34.0, -118.0)),
+            ("P-002", (34.003, -118.0)),
+            ("P-003", (34.01, -118.0)),
+        ]:
+            store.update(
+                PersonnelLocation(
+                    person_id=person_id,
+                    location_name="Sector 4",
+                    location_type="operations_area",
+                    gps_coordinates=coords,
+                )
+            )
+        assert store.within(GPS(34.0, -118.0), 500) == ["P-001", "P-002"]
+        assert store.within_mask(GPS(34.0, -118.0), 2000).all()
+        assert LocationStore().within(GPS(34.0, -118.0), 500) == []
+
+
+class TestParseDatetime:
+    """Tests for the shared datetime parser."""
+
+    @pytest.mark.unit
+    def test_parse_dt_handles_iso_strings_and_datetimes(self):
+        """Test that ISO strings parse and datetimes pass through."""
+        parsed = parse_dt("2024-08-01T06:30:00")
+        assert parsed == datetime(2024, 8, 1, 6, 30)
+        assert parse_dt(parsed) == parsed
+
+    @pytest.mark.unit
+    def test_parse_dt_rejects_garbage(self):
+        """Test that unparseable values raise a validation error."""
+        with pytest.raises(ValidationError):
+            parse_dt("not a date")
+
+
+class TestPersonnelMsgspecMirror:
+    """Tests for the msgspec personnel wire models."""
+
+    @pytest.mark.unit
+    def test_round_trip_through_msgspec(self, personnel_data):
+        """Test pydantic -> msgspec -> JSON -> msgspec -> pydantic round trip."""
+        pytest.importorskip("msgspec")
+        from fema_usar_mcp.models.personnel_fast import (
+            PersonnelModelMsg,
+            decode_roster,
+            encode,
+        )
+
+        person = PersonnelModel(
+            **personnel_data,
+            current_location={
+                "person_id": "P-001",
+                "location_name": "Sector 4",
+                "location_type": "operations_area",
+                "gps_coordinates": (34.05, -118.24),
+            },
+        )
+        message = PersonnelModelMsg.from_pydantic(person)
+        decoded = decode_roster(encode([message]))
+        assert decoded == [message]
+        assert decoded[0].to_pydantic() == person
+
+    @pytest.mark.unit
+    def test_decode_rejects_invalid_status(self, personnel_data):
+        """Test that msgspec decoding enforces the status literal."""
+        msgspec = pytest.importorskip("msgspec")
+        from fema_usar_mcp.models.personnel_fast import decode_personnel
+
+        raw = json.dumps({**personnel_data, "current_status": "on_break"})
+        with pytest.raises(msgspec.ValidationError):
+            decode_personnel(raw)
+
+
+class TestPersonnelDataclassMirror:
+    """Tests for the plain dataclass personnel mirror."""
+
+    @pytest.mark.unit
+    def test_round_trip_through_dataclass(self, personnel_data):
+        """Test pydantic -> dataclass -> pydantic conversion keeps all fields."""
+        from fema_usar_mcp.models.personnel_dc import PersonnelModelDC
+
+        person = PersonnelModel(**personnel_data, total_deployments=2)
+        record = PersonnelModelDC.from_pydantic(person)
+        assert not hasattr(record, "__dict__")
+        record.current_status = PersonnelStatus.TRANSPORTATION
+        record.touch()
+        converted = record.as_pydantic()
+        assert isinstance(converted, PersonnelModel)
+        assert converted.current_status == "transportation"
+        assert converted.total_deployments == 2
+        assert converted.person_id == person.person_id
+
+    @pytest.mark.unit
+    def test_fields_match_pydantic_model(self):
+        """Test that the mirror declares exactly the pydantic model's fields."""
+        from fema_usar_mcp.models.personnel_dc import PersonnelModelDC
+
+        names = [f.name for f in dataclasses.fields(PersonnelModelDC)]
+        assert set(names) == set(PersonnelModel.model_fields)
+
+
+class TestRosterValidation:
+    """Tests for bulk roster validation."""
+
+    @pytest.mark.unit
+    def test_validate_roster_json(self, personnel_data):
+        """Test that a JSON roster validates into personnel models."""
+        raw = json.dumps(
+            [personnel_data, {**personnel_data, "person_id": "P-002"}]
+        ).encode()
+        roster = validate_roster_json(raw)
+        assert [p.person_id for p in roster] == ["P-001", "P-002"]
+        assert all(isinstance(p, PersonnelModel) for p in roster)
+
+    @pytest.mark.unit
+    def test_validate_roster_json_reports_bad_rows(self, personnel_data):
+        """Test that an invalid row fails the whole roster validation."""
+        raw = json.dumps([personnel_data, {"person_id": "P-002"}])
+        with pytest.raises(ValidationError):
+            validate_roster_json(raw)
+
+    @pytest.mark.unit
+    def test_serialize_roster_round_trip(self, personnel_data):
+        """Test that a serialized roster validates back to equal models."""
+        roster = [
+            PersonnelModel(**personnel_data),
+            PersonnelModel(**{**personnel_data, "person_id": "P-002"}),
+        ]
+        raw = serialize_roster(roster)
+        assert isinstance(raw, bytes)
+        assert [row["person_id"] for row in json.loads(raw)] == ["P-001", "P-002"]
+        assert validate_roster_json(raw) == roster
+
+
+class TestInternedFields:
+    """Tests for interning of repeated string fields."""
+
+    @pytest.mark.unit
+    def test_repeated_values_share_one_object(self, personnel_data):
+        """Test that equal task force strings parsed separately are identical."""
+        rows = json.loads(
+            json.dumps([personnel_data, {**personnel_data, "person_id": "P-002"}])
+        )
+        first, second = (PersonnelModel(**row) for row in rows)
+        assert first.task_force is second.task_force
+        assert first.home_agency is second.home_agency
+
+    @pytest.mark.unit
+    def test_status_strings_parsed_from_json_are_interned(self):
+        """Test that free-form status strings from JSON share one object."""
+        raw = json.dumps(
+            {
+                "equipment_id": "EQ-INT-1",
+                "equipment_name": "Rotary Saw",
+                "category": "tools",
+                "home_cache": "Cache A",
+                "condition": "needs-inspection",
+            }
+        )
+        first, second = (EquipmentModel.model_validate_json(raw) for _ in range(2))
+        assert first.condition is second.condition
+
+
+class TestQualificationCurrency:
+    """Tests for the computed qualification currency flag."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("expiration_date", "expected"),
+        [(None, True), ("2999-01-01T00:00:00", True), ("2000-01-01T00:00:00", False)],
+    )
+    def test_is_current_follows_expiration(self, expiration_date, expected):
+        """Test that is_current is derived from the expiration date."""
+        qualification = PersonnelQualification(
+            qualification_id="Q-001",
+            qualification_name="Rescue Specialist",
+            certification_date="1999-01-01T00:00:00",
+            certifying_agency="FEMA",
+            expiration_date=expiration_date,
+        )
+        assert qualification.is_current is expected
+        assert "is_current" not in PersonnelQualification.__pydantic_fields__
+
+    @pytest.mark.unit
+    def test_is_current_is_serialized(self, personnel_data):
+        """Test that the computed flag is included in model dumps."""
+        person = PersonnelModel(
+            **personnel_data,
+            qualifications=[
+                {
+                    "qualification_id": "Q-001",
+                    "qualification_name": "Rescue Specialist",
+                    "certification_date": "1999-01-01T00:00:00",
+                    "certifying_agency": "FEMA",
+                    "expiration_date": "2000-01-01T00:00:00",
+                }
+            ],
+        )
+        assert person.model_dump()["qualifications"][0]["is_current"] is False
+
+
+class TestEmergencyContact:
+    """Tests for the typed emergency contact record."""
+
+    @pytest.mark.unit
+    def test_contact_validates_into_record(self, personnel_data):
+        """Test that a contact mapping validates into an EmergencyContact."""
+        contact = {"name": "Sam Rescuer", "relation": "spouse", "phone": "555-0100"}
+        person = PersonnelModel(**personnel_data, emergency_contact=contact)
+        assert person.emergency_contact == EmergencyContact(**contact)
+        assert person.model_dump()["emergency_contact"] == contact
+
+    @pytest.mark.unit
+    def test_contact_requires_all_fields(self, personnel_data):
+        """Test that incomplete contacts fail validation."""
+        with pytest.raises(ValidationError):
+            PersonnelModel(**personnel_data, emergency_contact={"name": "Sam"})
+
+    @pytest.mark.unit
+    def test_trusted_row_builds_contact(self, personnel_data):
+        """Test that trusted rows build the nested contact record."""
+        contact = {"name": "Sam Rescuer", "relation": "spouse", "phone": "555-0100"}
+        person = PersonnelModel.from_trusted_row(
+            **personnel_data, emergency_contact=contact
+        )
+        assert isinstance(person.emergency_contact, EmergencyContact)
+        assert person.emergency_contact.phone == "555-0100"
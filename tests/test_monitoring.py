@@ -0,0 +1,749 @@
+"""Tests for the monitoring package."""
+
+import asyncio
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import psutil
+import pytest
+
+import fema_usar_mcp.monitoring as monitoring
+from fema_usar_mcp.monitoring import metrics as metrics_module
+from fema_usar_mcp.monitoring.metrics import (
+    Alert,
+    AlertManager,
+    AlertSeverity,
+    HealthCheck,
+    HealthMonitor,
+    MonitoringManager,
+    create_system_alert_rules,
+    create_usar_alert_rules,
+    result_label,
+    single_alert_channel,
+    task_force_label,
+)
+
+
+def make_alert(
+    alert_id: str = "test_alert", severity: AlertSeverity = AlertSeverity.WARNING
+) -> Alert:
+    """Build an alert for tests."""
+    return Alert(
+        alert_id=alert_id,
+        name="Test Alert",
+        severity=severity,
+        message="Test alert message",
+        source="tests",
+        timestamp=datetime.now(UTC),
+        labels={},
+    )
+
+
+@pytest.fixture
+def manager():
+    """Monitoring manager with its own registry, not started."""
+    return MonitoringManager()
+
+
+class TestLazyExports:
+    """Tests for the lazily resolved monitoring package exports."""
+
+    @pytest.mark.unit
+    def test_package_import_does_not_load_metrics(self):
+        """Test that importing the package defers loading the metrics module."""
+        code = (
+            "import sys, fema_usar_mcp.monitoring; "
+            "print('fema_usar_mcp.monitoring.metrics' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip().splitlines()[-1] == "False"
+
+    @pytest.mark.unit
+    def test_exports_resolve_from_metrics(self):
+        """Test that every exported name resolves to the metrics definition."""
+        from fema_usar_mcp.monitoring import metrics
+
+        for name in monitoring.__all__:
+            assert getattr(monitoring, name) is getattr(metrics, name)
+        assert set(monitoring.__all__) <= set(dir(monitoring))
+
+    @pytest.mark.unit
+    def test_unknown_attribute_raises(self):
+        """Test that unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            monitoring.NotAThing  # noqa: B018
+
+
+class TestMetricsExposition:
+    """Tests for the cached Prometheus exposition payload."""
+
+    @pytest.mark.unit
+    def test_payload_is_cached_within_ttl(self, manager):
+        """Test that scrapes within the TTL reuse the rendered payload."""
+        first = manager.get_metrics()
+        assert isinstance(first, bytes)
+        assert b"usar_" in first
+        manager.metrics.active_sessions.set(42)
+        assert manager.get_metrics() is first
+
+    @pytest.mark.unit
+    def test_payload_refreshes_after_ttl(self, manager):
+        """Test that an expired payload is rendered again."""
+        manager.get_metrics()
+        manager.metrics.active_sessions.set(42)
+        manager._cached_at -= manager._metrics_cache_ttl
+        assert b"usar_active_sessions 42.0" in manager.get_metrics()
+
+
+class TestLabelCardinality:
+    """Tests for bounded metric label values."""
+
+    @pytest.mark.unit
+    def test_unknown_task_forces_collapse_to_other(self):
+        """Test that only national task force IDs are used as labels."""
+        assert task_force_label("CA-TF1") == "CA-TF1"
+        assert task_force_label("DEPLOY-20240101-0042") == "other"
+
+    @pytest.mark.unit
+    def test_results_are_bucketed(self):
+        """Test that operation results map onto three buckets."""
+        assert result_label("partial") == "partial"
+        assert result_label("aborted_due_to_weather") == "failure"
+
+    @pytest.mark.unit
+    def test_record_search_operation_uses_bounded_labels(self, manager):
+        """Test that recorded search operations never add unbounded series."""
+        metrics = manager.metrics
+        metrics.record_search_operation("CA-TF1", "hasty", "success")
+        metrics.record_search_operation("LOCAL-TEAM-7", "hasty", "timed_out")
+        samples = {
+            tuple(sorted(sample.labels.items()))
+            for metric in metrics.search_operations_total.collect()
+            for sample in metric.samples
+            if sample.name.endswith("_total")
+        }
+        assert samples == {
+            (
+                ("result", "success"),
+                ("search_type", "hasty"),
+                ("task_force_id", "CA-TF1"),
+            ),
+            (
+                ("result", "failure"),
+                ("search_type", "hasty"),
+                ("task_force_id", "other"),
+            ),
+        }
+
+
+class TestSystemMetricsCollection:
+    """Tests for non-blocking system metrics sampling."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cpu_sampling_never_blocks(self, manager, monkeypatch):
+        """Test that CPU sampling uses the non-blocking psutil form."""
+        intervals = []
+
+        def fake_cpu_percent(interval=None):
+            intervals.append(interval)
+            return 37.5
+
+        monkeypatch.setattr(psutil, "cpu_percent", fake_cpu_percent)
+        manager.metrics_collector.refresh_system_metrics()
+        current = await manager._collect_current_metrics()
+
+        assert intervals == [None]
+        assert current["system_cpu_usage"] == 37.5
+
+    @pytest.mark.unit
+    def test_partitions_are_cached(self, manager, monkeypatch):
+        """Test that partitions are re-enumerated only after the refresh interval."""
+        collector = manager.metrics_collector
+        calls = []
+        monkeypatch.setattr(psutil, "disk_partitions", lambda: calls.append(1) or [])
+
+        collector._collect_system_metrics()
+        collector._collect_system_metrics()
+        assert calls == []
+
+        collector._partitions_loaded_at -= collector.partition_refresh_interval
+        collector._collect_system_metrics()
+        assert calls == [1]
+
+    @pytest.mark.unit
+    def test_disk_usage_skips_image_and_duplicate_mounts(self, manager):
+        """Test that only distinct, writable mounts get disk usage gauges."""
+        collector = manager.metrics_collector
+        gauges = collector._bind_disk_gauges(
+            [
+                SimpleNamespace(mountpoint="/", fstype="ext4"),
+                SimpleNamespace(mountpoint="/", fstype="ext4"),
+                SimpleNamespace(mountpoint="/snap/core", fstype="squashfs"),
+            ]
+        )
+        assert [mount for mount, _ in gauges] == ["/"]
+
+        collector._disk_gauges = gauges
+        collector._collect_system_metrics()
+        usage = psutil.disk_usage("/")
+        assert gauges[0][1]._value.get() == pytest.approx(
+            usage.used / usage.total * 100
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_alert_metrics_reuse_last_memory_sample(self, manager, monkeypatch):
+        """Test that alert metrics read memory from the last collection cycle."""
+        manager.metrics_collector.refresh_system_metrics()
+        memory = manager.metrics_collector.last_memory
+        monkeypatch.setattr(psutil, "virtual_memory", pytest.fail)
+
+        current = await manager._collect_current_metrics()
+        assert current["system_memory_usage"] == memory.used
+        assert current["system_memory_total"] == memory.total
+
+    @pytest.mark.unit
+    def test_scrape_samples_system_metrics(self, manager, monkeypatch):
+        """Test that a scrape samples psutil, debounced across scrapers."""
+        readings = iter([12.5, 99.0])
+        monkeypatch.setattr(psutil, "cpu_percent", lambda interval=None: next(readings))
+
+        first = manager.get_metrics()
+        manager._cached_payload = None
+        second = manager.get_metrics()
+
+        assert b"usar_system_cpu_usage_percent 12.5" in first
+        assert b"usar_system_cpu_usage_percent 12.5" in second
+
+
+class TestAlertNotifications:
+    """Tests for batched, concurrent alert notification fan-out."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_channels_run_concurrently(self):
+        """Test that async channels are awaited together, not one by one."""
+        alert_manager = AlertManager()
+        in_flight = 0
+        peak = 0
+
+        async def slow_channel(alerts):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        for _ in range(3):
+            alert_manager.add_notification_channel(slow_channel)
+        await alert_manager.fire_alert(make_alert())
+        await alert_manager.flush_notifications()
+        assert peak == 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_fan_out_is_bounded(self):
+        """Test that in-flight notifications never exceed the configured limit."""
+        alert_manager = AlertManager(max_concurrent_notifications=2)
+        in_flight = 0
+        peak = 0
+
+        async def slow_channel(alerts):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        for _ in range(5):
+            alert_manager.add_notification_channel(slow_channel)
+        await alert_manager.fire_alert(make_alert())
+        await alert_manager.flush_notifications()
+        assert peak == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failing_channel_does_not_block_others(self):
+        """Test that sync and failing channels are handled alongside async ones."""
+        alert_manager = AlertManager()
+        received = []
+
+        def failing_channel(alerts):
+            raise RuntimeError("gateway down")
+
+        alert_manager.add_notification_channel(failing_channel)
+        alert_manager.add_notification_channel(single_alert_channel(received.append))
+        await alert_manager.fire_alert(make_alert())
+        await alert_manager.flush_notifications()
+        assert [alert.alert_id for alert in received] == ["test_alert"]
+        assert "test_alert" in alert_manager.active_alerts
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_storm_is_grouped_into_one_call_per_channel(self):
+        """Test that a burst of same-kind alerts reaches each channel once."""
+        alert_manager = AlertManager(batch_window=0.05)
+        calls = []
+
+        async def channel(alerts):
+            calls.append([alert.alert_id for alert in alerts])
+
+        alert_manager.add_notification_channel(channel)
+        dispatcher = asyncio.create_task(alert_manager.run_dispatch_loop())
+        try:
+            for i in range(5):
+                await alert_manager.fire_alert(make_alert(f"cpu_{i}"))
+            await asyncio.sleep(0.1)
+        finally:
+            dispatcher.cancel()
+
+        assert calls == [[f"cpu_{i}" for i in range(5)]]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_notifications_not_alerts(self, caplog):
+        """Test that alerts past the queue bound are recorded but not queued."""
+        alert_manager = AlertManager(max_queued_notifications=2)
+        received = []
+        alert_manager.add_notification_channel(single_alert_channel(received.append))
+
+        for i in range(3):
+            await alert_manager.fire_alert(make_alert(f"disk_{i}"))
+        assert list(alert_manager.active_alerts) == ["disk_0", "disk_1", "disk_2"]
+        assert "Notification queue full" in caplog.text
+
+        await alert_manager.flush_notifications()
+        assert [alert.alert_id for alert in received] == ["disk_0", "disk_1"]
+
+
+class TestAlertModel:
+    """Tests for the Alert dataclass."""
+
+    @pytest.mark.unit
+    def test_to_dict_is_json_ready(self):
+        """Test that to_dict emits plain JSON types without deep copying."""
+        alert = make_alert()
+        alert.labels = {"component": "system"}
+        data = alert.to_dict()
+
+        assert data["severity"] == "warning"
+        assert data["timestamp"] == alert.timestamp.isoformat()
+        assert data["resolved_at"] is None
+        assert data["labels"] == {"component": "system"}
+        assert data["labels"] is not alert.labels
+        json.dumps(data)
+
+    @pytest.mark.unit
+    def test_alert_is_slotted(self):
+        """Test that alerts carry no per-instance __dict__."""
+        assert not hasattr(make_alert(), "__dict__")
+
+
+class TestActiveAlertOrdering:
+    """Tests for listing active alerts without sorting."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_newest_first_with_updates_moved_to_front(self):
+        """Test that re-fired alerts move ahead of older ones."""
+        alert_manager = AlertManager()
+        for alert_id in ("a", "b", "c"):
+            await alert_manager.fire_alert(make_alert(alert_id))
+        await alert_manager.fire_alert(make_alert("a"))
+
+        ids = [alert.alert_id for alert in alert_manager.get_active_alerts()]
+        assert ids == ["a", "c", "b"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_severity_filter_and_resolve(self):
+        """Test that severity views stay in sync with resolution."""
+        alert_manager = AlertManager()
+        await alert_manager.fire_alert(make_alert("warn"))
+        await alert_manager.fire_alert(make_alert("crit1", AlertSeverity.CRITICAL))
+        await alert_manager.fire_alert(make_alert("crit2", AlertSeverity.CRITICAL))
+        alert_manager.resolve_alert("crit1")
+
+        critical = alert_manager.get_active_alerts(AlertSeverity.CRITICAL)
+        assert [alert.alert_id for alert in critical] == ["crit2"]
+        assert alert_manager.get_active_alerts(AlertSeverity.ERROR) == []
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_active_counts_by_severity(self):
+        """Test that per-severity counts follow firing and resolution."""
+        alert_manager = AlertManager()
+        await alert_manager.fire_alert(make_alert("warn1"))
+        await alert_manager.fire_alert(make_alert("crit1", AlertSeverity.CRITICAL))
+        await alert_manager.fire_alert(make_alert("crit2", AlertSeverity.CRITICAL))
+        alert_manager.resolve_alert("crit1")
+
+        counts = alert_manager.count_active_alerts()
+        assert counts["critical"] == 1
+        assert counts["warning"] == 1
+        assert counts["error"] == 0
+
+
+def make_health_check(name, check_function):
+    """Build a health check around a check coroutine function."""
+    return HealthCheck(
+        name=name,
+        status="unknown",
+        last_check=datetime.now(UTC),
+        response_time_ms=0.0,
+        details={},
+        check_function=check_function,
+    )
+
+
+class TestHealthChecks:
+    """Tests for concurrent health check execution."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_checks_run_concurrently(self):
+        """Test that checks overlap instead of running back to back."""
+        monitor = HealthMonitor()
+        in_flight = 0
+        peak = 0
+
+        async def slow_check():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "healthy", {}
+
+        for name in ("database", "redis", "external_apis"):
+            monitor.add_health_check(make_health_check(name, slow_check))
+        result = await monitor.run_health_checks()
+
+        assert peak == 3
+        assert result["overall_status"] == "healthy"
+        assert set(result["checks"]) == {"database", "redis", "external_apis"}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_slow_check_times_out(self):
+        """Test that a hung check is reported unhealthy after the timeout."""
+        monitor = HealthMonitor(check_timeout=0.01)
+
+        async def hung_check():
+            await asyncio.sleep(10)
+
+        async def degraded_check():
+            return "degraded", {"lag_ms": 250}
+
+        monitor.add_health_check(make_health_check("database", hung_check))
+        monitor.add_health_check(make_health_check("redis", degraded_check))
+        result = await monitor.run_health_checks()
+
+        assert result["overall_status"] == "unhealthy"
+        assert "timed out" in result["checks"]["database"]["error"]
+        assert result["checks"]["redis"]["status"] == "degraded"
+        assert monitor.health_checks["database"].status == "unhealthy"
+        assert result["status_counts"] == {"unhealthy": 1, "degraded": 1}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_response_time_ignores_wall_clock_jumps(self, monkeypatch):
+        """Test that a wall clock stepping backwards cannot skew response times."""
+        monitor = HealthMonitor()
+        # Every wall-clock read lands an hour earlier than the previous one
+        wall_clock = itertools.count(1_000_000.0, -3600.0)
+        monkeypatch.setattr(time, "time", lambda: next(wall_clock))
+
+        async def quick_check():
+            return "healthy", {}
+
+        monitor.add_health_check(make_health_check("database", quick_check))
+        result = await monitor.run_health_checks()
+
+        assert 0 <= result["checks"]["database"]["response_time_ms"] < 1000
+
+
+class TestAlertHistory:
+    """Tests for the bounded alert history."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_history_is_bounded_but_counts_are_kept(self):
+        """Test that evicted alerts still count toward the firing summary."""
+        alert_manager = AlertManager(max_history=2)
+        for i in range(5):
+            await alert_manager.fire_alert(make_alert(f"cpu_{i}"))
+
+        assert [alert.alert_id for alert in alert_manager.alert_history] == [
+            "cpu_3",
+            "cpu_4",
+        ]
+        assert alert_manager.get_history_summary() == {"Test Alert": 5}
+
+    @pytest.mark.unit
+    def test_resolving_unknown_alert_is_a_no_op(self):
+        """Test that resolving an unknown or already resolved alert is safe."""
+        alert_manager = AlertManager()
+        alert_manager.resolve_alert("missing")
+        assert alert_manager.get_active_alerts() == []
+
+
+class TestLabelChildren:
+    """Tests for pre-bound metric label children."""
+
+    @pytest.mark.unit
+    def test_record_api_request_reuses_children(self, manager):
+        """Test that repeated requests reuse the memoized label children."""
+        metrics = manager.metrics
+        metrics.record_api_request("GET", "/health", 200, 0.01)
+        metrics.record_api_request("GET", "/health", "200", 0.03)
+
+        info = metrics._api_request_children.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        counter = metrics.api_requests_total.labels(
+            method="GET", endpoint="/health", status="200"
+        )
+        assert counter._value.get() == 2
+
+    @pytest.mark.unit
+    def test_disk_gauges_are_bound_per_mount_point(self, manager):
+        """Test that disk usage is written through the bound gauge children."""
+        collector = manager.metrics_collector
+        collector._collect_system_metrics()
+        mount_points = [mount for mount, _ in collector._disk_gauges]
+        assert len(mount_points) == len(set(mount_points))
+
+
+class TestManagerLifecycle:
+    """Tests for starting and stopping the monitoring background loops."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_stop_cancels_and_awaits_background_tasks(self, manager, monkeypatch):
+        """Test that stop() leaves no background tasks running."""
+        monkeypatch.setattr(metrics_module, "start_http_server", lambda *a, **k: None)
+        await manager.start()
+        tasks = list(manager._tasks)
+        assert [task.get_name() for task in tasks] == [
+            "monitoring.metrics_collection",
+            "monitoring.health_checks",
+            "monitoring.alert_checks",
+            "monitoring.alert_dispatch",
+        ]
+
+        await manager.stop()
+        assert manager._tasks == []
+        assert all(task.done() for task in tasks)
+        assert not manager.metrics_collector._running
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_task_is_logged(self, manager, caplog):
+        """Test that a background loop crashing is logged, not swallowed."""
+
+        async def crash():
+            raise RuntimeError("boom")
+
+        task = asyncio.create_task(crash(), name="monitoring.crash")
+        task.add_done_callback(manager._on_task_done)
+        await asyncio.gather(task, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert "Monitoring task monitoring.crash failed: boom" in caplog.text
+
+
+class TestAlertRules:
+    """Tests for alert rule evaluation."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_sync_and_async_rules_fire(self):
+        """Test that both rule kinds are evaluated and their alerts fired."""
+        alert_manager = AlertManager()
+        in_flight = 0
+        peak = 0
+
+        def sync_rule(metrics):
+            return make_alert("sync") if metrics["cpu"] > 90 else None
+
+        async def async_rule(metrics):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return make_alert(f"async_{peak}_{in_flight}")
+
+        def broken_rule(metrics):
+            raise KeyError("missing_metric")
+
+        alert_manager.add_alert_rule(sync_rule)
+        alert_manager.add_alert_rule(broken_rule)
+        alert_manager.add_alert_rule(async_rule)
+        alert_manager.add_alert_rule(async_rule)
+        await alert_manager.check_alert_rules({"cpu": 95})
+
+        assert peak == 2
+        assert "sync" in alert_manager.active_alerts
+        assert len(alert_manager.active_alerts) == 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_rules_get_read_only_metrics(self):
+        """Test that rules cannot mutate the shared metrics mapping."""
+        alert_manager = AlertManager()
+        errors = []
+
+        def mutating_rule(metrics):
+            try:
+                metrics["cpu"] = 0
+            except TypeError as e:
+                errors.append(e)
+
+        alert_manager.add_alert_rule(mutating_rule)
+        data = {"cpu": 95}
+        await alert_manager.check_alert_rules(data)
+        assert errors and data == {"cpu": 95}
+
+
+class TestThresholdRules:
+    """Tests for vectorized threshold rules."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_only_highest_level_fires(self, monkeypatch, use_numpy):
+        """Test that a critical reading does not also raise the warning."""
+        if not use_numpy:
+            monkeypatch.setattr(metrics_module, "np", None)
+        alert_manager = AlertManager()
+        create_system_alert_rules(alert_manager)
+        table = alert_manager.threshold_rules
+
+        assert [a.alert_id for a in table.evaluate({"system_cpu_usage": 95})] == [
+            "high_cpu_usage"
+        ]
+        alerts = table.evaluate({"system_cpu_usage": 85})
+        assert [a.alert_id for a in alerts] == ["elevated_cpu_usage"]
+        assert alerts[0].message == "CPU usage is 85.0% (threshold: 80%)"
+        assert table.evaluate({"system_cpu_usage": 50}) == []
+
+    @pytest.mark.unit
+    def test_missing_metrics_read_as_zero(self):
+        """Test that rules for absent metrics do not fire."""
+        alert_manager = AlertManager()
+        create_usar_alert_rules(alert_manager)
+        assert alert_manager.threshold_rules.evaluate({}) == []
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_usar_thresholds_fire_through_manager(self):
+        """Test that threshold alerts are fired by check_alert_rules."""
+        alert_manager = AlertManager()
+        create_usar_alert_rules(alert_manager)
+        await alert_manager.check_alert_rules(
+            {
+                "active_deployments": 11,
+                "safety_incidents_last_hour": 3,
+                "equipment_failure_rate_percent": 2.1,
+            }
+        )
+
+        active = alert_manager.active_alerts
+        assert set(active) == {"high_deployment_load", "safety_incident_spike"}
+        assert active["safety_incident_spike"].severity == AlertSeverity.CRITICAL
+        assert (
+            active["high_deployment_load"].message == "Managing 11 active deployments"
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_alerts_share_evaluation_time(self):
+        """Test that one check stamps every alert with the same datetime."""
+        alert_manager = AlertManager()
+        create_system_alert_rules(alert_manager)
+        now = datetime(2024, 1, 1, tzinfo=UTC)
+
+        def legacy_rule(metrics):
+            return make_alert("legacy")
+
+        alert_manager.add_alert_rule(legacy_rule)
+        await alert_manager.check_alert_rules(
+            {
+                "system_cpu_usage": 95,
+                "system_memory_usage": 99,
+                "system_memory_total": 100,
+            },
+            now=now,
+        )
+
+        active = alert_manager.active_alerts
+        assert active["high_cpu_usage"].timestamp is now
+        assert active["high_memory_usage"].timestamp is now
+        assert "legacy" in active
+
+
+class TestMultiprocessExposition:
+    """Tests for multi-worker metrics exposition."""
+
+    @pytest.mark.unit
+    def test_single_process_uses_own_registry(self, monkeypatch):
+        """Test that without a multiprocess dir the registry is scraped directly."""
+        monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+        manager = MonitoringManager()
+        assert not manager.multiprocess
+        assert manager.exposition_registry is manager.registry
+
+    @pytest.mark.unit
+    def test_workers_aggregate_through_multiprocess_dir(self, tmp_path):
+        """Test that samples from separate workers are summed on scrape."""
+        script = (
+            "from fema_usar_mcp.monitoring.metrics import MonitoringManager\n"
+            "manager = MonitoringManager()\n"
+            "manager.metrics.record_api_request('GET', '/status', 200, 0.01)\n"
+            "manager.metrics.active_sessions.set(2)\n"
+        )
+        env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+        for _ in range(2):
+            subprocess.run([sys.executable, "-c", script], env=env, check=True)
+
+        scrape = (
+            "from fema_usar_mcp.monitoring.metrics import MonitoringManager\n"
+            "import sys\n"
+            "sys.stdout.buffer.write(MonitoringManager().get_metrics())\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", scrape],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+        assert (
+            'usar_api_requests_total{endpoint="/status",method="GET",status="200"} 2.0'
+            in output
+        )
+        assert "usar_active_sessions 4.0" in output
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_memory_alerts_share_frozen_labels(self):
+        """Test that rule alerts reuse one read-only label mapping."""
+        alert_manager = AlertManager()
+        create_system_alert_rules(alert_manager)
+        data = {"system_memory_usage": 90, "system_memory_total": 100}
+        await alert_manager.check_alert_rules(data)
+        first = alert_manager.active_alerts["elevated_memory_usage"]
+        assert first.message == "Memory usage is 90.0% (threshold: 85%)"
+
+        with pytest.raises(TypeError):
+            first.labels["metric"] = "cpu"
+        assert first.to_dict()["labels"] == {"component": "system", "metric": "memory"}
@@ -0,0 +1,572 @@
+"""Tests for the performance and caching layer."""
+
+import gzip
+import json
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from fema_usar_mcp import performance
+from fema_usar_mcp.performance import DataCompressor, DistributedCache
+
+
+class TestDistributedCache:
+    """Tests for the LRU/TTL cache."""
+
+    @pytest.mark.unit
+    def test_get_returns_set_value(self):
+        """Test basic set and get with hit/miss accounting."""
+        cache = DistributedCache(max_size=10)
+        cache.set("a", {"value": 1})
+
+        assert cache.get("a") == {"value": 1}
+        assert cache.get("missing") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used(self):
+        """Test that a read refreshes recency so the untouched key is evicted."""
+        cache = DistributedCache(max_size=3, num_shards=1)
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+
+        cache.get("a")
+        cache.set("d", "d")
+
+        assert cache.get("b") is None
+        assert [cache.get(key) for key in ("a", "c", "d")] == ["a", "c", "d"]
+        assert cache.evictions == 1
+
+    @pytest.mark.unit
+    def test_overwrite_at_capacity_does_not_evict(self):
+        """Test that re-setting an existing key keeps the other entries."""
+        cache = DistributedCache(max_size=2, num_shards=1)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 3)
+
+        assert cache.get("a") == 3
+        assert cache.get("b") == 2
+        assert cache.evictions == 0
+
+    @pytest.mark.unit
+    def test_overwrite_refreshes_recency(self):
+        """Test that re-setting a key moves it to the most recent position."""
+        cache = DistributedCache(max_size=2, num_shards=1)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 3)
+        cache.set("c", 4)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 3
+        assert cache.get("c") == 4
+
+    @pytest.mark.unit
+    def test_invalidate_by_pattern(self):
+        """Test substring invalidation and full clears."""
+        cache = DistributedCache(max_size=10)
+        cache.set("status:tf1", 1)
+        cache.set("status:tf2", 2)
+        cache.set("route:tf1", 3)
+
+        assert cache.invalidate("status") == 2
+        assert cache.get("route:tf1") == 3
+        assert cache.invalidate() == 1
+
+    @pytest.mark.unit
+    def test_shards_bound_total_size(self):
+        """Test that per-shard limits keep the whole cache within max_size."""
+        cache = DistributedCache(max_size=256, num_shards=4)
+        for i in range(500):
+            cache.set(f"key{i}", i)
+
+        stats = cache.get_stats()
+        assert stats["cache_size"] <= 256
+        assert stats["evictions"] == 500 - stats["cache_size"]
+
+    @pytest.mark.unit
+    def test_small_caches_use_fewer_shards(self):
+        """Test that a small cache is not split into tiny shards."""
+        assert len(DistributedCache(max_size=10)._shards) == 1
+        assert len(DistributedCache(max_size=256)._shards) == 4
+        assert len(DistributedCache(max_size=10000)._shards) == 16
+
+    @pytest.mark.unit
+    def test_num_shards_must_be_power_of_two(self):
+        """Test that a shard count that cannot be masked is rejected."""
+        with pytest.raises(ValueError):
+            DistributedCache(num_shards=12)
+
+    @pytest.mark.unit
+    def test_keys_are_prefixed_with_function_name(self):
+        """Test that generated keys let results be invalidated per function."""
+        cache = DistributedCache(max_size=10)
+        key = cache._generate_key("route_status", ("tf1",), {"verbose": True})
+
+        assert key.startswith("route_status:")
+        assert key == cache._generate_key("route_status", ("tf1",), {"verbose": True})
+        assert key != cache._generate_key("route_status", ("tf1",), {})
+        assert key != cache._generate_key("route_status", ("tf2",), {"verbose": True})
+
+        cache.set(key, "ok")
+        assert cache.invalidate("route_status") == 1
+
+    @pytest.mark.unit
+    def test_keys_ignore_kwargs_order_and_accept_any_arguments(self):
+        """Test key stability for JSON, picklable and unpicklable arguments."""
+        cache = DistributedCache(max_size=10)
+        key = cache._generate_key
+
+        assert key("f", (), {"a": 1, "b": {"y": 2, "x": 1}}) == key(
+            "f", (), {"b": {"x": 1, "y": 2}, "a": 1}
+        )
+        assert key("f", ({1: "one"},), {}) == key("f", ({1: "one"},), {})
+        assert key("f", ({1: "one"},), {}) != key("f", ({2: "one"},), {})
+        assert key("f", (lambda: None,), {}).startswith("f:")
+
+    @pytest.mark.unit
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        """Test that expiry follows the monotonic clock."""
+        clock = [1000.0]
+        monkeypatch.setattr(performance.time, "monotonic", lambda: clock[0])
+        cache = DistributedCache(max_size=10)
+        cache.set("a", 1, ttl=30)
+
+        clock[0] += 29
+        assert cache.get("a") == 1
+        clock[0] += 2
+        assert cache.get("a") is None
+
+    @pytest.mark.unit
+    def test_cache_entries_have_no_instance_dict(self):
+        """Test that entries are slotted to keep per-entry memory small."""
+        entry = performance.CacheEntry(data=1, expires_at=0.0)
+        assert not hasattr(entry, "__dict__")
+
+
+class TestSingleFlight:
+    """Tests for coalescing concurrent cache misses."""
+
+    @pytest.mark.unit
+    def test_concurrent_misses_execute_once(self):
+        """Test that threads missing the same key share one execution."""
+        cache = DistributedCache(max_size=10)
+        calls = []
+        release = threading.Event()
+
+        @performance.cached(ttl=60, cache_instance=cache)
+        def slow_analysis(task_force):
+            calls.append(task_force)
+            release.wait(5)
+            return {"task_force": task_force}
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(slow_analysis, "CA-TF1") for _ in range(8)]
+            time.sleep(0.05)
+            release.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        assert calls == ["CA-TF1"]
+        assert all(result == {"task_force": "CA-TF1"} for result in results)
+
+    @pytest.mark.unit
+    def test_failure_reaches_waiters_and_is_not_cached(self):
+        """Test that a failed computation propagates and can be retried."""
+        cache = DistributedCache(max_size=10)
+
+        def fail():
+            raise RuntimeError("upstream down")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_compute("key", fail)
+        assert cache.get_or_compute("key", lambda: "ok") == ("ok", False)
+        assert cache.get_or_compute("key", lambda: "other") == ("ok", True)
+
+
+class TestExpiryHeap:
+    """Tests for deadline-ordered expiry."""
+
+    @pytest.mark.unit
+    def test_due_entries_are_removed(self, monkeypatch):
+        """Test that expiry drops due entries and skips re-set keys."""
+        clock = [1000.0]
+        monkeypatch.setattr(performance.time, "monotonic", lambda: clock[0])
+        cache = DistributedCache(max_size=10, num_shards=1)
+        cache.set("short", 1, ttl=10)
+        cache.set("long", 2, ttl=100)
+        cache.set("renewed", 3, ttl=10)
+        clock[0] += 5
+        cache.set("renewed", 4, ttl=10)
+
+        clock[0] += 6
+        shard = cache._shards[0]
+        cache._expire_due(shard, clock[0])
+
+        assert list(shard.data) == ["long", "renewed"]
+        assert cache.evictions == 1
+
+    @pytest.mark.unit
+    def test_stale_heap_entries_are_compacted(self):
+        """Test that repeated overwrites do not grow the heap without bound."""
+        cache = DistributedCache(max_size=10, num_shards=1)
+        for _ in range(500):
+            cache.set("key", "value")
+
+        shard = cache._shards[0]
+        cache._expire_due(shard, time.monotonic())
+        assert len(shard.expiry_heap) == 1
+
+
+class TestCacheStats:
+    """Tests for cache statistics."""
+
+    @pytest.mark.unit
+    def test_memory_usage_tracks_entries(self):
+        """Test that the byte estimate follows sets, overwrites and removals."""
+        cache = DistributedCache(max_size=10)
+        payload = "x" * (1024 * 1024)
+        cache.set("a", payload)
+        cache.set("b", payload)
+        cache.set("b", "small")
+        assert cache.get_stats()["memory_usage_mb"] == pytest.approx(1.0, abs=0.01)
+
+        cache.invalidate("a")
+        assert cache.get_stats()["memory_usage_mb"] < 0.01
+        cache.invalidate()
+        assert cache.get_stats()["memory_usage_mb"] == 0
+
+
+class TestOptimizeToolResponse:
+    """Tests for the combined caching and monitoring tool decorator."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("name", "ttl"),
+        [
+            ("get_deployment_status", 60),
+            ("structural_analysis", 900),
+            ("radio_configuration", 1800),
+            ("route_planner", 300),
+        ],
+    )
+    def test_ttl_follows_tool_name(self, name, ttl):
+        """Test that the TTL is chosen from the tool name."""
+        assert performance._tool_ttl(name) == ttl
+
+    @pytest.mark.unit
+    def test_second_call_is_a_cache_hit(self):
+        """Test that repeated calls are served from the cache and counted."""
+        calls = []
+
+        def hazard_analysis_for_test(zone):
+            calls.append(zone)
+            return f"zone {zone}"
+
+        tool = performance.optimize_tool_response(hazard_analysis_for_test)
+        assert tool("A") == tool("A") == "zone A"
+
+        counters = performance._perf_monitor.counters
+        assert calls == ["A"]
+        assert counters["hazard_analysis_for_test.cache_miss"] == 1
+        assert counters["hazard_analysis_for_test.cache_hit"] == 1
+        performance.clear_cache("hazard_analysis_for_test")
+
+
+class TestLocking:
+    """Tests for the non-reentrant locks used across the module."""
+
+    @pytest.mark.unit
+    def test_all_stats_does_not_reacquire_the_lock(self):
+        """Test that summarizing every metric completes with metrics recorded."""
+        monitor = performance.PerformanceMonitor()
+        monitor.record_metric("tool.response_time", 0.5)
+        monitor.record_metric("tool.response_time", 1.5)
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            stats = pool.submit(monitor.get_all_stats).result(timeout=5)
+        assert stats["metrics"]["tool.response_time"]["avg"] == 1.0
+
+    @pytest.mark.unit
+    def test_submitting_a_finished_task_does_not_deadlock(self):
+        """Test that cleanup of an already finished task cannot self-deadlock."""
+        manager = performance.AsyncTaskManager(max_workers=1)
+        manager.executor.submit = lambda func, *args, **kwargs: _done_future(func())
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(manager.submit_task, "t1", lambda: 42)
+            assert future.result(timeout=5).result() == 42
+        assert manager.get_active_tasks() == []
+        manager.shutdown()
+
+    @pytest.mark.unit
+    def test_finished_tasks_drop_out_when_unreferenced(self):
+        """Test that finished tasks leave active_tasks without a callback."""
+        manager = performance.AsyncTaskManager(max_workers=2)
+        release = threading.Event()
+        running = manager.submit_task("running", release.wait, 5)
+        finished = manager.submit_task("finished", lambda: "done")
+        finished.result(timeout=5)
+        manager.submit_task("forgotten", lambda: "done").result(timeout=5)
+
+        assert manager.get_active_tasks() == ["running"]
+        release.set()
+        running.result(timeout=5)
+        assert manager.get_task_result("finished", timeout=5) == "done"
+        assert manager.get_task_status("finished") == "completed"
+        assert manager.get_task_status("forgotten") is None
+        assert finished.done()
+        manager.shutdown()
+
+
+def _done_future(value):
+    """Build an already completed future."""
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+class TestPerformanceMonitor:
+    """Tests for windowed metric statistics."""
+
+    @pytest.mark.unit
+    def test_stats_cover_only_the_window(self):
+        """Test that summaries match a brute-force pass over the window."""
+        monitor = performance.PerformanceMonitor(window=50)
+        rng = random.Random(7)
+        values = [rng.uniform(0, 10) for _ in range(437)]
+        for value in values:
+            monitor.record_metric("latency", value)
+
+        window = values[-50:]
+        stats = monitor.get_metric_stats("latency")
+        assert stats["count"] == 50
+        assert stats["avg"] == pytest.approx(sum(window) / 50)
+        assert stats["min"] == min(window)
+        assert stats["max"] == max(window)
+        assert stats["latest"] == window[-1]
+
+    @pytest.mark.unit
+    def test_unknown_metric_has_no_stats(self):
+        """Test that a metric never recorded reports None."""
+        assert performance.PerformanceMonitor().get_metric_stats("missing") is None
+
+    @pytest.mark.unit
+    def test_decorator_records_seconds_from_perf_counter(self, monkeypatch):
+        """Test that execution time is measured in seconds on perf_counter_ns."""
+        ticks = iter([1_000_000_000, 1_250_000_000])
+        monkeypatch.setattr(performance.time, "perf_counter_ns", lambda: next(ticks))
+
+        @performance.performance_monitor("timed_tool_for_test")
+        def tool():
+            return "done"
+
+        assert tool() == "done"
+        stats = performance._perf_monitor.get_metric_stats(
+            "timed_tool_for_test.execution_time"
+        )
+        assert stats["latest"] == pytest.approx(0.25)
+
+
+class TestDataCompressor:
+    """Test JSON compression round trips."""
+
+    PAYLOAD = {"task_force": "CA-TF1", "personnel": list(range(50)), "ok": True}
+
+    @pytest.mark.unit
+    def test_round_trip_returns_bytes(self):
+        """Test that compressed output is raw bytes and decodes back."""
+        compressed = DataCompressor.compress_json(self.PAYLOAD)
+        assert isinstance(compressed, bytes)
+        assert DataCompressor.decompress_json(compressed) == self.PAYLOAD
+
+    @pytest.mark.unit
+    def test_base64_round_trip(self):
+        """Test the text wrapper for text-only transports."""
+        text = DataCompressor.compress_json_b64(self.PAYLOAD)
+        assert isinstance(text, str)
+        assert DataCompressor.decompress_json_b64(text) == self.PAYLOAD
+
+    @pytest.mark.unit
+    def test_gzip_fallback_without_zstandard(self, monkeypatch):
+        """Test that gzip is written when zstandard is unavailable."""
+        monkeypatch.setattr(performance, "zstandard", None)
+        compressed = DataCompressor.compress_json(self.PAYLOAD)
+        assert compressed[:2] == b"\x1f\x8b"
+        assert DataCompressor.decompress_json(compressed) == self.PAYLOAD
+
+    @pytest.mark.unit
+    def test_reads_existing_gzip_payloads(self):
+        """Test that gzip data is still readable when zstd is the default."""
+        compressed = gzip.compress(b'{"status":"operational"}')
+        assert DataCompressor.decompress_json(compressed) == {"status": "operational"}
+
+
+class TestPerformanceOptimizedTool:
+    """Test the combined tool decorator."""
+
+    @pytest.mark.unit
+    def test_sync_mode_caches_and_monitors_in_one_wrapper(self):
+        """Test that caching and monitoring share a single wrapper layer."""
+        calls = []
+
+        @performance.performance_optimized_tool()
+        def structure_triage_for_test(building_id):
+            calls.append(building_id)
+            return {"building": building_id}
+
+        assert structure_triage_for_test.__wrapped__.__name__ == (
+            "structure_triage_for_test"
+        )
+        assert not hasattr(structure_triage_for_test.__wrapped__, "__wrapped__")
+
+        try:
+            assert structure_triage_for_test("B-7") == {"building": "B-7"}
+            assert structure_triage_for_test("B-7") == {"building": "B-7"}
+            assert calls == ["B-7"]
+
+            metric = f"{__name__}.structure_triage_for_test"
+            counters = performance._perf_monitor.counters
+            assert counters[f"{metric}.calls"] >= 2
+            assert counters[f"{metric}.success"] >= 2
+        finally:
+            performance.clear_cache("structure_triage_for_test")
+
+    @pytest.mark.unit
+    def test_async_envelope(self, monkeypatch):
+        """Test that async mode returns a JSON envelope naming the task."""
+        submitted = []
+        monkeypatch.setattr(
+            performance._task_manager,
+            "submit_task",
+            lambda task_id, func, *args, **kwargs: submitted.append(task_id),
+        )
+
+        @performance.performance_optimized_tool(enable_async=True)
+        def assess_structure(building_id):
+            return building_id
+
+        envelope = json.loads(assess_structure("B-1"))
+        assert envelope == {
+            "tool": "assess_structure",
+            "status": "async_submitted",
+            "task_id": submitted[0],
+            "message": "Task submitted for asynchronous processing",
+        }
+        assert submitted[0].startswith("assess_structure_")
+
+
+class TestBatchProcessor:
+    """Test the batch processor's flush thread."""
+
+    @pytest.mark.unit
+    def test_periodic_flush_reuses_one_thread(self):
+        """Test that interval flushes run on the same worker thread."""
+        flushed = []
+        flush_threads = set()
+
+        def processor(items):
+            flush_threads.add(threading.get_ident())
+            flushed.extend(items)
+
+        batcher = performance.BatchProcessor(batch_size=100, flush_interval=0.01)
+        batcher.register_processor("updates", processor)
+        try:
+            for round_number in range(3):
+                batcher.add_to_batch("updates", round_number)
+                deadline = time.monotonic() + 2
+                while len(flushed) <= round_number and time.monotonic() < deadline:
+                    time.sleep(0.005)
+        finally:
+            batcher.shutdown()
+
+        assert flushed == [0, 1, 2]
+        assert flush_threads == {batcher._worker.ident}
+
+    @pytest.mark.unit
+    def test_shutdown_flushes_and_stops_worker(self):
+        """Test that shutdown wakes the worker and flushes pending items."""
+        flushed = []
+        batcher = performance.BatchProcessor(batch_size=100, flush_interval=60)
+        batcher.register_processor("updates", flushed.extend)
+        batcher.add_to_batch("updates", "pending")
+
+        batcher.shutdown()
+
+        assert not batcher._worker.is_alive()
+        assert flushed == ["pending"]
+
+
+class TestConnectionPool:
+    """Test connection reuse and limits."""
+
+    @pytest.mark.unit
+    def test_reuses_most_recently_returned(self):
+        """Test that returned connections are handed out LIFO."""
+        pool = performance.ConnectionPool(max_connections=3)
+        first = pool.get_connection()
+        second = pool.get_connection()
+        pool.return_connection(first)
+        pool.return_connection(second)
+
+        assert pool.get_connection() is second
+        assert pool.get_connection() is first
+
+    @pytest.mark.unit
+    def test_exhausted_after_max_created(self):
+        """Test that no more than max_connections are created."""
+        pool = performance.ConnectionPool(max_connections=2)
+        conns = [pool.get_connection(), pool.get_connection()]
+        assert [conn["id"] for conn in conns] == [0, 1]
+
+        with pytest.raises(Exception, match="exhausted"):
+            pool.get_connection()
+
+        pool.return_connection(conns[0])
+        assert pool.get_connection() is conns[0]
+
+    @pytest.mark.unit
+    def test_close_all_resets_pool(self):
+        """Test that close_all drops idle connections and the created count."""
+        pool = performance.ConnectionPool(max_connections=1)
+        conn = pool.get_connection()
+        pool.return_connection(conn)
+        pool.close_all()
+
+        fresh = pool.get_connection()
+        assert fresh is not conn
+        # A stale connection returned into a full pool is dropped
+        pool.return_connection(fresh)
+        pool.return_connection(conn)
+        assert pool.get_connection() is fresh
+
+
+class TestStatsSnapshot:
+    """Test debounced statistics snapshots."""
+
+    @pytest.mark.unit
+    def test_reuses_snapshot_within_ttl(self, monkeypatch):
+        """Test that stats are rebuilt only once the TTL has passed."""
+        clock = [100.0]
+        monkeypatch.setattr(performance.time, "monotonic", lambda: clock[0])
+        builds = []
+        snapshot = performance._StatsSnapshot(
+            lambda: builds.append(clock[0]) or {"build": len(builds)}, ttl=1.0
+        )
+
+        assert snapshot.get() == {"build": 1}
+        clock[0] += 0.5
+        assert snapshot.get() == {"build": 1}
+        clock[0] += 0.5
+        assert snapshot.get() == {"build": 2}
+        assert builds == [100.0, 101.0]
+
+    @pytest.mark.unit
+    def test_performance_stats_include_cache_and_tasks(self):
+        """Test the shape of the global performance statistics."""
+        stats = performance.get_performance_stats()
+        assert {"metrics", "counters", "cache", "active_tasks"} <= stats.keys()
+        assert stats["cache"]["max_size"] == performance._cache.max_size
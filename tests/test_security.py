@@ -0,0 +1,606 @@
+"""Tests for the authentication and authorization module."""
+
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+
+import bcrypt
+import jwt
+import pytest
+
+from fema_usar_mcp.security.auth import (
+    AuthenticationMethod,
+    AuthToken,
+    JWTManager,
+    PasswordManager,
+    RoleBasedAccessControl,
+    SecurityAuditLogger,
+    SecurityClearance,
+    SecurityConfig,
+    USARAuthenticationManager,
+    USARRole,
+    USARUser,
+    get_security_config,
+)
+
+PASSWORD = "Rescue-Team-42!"
+
+
+@pytest.fixture
+def password_mgr():
+    """Password manager with the minimum bcrypt cost to keep tests fast."""
+    return PasswordManager(rounds=4)
+
+
+@pytest.fixture
+def auth_manager(monkeypatch):
+    """Authentication manager with one registered user."""
+    monkeypatch.setenv("BCRYPT_ROUNDS", "4")
+    manager = USARAuthenticationManager()
+    manager.register_user(
+        username="jsmith",
+        email="jsmith@fema.gov",
+        password=PASSWORD,
+        full_name="Jordan Smith",
+        usar_role=USARRole.SEARCH_TEAM_MANAGER,
+        security_clearance=SecurityClearance.OFFICIAL_USE,
+        task_force_id="CA-TF1",
+    )
+    yield manager
+    manager._hash_pool.shutdown()
+
+
+class TestPasswordManager:
+    """Test password hashing and verification."""
+
+    @pytest.mark.unit
+    def test_hash_and_verify(self, password_mgr):
+        """Test that a hashed password verifies and a wrong one does not."""
+        hashed = password_mgr.hash_password(PASSWORD)
+
+        assert hashed.startswith("$2b$04$")
+        assert password_mgr.verify_password(PASSWORD, hashed)
+        assert not password_mgr.verify_password("Rescue-Team-43!", hashed)
+
+    @pytest.mark.unit
+    def test_rounds_from_environment(self, monkeypatch):
+        """Test that the cost factor can be tuned with BCRYPT_ROUNDS."""
+        monkeypatch.setenv("BCRYPT_ROUNDS", "5")
+        assert PasswordManager().rounds == 5
+
+        monkeypatch.delenv("BCRYPT_ROUNDS")
+        assert PasswordManager().rounds == 12
+
+    @pytest.mark.unit
+    def test_verifies_existing_bcrypt_hashes(self, password_mgr):
+        """Test that hashes written by another bcrypt implementation verify."""
+        legacy = bcrypt.hashpw(b"Legacy-Pass-2023!", bcrypt.gensalt(4, b"2a"))
+        assert password_mgr.verify_password("Legacy-Pass-2023!", legacy.decode())
+
+    @pytest.mark.unit
+    def test_long_passwords_use_first_72_bytes(self, password_mgr):
+        """Test that passwords past bcrypt's limit hash instead of raising."""
+        password = "Structural-Collapse-" * 5
+        hashed = password_mgr.hash_password(password)
+
+        assert password_mgr.verify_password(password, hashed)
+        assert password_mgr.verify_password(password[:72], hashed)
+
+    @pytest.mark.unit
+    def test_strong_password_passes(self, password_mgr):
+        """Test that a password meeting every rule scores full marks."""
+        result = password_mgr.validate_password_strength("Collapse-Shoring-9")
+        assert result == {"valid": True, "score": 5, "issues": []}
+
+    @pytest.mark.unit
+    def test_weak_password_reports_each_issue(self, password_mgr):
+        """Test that each missing character class is reported."""
+        result = password_mgr.validate_password_strength("rescue")
+
+        assert not result["valid"]
+        assert result["score"] == 1
+        assert result["issues"] == [
+            "Password must be at least 12 characters long",
+            "Password must contain uppercase letters",
+            "Password must contain numbers",
+            "Password must contain special characters",
+        ]
+
+    @pytest.mark.unit
+    def test_common_patterns_rejected(self, password_mgr):
+        """Test that common patterns are caught regardless of case."""
+        result = password_mgr.validate_password_strength("MyFEMA-Account-2024")
+
+        assert not result["valid"]
+        assert result["issues"] == ["Password contains common patterns"]
+        assert result["score"] == 3
+
+
+class TestAuthentication:
+    """Test credential checks and lockout."""
+
+    @pytest.mark.unit
+    def test_authenticate_checks_stored_hash(self, auth_manager):
+        """Test that only the registered password authenticates."""
+        lockout = auth_manager._lockout
+        assert auth_manager.authenticate_user("jsmith", "Wrong-Pass-42!") is None
+        assert lockout.failed[lockout.index["jsmith"]] == 1
+
+        user = auth_manager.authenticate_user("jsmith", PASSWORD)
+        assert user is not None
+        assert lockout.failed[lockout.index["jsmith"]] == 0
+        assert user.failed_attempts == 0
+        assert user.last_login is not None
+
+    @pytest.mark.unit
+    def test_lockout_expires(self, auth_manager):
+        """Test that a locked account can log in once the lockout has passed."""
+        for _ in range(auth_manager.config.MAX_LOGIN_ATTEMPTS):
+            auth_manager.authenticate_user("jsmith", "Wrong-Pass-42!")
+        assert auth_manager.authenticate_user("jsmith", PASSWORD) is None
+
+        lockout = auth_manager._lockout
+        lockout.locked_until[lockout.index["jsmith"]] -= 3600
+        user = auth_manager.authenticate_user("jsmith", PASSWORD)
+
+        assert user is not None
+        assert user.failed_attempts == 0
+        assert user.locked_until is None
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_list_locked_and_failing_users(self, auth_manager, monkeypatch, use_numpy):
+        """Test the lockout sweeps with and without NumPy."""
+        if not use_numpy:
+            monkeypatch.setattr("fema_usar_mcp.security.auth.np", None)
+        auth_manager.register_user(
+            username="mlopez",
+            email="mlopez@fema.gov",
+            password=PASSWORD,
+            full_name="Morgan Lopez",
+            usar_role=USARRole.TEAM_MEMBER,
+            security_clearance=SecurityClearance.OFFICIAL_USE,
+        )
+        assert auth_manager.list_locked_users() == []
+
+        auth_manager.authenticate_user("mlopez", "Wrong-Pass-42!")
+        for _ in range(auth_manager.config.MAX_LOGIN_ATTEMPTS):
+            auth_manager.authenticate_user("jsmith", "Wrong-Pass-42!")
+
+        assert auth_manager.list_locked_users() == ["jsmith"]
+        assert auth_manager.list_locked_users(time.time() + 86400) == []
+        assert auth_manager.list_users_with_failures() == ["jsmith", "mlopez"]
+        assert auth_manager.list_users_with_failures(2) == ["jsmith"]
+
+    @pytest.mark.unit
+    def test_unknown_user_costs_one_bcrypt_check(self, auth_manager, monkeypatch):
+        """Test that unknown usernames are checked against the dummy hash."""
+        checked = []
+        verify = auth_manager.password_mgr.verify_password
+        monkeypatch.setattr(
+            auth_manager.password_mgr,
+            "verify_password",
+            lambda password, hashed: checked.append(hashed) or verify(password, hashed),
+        )
+
+        assert auth_manager.authenticate_user("nobody", PASSWORD) is None
+        assert checked == [auth_manager._dummy_hash]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_inactive_user_rejected_async(self, auth_manager):
+        """Test that deactivated accounts fail even with the right password."""
+        auth_manager._user_store["jsmith"].active = False
+        assert await auth_manager.authenticate_user_async("jsmith", PASSWORD) is None
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_async_logins_verify_concurrently(self, auth_manager):
+        """Test that async logins run on the hashing pool and succeed."""
+        users = await asyncio.gather(
+            *(
+                auth_manager.authenticate_user_async("jsmith", PASSWORD)
+                for _ in range(4)
+            )
+        )
+        assert all(user is not None and user.username == "jsmith" for user in users)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_async_failures_lock_account(self, auth_manager):
+        """Test that failed async logins count toward the lockout."""
+        for _ in range(auth_manager.config.MAX_LOGIN_ATTEMPTS):
+            assert (
+                await auth_manager.authenticate_user_async("jsmith", "Wrong-Pass-42!")
+                is None
+            )
+
+        user = auth_manager._user_store["jsmith"]
+        assert user.failed_attempts == auth_manager.config.MAX_LOGIN_ATTEMPTS
+        assert user.locked_until is not None
+        assert await auth_manager.authenticate_user_async("jsmith", PASSWORD) is None
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_correct_password_does_not_clear_lockout(
+        self, auth_manager, monkeypatch
+    ):
+        """Test that a login racing a burst of failures cannot unlock the user."""
+        verify = auth_manager.password_mgr.verify_password
+
+        def slow_verify(password, hashed):
+            # The correct password finishes after the failures have locked
+            if password == PASSWORD:
+                time.sleep(0.2)
+            return verify(password, hashed)
+
+        monkeypatch.setattr(auth_manager.password_mgr, "verify_password", slow_verify)
+        # Enough workers that every attempt verifies at once, even on one CPU
+        monkeypatch.setattr(auth_manager, "_hash_pool", ThreadPoolExecutor(32))
+        attempts = [
+            auth_manager.authenticate_user_async("jsmith", "Wrong-Pass-42!")
+            for _ in range(auth_manager.config.MAX_LOGIN_ATTEMPTS * 4)
+        ]
+
+        results = await asyncio.gather(
+            auth_manager.authenticate_user_async("jsmith", PASSWORD), *attempts
+        )
+
+        assert results == [None] * len(results)
+        assert auth_manager.list_locked_users() == ["jsmith"]
+        assert auth_manager._user_store["jsmith"].locked_until is not None
+
+
+class TestSessions:
+    """Test session and token creation."""
+
+    @pytest.mark.unit
+    def test_access_token_carries_role_permissions(self, auth_manager):
+        """Test that the session's access token embeds the role permissions."""
+        user = auth_manager.authenticate_user("jsmith", PASSWORD)
+        session = auth_manager.create_session(user)
+
+        payload = auth_manager.jwt_mgr.verify_token(session["access_token"])
+        assert payload["sub"] == user.user_id
+        assert payload["type"] == "access"
+        assert payload["permissions"] == list(
+            auth_manager.rbac.get_user_permissions(USARRole.SEARCH_TEAM_MANAGER)
+        )
+
+    @pytest.mark.unit
+    def test_session_uses_one_issue_time(self, auth_manager):
+        """Test that both tokens and the session record share one timestamp."""
+        user = auth_manager.authenticate_user("jsmith", PASSWORD)
+        session = auth_manager.create_session(user)
+
+        access = auth_manager.jwt_mgr.verify_token(session["access_token"])
+        refresh = auth_manager.jwt_mgr.verify_token(session["refresh_token"])
+        record = auth_manager._sessions[session["session_id"]]
+
+        assert access["iat"] == refresh["iat"]
+        assert record.created_at == record.last_activity
+        assert int(record.created_at) == access["iat"]
+        assert record.permissions == auth_manager.rbac.get_user_permissions(
+            USARRole.SEARCH_TEAM_MANAGER
+        )
+        assert not hasattr(record, "__dict__")
+
+
+@pytest.fixture
+def jwt_mgr(monkeypatch):
+    """JWT manager with a fixed secret."""
+    monkeypatch.setenv("JWT_SECRET", "test-secret-for-jwt-signing-0123456789")
+    return JWTManager(SecurityConfig())
+
+
+@pytest.fixture
+def field_user():
+    """A registered-looking user for token tests."""
+    return USARUser(
+        user_id="usr_test",
+        username="jsmith",
+        email="jsmith@fema.gov",
+        full_name="Jordan Smith",
+        usar_role=USARRole.RESCUE_TEAM_MANAGER,
+        security_clearance=SecurityClearance.OFFICIAL_USE,
+        task_force_id="CA-TF1",
+        agency="FEMA",
+    )
+
+
+class TestUSARUser:
+    """Test user model validation."""
+
+    @pytest.mark.unit
+    def test_email_lowercased(self, field_user):
+        """Test that valid emails are normalized to lowercase."""
+        user = USARUser(**{**field_user.model_dump(), "email": "J.Smith@FEMA.gov"})
+        assert user.email == "j.smith@fema.gov"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("email", ["jsmith", "@fema.gov", "jsmith@"])
+    def test_invalid_emails_rejected(self, field_user, email):
+        """Test that addresses without both parts around "@" are rejected."""
+        with pytest.raises(ValueError, match="Invalid email address"):
+            USARUser(**{**field_user.model_dump(), "email": email})
+
+    @pytest.mark.unit
+    def test_certifications_are_tuples(self, field_user):
+        """Test that certifications default to the empty tuple and coerce lists."""
+        assert field_user.certifications == ()
+
+        certs = ["Rescue Specialist", "Structures Specialist"]
+        user = USARUser(**{**field_user.model_dump(), "certifications": certs})
+        assert user.certifications == tuple(certs)
+
+
+class TestAuthToken:
+    """Test the token record."""
+
+    @pytest.mark.unit
+    def test_defaults_and_slots(self):
+        """Test default fields and that the record has a fixed layout."""
+        expires = datetime.now(UTC) + timedelta(hours=1)
+        token = AuthToken("tok_1", "usr_test", "access", expires)
+
+        assert token.permissions == []
+        assert token.issued_at <= datetime.now(UTC)
+        assert token.revoked is False
+        assert not hasattr(token, "__dict__")
+
+        token.revoked = True
+        assert token.revoked
+
+
+class TestJWTManager:
+    """Test token signing and verification."""
+
+    @pytest.mark.unit
+    def test_hs256_tokens_match_pyjwt(self, jwt_mgr, field_user):
+        """Test that direct HS256 signing produces PyJWT's exact token."""
+        now = datetime.now(UTC)
+        token = jwt_mgr.create_access_token(field_user, ("rescue:*",), now)
+
+        payload = jwt_mgr.verify_token(token)
+        assert payload["permissions"] == ["rescue:*"]
+        assert payload["iat"] == int(now.timestamp())
+        assert token == jwt.encode(
+            payload, jwt_mgr.config.JWT_SECRET_KEY, algorithm="HS256"
+        )
+
+    @pytest.mark.unit
+    def test_access_token_without_permissions(self, jwt_mgr, field_user):
+        """Test that a token issued without permissions carries an empty list."""
+        token = jwt_mgr.create_access_token(field_user)
+        assert jwt_mgr.verify_token(token)["permissions"] == []
+
+    @pytest.mark.unit
+    def test_successive_tokens_sign_independently(self, jwt_mgr, field_user):
+        """Test that the shared HMAC state is not advanced by signing."""
+        now = datetime.now(UTC)
+        first = jwt_mgr.create_refresh_token(field_user, now)
+        second = jwt_mgr.create_access_token(field_user, now=now)
+        third = jwt_mgr.create_refresh_token(field_user, now)
+
+        for token in (first, second, third):
+            jwt_mgr.verify_token(token)
+        assert first == third
+
+    @pytest.mark.unit
+    def test_expired_token_rejected(self, jwt_mgr, field_user):
+        """Test that tokens past exp fail verification."""
+        issued = datetime.now(UTC) - timedelta(days=30)
+        token = jwt_mgr.create_refresh_token(field_user, issued)
+
+        with pytest.raises(jwt.InvalidTokenError, match="expired"):
+            jwt_mgr.verify_token(token)
+
+    @pytest.mark.unit
+    def test_fast_verify_matches_full_verify(self, jwt_mgr, field_user):
+        """Test that the fast path returns the same claims as verify_token."""
+        token = jwt_mgr.create_access_token(field_user, ("rescue:*",))
+        assert jwt_mgr.verify_token_fast(token) == jwt_mgr.verify_token(token)
+
+    @pytest.mark.unit
+    def test_fast_verify_rejects_bad_tokens(self, jwt_mgr, field_user):
+        """Test tampered, expired, foreign and malformed tokens."""
+        token = jwt_mgr.create_access_token(field_user)
+        header, payload, signature = token.split(".")
+        forged_claims = jwt.encode(
+            {"sub": "usr_admin"}, "k" * 32, algorithm="HS256"
+        ).split(".")[1]
+        expired = jwt_mgr.create_refresh_token(
+            field_user, datetime.now(UTC) - timedelta(days=30)
+        )
+        other_secret = jwt.encode({"sub": "usr_test"}, "x" * 32, algorithm="HS256")
+        other_alg = jwt.encode(
+            {"sub": "usr_test"}, jwt_mgr.config.JWT_SECRET_KEY * 2, algorithm="HS512"
+        )
+
+        for bad in (
+            f"{header}.{forged_claims}.{signature}",
+            f"{header}.{payload}.{'B' if signature[0] == 'A' else 'A'}{signature[1:]}",
+            expired,
+            other_secret,
+            other_alg,
+            "not-a-token",
+            "\u00e9.\u00e9.\u00e9",
+        ):
+            assert jwt_mgr.verify_token_fast(bad) is None
+
+    @pytest.mark.unit
+    def test_fast_verify_rejects_non_ascii_characters(self, jwt_mgr, field_user):
+        """Test that non-ASCII characters are not stripped before the MAC check."""
+        header, payload, signature = jwt_mgr.create_access_token(field_user).split(".")
+        tampered = f"{header}.{payload}\u00e9.{signature}"
+
+        with pytest.raises(jwt.InvalidTokenError):
+            jwt_mgr.verify_token(tampered)
+        assert jwt_mgr.verify_token_fast(tampered) is None
+
+    @pytest.mark.unit
+    def test_other_algorithms_use_pyjwt(self, monkeypatch, field_user):
+        """Test that non-HS256 configurations still sign correctly."""
+        monkeypatch.setenv("JWT_SECRET", "hs512-test-secret-" * 4)
+        config = SecurityConfig()
+        config.JWT_ALGORITHM = "HS512"
+        mgr = JWTManager(config)
+
+        token = mgr.create_refresh_token(field_user)
+        assert jwt.get_unverified_header(token)["alg"] == "HS512"
+        assert mgr.verify_token(token)["type"] == "refresh"
+
+    @pytest.mark.unit
+    def test_user_lookup_by_id(self, auth_manager):
+        """Test that a token's sub resolves to the registered user."""
+        user = auth_manager._user_store["jsmith"]
+        assert auth_manager.get_user_by_id(user.user_id) is user
+        assert auth_manager.get_user_by_id("usr_missing") is None
+
+    @pytest.mark.unit
+    def test_revoke_user_sessions(self, auth_manager):
+        """Test that revocation ends only the given user's sessions."""
+        user = auth_manager.authenticate_user("jsmith", PASSWORD)
+        first = auth_manager.create_session(user)["session_id"]
+        second = auth_manager.create_session(user)["session_id"]
+
+        assert auth_manager.end_session(first)
+        assert not auth_manager.end_session(first)
+        assert auth_manager.revoke_user_sessions(user.user_id) == 1
+        assert second not in auth_manager._sessions
+        assert auth_manager.revoke_user_sessions(user.user_id) == 0
+
+    @pytest.mark.unit
+    def test_expired_sessions_swept(self, auth_manager):
+        """Test that only sessions past their timeout are ended."""
+        user = auth_manager.authenticate_user("jsmith", PASSWORD)
+        old = auth_manager.create_session(user)["session_id"]
+        ended = auth_manager.create_session(user)["session_id"]
+        auth_manager.end_session(ended)
+        timeout = auth_manager.config.SESSION_TIMEOUT_MINUTES * 60
+        auth_manager._sessions[old].expire_ts -= timeout
+        auth_manager._session_heap[:] = [
+            (ts - timeout, sid) for ts, sid in auth_manager._session_heap
+        ]
+        fresh = auth_manager.create_session(user)["session_id"]
+
+        assert old not in auth_manager._sessions
+        assert fresh in auth_manager._sessions
+        assert auth_manager._session_heap == [
+            (auth_manager._sessions[fresh].expire_ts, fresh)
+        ]
+        assert auth_manager.expire_sessions() == 0
+
+    @pytest.mark.unit
+    def test_managers_share_config_and_keys(self, auth_manager, monkeypatch):
+        """Test that separately built managers accept each other's tokens."""
+        monkeypatch.setenv("BCRYPT_ROUNDS", "4")
+        other = USARAuthenticationManager()
+        try:
+            assert other.config is auth_manager.config is get_security_config()
+            assert other.jwt_mgr.encryption is auth_manager.jwt_mgr.encryption
+            assert other._dummy_hash == auth_manager._dummy_hash
+
+            user = auth_manager.authenticate_user("jsmith", PASSWORD)
+            session = auth_manager.create_session(user)
+            assert other.jwt_mgr.verify_token(session["access_token"])["sub"] == (
+                user.user_id
+            )
+        finally:
+            other._hash_pool.shutdown()
+
+
+class TestRoleBasedAccessControl:
+    """Test role permission checks."""
+
+    @pytest.mark.unit
+    def test_exact_and_wildcard_grants(self):
+        """Test exact matches, wildcard prefixes and denials."""
+        rbac = RoleBasedAccessControl()
+
+        assert rbac.check_permission(USARRole.SAFETY_OFFICER, "personnel:read")
+        assert rbac.check_permission(USARRole.SAFETY_OFFICER, "hazmat:monitor")
+        assert rbac.check_permission(USARRole.SAFETY_OFFICER, "safety:override")
+        assert not rbac.check_permission(USARRole.SAFETY_OFFICER, "personnel:manage")
+        assert not rbac.check_permission(USARRole.TEAM_MEMBER, "search:assign")
+
+    @pytest.mark.unit
+    def test_observer_read_wildcard(self):
+        """Test that a wildcard only matches its own prefix."""
+        rbac = RoleBasedAccessControl()
+
+        assert rbac.check_permission(USARRole.OBSERVER, "read:reports")
+        assert not rbac.check_permission(USARRole.OBSERVER, "reports:read")
+
+    @pytest.mark.unit
+    def test_role_without_permissions(self):
+        """Test that roles missing from the matrix are denied everything."""
+        rbac = RoleBasedAccessControl()
+
+        assert not rbac.check_permission(USARRole.FINANCE_CHIEF, "finance:read")
+        assert rbac.get_user_permissions(USARRole.FINANCE_CHIEF) == ()
+
+    @pytest.mark.unit
+    def test_repeated_checks_are_memoized(self):
+        """Test that repeat checks of one pair are answered from the memo."""
+        rbac = RoleBasedAccessControl()
+
+        for _ in range(3):
+            assert rbac.check_permission(USARRole.RESCUE_TEAM_MANAGER, "rescue:lift")
+            assert not rbac.check_permission(
+                USARRole.RESCUE_TEAM_MANAGER, "medical:treat"
+            )
+
+        info = rbac._decisions.cache_info()
+        assert (info.misses, info.hits) == (2, 4)
+
+    @pytest.mark.unit
+    def test_user_permissions_shared_tuple(self):
+        """Test that role permissions come back as one immutable tuple."""
+        rbac = RoleBasedAccessControl()
+        perms = rbac.get_user_permissions(USARRole.OBSERVER)
+
+        assert perms == ("read:*",)
+        assert rbac.get_user_permissions(USARRole.OBSERVER) is perms
+
+
+class TestSecurityAuditLogger:
+    """Test security audit events."""
+
+    @pytest.mark.unit
+    def test_login_attempt_logged_as_json(self, caplog):
+        """Test that audit events are logged as JSON with a UTC timestamp."""
+        audit = SecurityAuditLogger()
+
+        with caplog.at_level(logging.INFO, logger="security.audit"):
+            audit.log_login_attempt(
+                "jsmith",
+                False,
+                "10.0.0.5",
+                "field-tablet",
+                AuthenticationMethod.PIV_CARD,
+            )
+
+        record = caplog.records[-1]
+        assert record.levelno == logging.WARNING
+        label, _, payload = record.getMessage().partition(": ")
+        event = json.loads(payload)
+        assert label == "Login attempt"
+        assert event["auth_method"] == "piv_card"
+        assert event["success"] is False
+        assert event["timestamp"].endswith("Z")
+
+    @pytest.mark.unit
+    def test_disabled_level_skips_serialization(self, monkeypatch):
+        """Test that nothing is serialized when the audit level is off."""
+        audit = SecurityAuditLogger()
+        monkeypatch.setattr(audit.logger, "isEnabledFor", lambda level: False)
+        monkeypatch.setattr(
+            "fema_usar_mcp.security.auth.orjson.dumps",
+            lambda *args, **kwargs: pytest.fail("serialized a disabled event"),
+        )
+
+        audit.log_permission_denied("usr_1", "personnel", "manage", "10.0.0.5")